@@ -0,0 +1,80 @@
+"""
+Measure the import time of the package entry points, failing when it regresses.
+
+Each statement runs in a fresh interpreter with `-X importtime`, so only the modules it imports are counted, not
+the interpreter startup. Run from the repository root:
+
+    python -m benchmarks.bench_import --repeat 10
+    python -m benchmarks.bench_import --max-ms 'import secured=5' --max-ms 'from secured import Secure=15'
+
+The exit code is 1 when a statement imports a module it must not, or is slower than its `--max-ms` budget.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Statements timed by default, with the modules each one must not import.
+STATEMENTS: Dict[str, Tuple[str, ...]] = {
+    'import secured': ('yaml', 'logging', 'secured.secured'),
+    'from secured import Secure': ('yaml', 'logging', 'secured.secured'),
+    'from secured import Secured': ('yaml', 'asyncio', 'multiprocessing', 'ctypes'),
+    'from secured import Secured; Secured()': ('yaml', 'asyncio', 'multiprocessing', 'ctypes'),
+}
+
+
+def import_time(statement: str, forbidden: Tuple[str, ...]) -> Tuple[float, List[str]]:
+    """
+    Run a statement in a fresh interpreter and measure the time spent importing modules.
+
+    Args:
+        statement: Python code to run.
+        forbidden: Modules the statement must not import.
+
+    Returns:
+        The import time in seconds, and the forbidden modules that were imported.
+    """
+    probe = f"{statement}\nimport sys\nprint(' '.join(name for name in {forbidden!r} if name in sys.modules))"
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe], capture_output=True, text=True,
+                             check=True)
+    total = 0
+    for line in process.stderr.splitlines():
+        # Top-level imports have no indentation before the module name; their cumulative times add up to the total.
+        fields = line.split('|')
+        if line.startswith('import time:') and len(fields) == 3 and not fields[2].startswith('  '):
+            total += int(fields[1]) if fields[1].strip().isdigit() else 0
+    return total / 1e6, process.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per statement")
+    parser.add_argument('--max-ms', action='append', default=[], metavar='STATEMENT=MS',
+                        help="fail when the median import time of a statement exceeds MS milliseconds")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    budgets = {statement: float(ms) for statement, ms in (item.rsplit('=', 1) for item in args.max_ms)}
+    results = []
+    failed = False
+    for statement, forbidden in STATEMENTS.items():
+        runs = [import_time(statement, forbidden) for _ in range(args.repeat)]
+        median = statistics.median(seconds for seconds, _ in runs)
+        imported = sorted({name for _, names in runs for name in names})
+        budget = budgets.get(statement)
+        slow = budget is not None and median * 1000 > budget
+        failed = failed or slow or bool(imported)
+        results.append({'statement': statement, 'median': median, 'best': min(seconds for seconds, _ in runs),
+                        'forbidden_imported': imported, 'budget_ms': budget})
+        print(f"{statement:<42} median={median * 1000:8.2f} ms" + (f"  over budget of {budget} ms" if slow else '')
+              + (f"  imports {', '.join(imported)}" if imported else ''))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
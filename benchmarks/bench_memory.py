@@ -0,0 +1,50 @@
+"""
+Measure the memory used per secured leaf by the regular and compact Secure representations.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_memory --leaves 200000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+from secured.secure import Secure, compact_secure
+
+
+def bytes_per_leaf(factory: Callable[[Any, str], Secure], values: List[Any], message: str) -> float:
+    """
+    Return the average number of bytes allocated per secured value.
+
+    Args:
+        factory: Callable creating a secured value from an original value and a message.
+        values: Original values to secure.
+        message: Placeholder message.
+    """
+    gc.collect()
+    tracemalloc.start()
+    secured = [factory(value, message) for value in values]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del secured
+    return allocated / len(values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--leaves', type=int, default=200_000, help="number of secured leaves")
+    parser.add_argument('--length', type=int, default=24, help="length of each string value")
+    args = parser.parse_args()
+
+    message = "<Sensitive data secured>"
+    values = [f"{index:0{args.length}d}" for index in range(args.leaves)]
+    regular = bytes_per_leaf(Secure, values, message)
+    compact = bytes_per_leaf(compact_secure, values, message)
+    print(f"Secure:        {regular:8.1f} bytes/leaf")
+    print(f"CompactSecure: {compact:8.1f} bytes/leaf")
+    print(f"Saving:        {regular - compact:8.1f} bytes/leaf ({1 - compact / regular:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Synthetic configuration trees for the benchmarks."""
+import random
+import string
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml  # type: ignore
+
+
+def generate_config(width: int = 4, depth: int = 4, leaves: int = 1000, string_size: int = 24,
+                    seed: int = 0) -> Dict[str, Any]:
+    """
+    Build a nested configuration with a fixed shape.
+
+    Every mapping above `depth` has `width` child mappings, and `leaves` values are spread round-robin over
+    the mappings at the bottom level. Leaf values cycle through strings of `string_size` characters, integers,
+    floats and booleans, like a typical service config.
+
+    Args:
+        width: Number of child mappings per mapping.
+        depth: Number of mapping levels below the root.
+        leaves: Total number of leaf values.
+        string_size: Length of string leaf values.
+        seed: Seed of the random generator, so runs are comparable.
+
+    Returns:
+        The configuration.
+    """
+    rng = random.Random(seed)
+    root: Dict[str, Any] = {}
+    level = [root]
+    for depth_index in range(depth):
+        next_level = []
+        for node in level:
+            for child_index in range(width):
+                child: Dict[str, Any] = {}
+                node[f"section_{depth_index}_{child_index}"] = child
+                next_level.append(child)
+        level = next_level
+    for leaf_index in range(leaves):
+        kind = leaf_index % 4
+        if kind == 0:
+            value: Any = ''.join(rng.choices(string.ascii_letters + string.digits, k=string_size))
+        elif kind == 1:
+            value = rng.randint(0, 65535)
+        elif kind == 2:
+            value = round(rng.random() * 100, 3)
+        else:
+            value = rng.random() < 0.5
+        level[leaf_index % len(level)][f"key_{leaf_index}"] = value
+    return root
+
+
+def leaf_paths(config: Dict[str, Any]) -> List[Tuple[str, ...]]:
+    """
+    List the key path of every leaf in a configuration.
+
+    Args:
+        config: The configuration.
+
+    Returns:
+        One tuple of keys per leaf.
+    """
+    paths = []
+    stack: List[Tuple[Tuple[str, ...], Any]] = [((), config)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (key,), child) for key, child in node.items())
+        else:
+            paths.append(path)
+    return paths
+
+
+def write_configs(directory: Path, files: int, **kwargs: Any) -> List[str]:
+    """
+    Write `files` generated configurations as YAML files.
+
+    Args:
+        directory: Directory receiving the files.
+        files: Number of files.
+        **kwargs: Arguments of `generate_config`; the seed is offset per file.
+
+    Returns:
+        Paths of the written files.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    seed = kwargs.pop('seed', 0)
+    paths = []
+    for index in range(files):
+        path = directory / f"fragment_{index}.yaml"
+        path.write_text(yaml.safe_dump(generate_config(seed=seed + index, **kwargs)))
+        paths.append(str(path))
+    return paths
@@ -1,3 +1,31 @@
-from .secured import Secured
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ['Secured']
+if TYPE_CHECKING:
+    from .attribute import AttrDict
+    from .secure import Secure
+    from .secured import Secured
+
+# Exports and submodules are imported on first access, so `import secured` stays cheap and code using only
+# Secure never imports the loading machinery.
+_EXPORTS = {'Secured': 'secured', 'Secure': 'secure', 'AttrDict': 'attribute'}
+
+__all__ = ['Secured', 'Secure', 'AttrDict']
+
+
+def __getattr__(name: str) -> Any:
+    from importlib import import_module
+
+    if name in _EXPORTS:
+        value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_EXPORTS))
@@ -1,5 +1,10 @@
-from typing import Any, TypeVar, Union
-from .secure import Secure
+import time
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, TypeVar, Union
+from .secure import Secure, compact_secure
+
+if TYPE_CHECKING:
+    from .instrumentation import LoadStats
 
 T = TypeVar('T')
 
@@ -14,6 +19,8 @@ class AttrDict(dict):  # type: ignore
     Attributes:
         secure (bool): Determines whether the dictionary's values should be automatically secured.
         message (str): Custom message to display when values are secured.
+        lazy (bool): Determines whether nested values are converted on first access instead of upfront.
+        compact (bool): Determines whether secured leaves use the dict-less CompactSecure representation.
 
     Examples:
         >>> ad = AttrDict(secure=True, message="<Custom Secured>")
@@ -22,7 +29,13 @@ class AttrDict(dict):  # type: ignore
         '<Custom Secured>'
     """
 
-    def __init__(self, *args, secure: bool = False, message: str = "<Sensitive data secured>", **kwargs) -> None:  # type: ignore
+    _attributes = ('secure', 'message', 'lazy', 'compact', '_pending', '_observer', '_stats')
+    _observer: Optional[Callable[['AttrDict', Any], None]] = None
+    _stats: Optional['LoadStats'] = None
+
+    def __init__(self, *args, secure: bool = False, message: str = "<Sensitive data secured>",  # type: ignore
+                 lazy: bool = False, compact: bool = False, stats: Optional['LoadStats'] = None,
+                 **kwargs) -> None:
         """
         Initialize the AttrDict with the same arguments as a normal dict, plus options to secure.
 
@@ -30,17 +43,31 @@ class AttrDict(dict):  # type: ignore
             *args: Variable length argument list for dictionary items.
             secure: If True, non-dict values will be wrapped by the Secure class with the given message.
             message: Custom message used when values are secured.
+            lazy: If True, nested dictionaries and secured leaves are converted the first time their key is
+                accessed instead of upfront, and the converted value is cached in place.
+            compact: If True, secured leaves are created with `compact_secure`, which stores each value without
+                a per-instance dict and shares the message between all of them.
+            stats: Optional LoadStats counting the nodes, leaves and Secure values this AttrDict and its nested
+                AttrDicts create, and their accesses if usage counting is enabled.
             **kwargs: Arbitrary keyword arguments for dictionary items.
         """
         super().__init__(*args, **kwargs)
         self.secure = secure
         self.message = message
-        self._convert_dicts()
+        self.lazy = lazy
+        self.compact = compact
+        if stats is not None:
+            self._stats = stats
+            stats.nodes += 1
+        self._pending: set = set(self) if lazy else set()  # type: ignore[type-arg]
+        if not lazy:
+            self._convert_dicts()
 
     def _convert_dicts(self) -> None:
         """Recursively converts nested dictionaries into AttrDict instances and secures values if required."""
-        for key, value in list(self.items()):
-            self[key] = self._convert_value(value)
+        for key, value in list(super().items()):
+            super().__setitem__(key, self._convert_value(value))
+        self._pending.clear()
 
     def _convert_value(self, value: Union[dict, str, Any]) -> Union[Secure, 'AttrDict', Any]:
         """
@@ -52,16 +79,42 @@ class AttrDict(dict):  # type: ignore
         Returns:
             The converted value, secured if `secure` is True and not a dictionary.
         """
+        stats = self._stats
         if isinstance(value, dict):
-            value = AttrDict(value, secure=self.secure, message=self.message)  # type: ignore
+            value = AttrDict(value, secure=self.secure, message=self.message, lazy=self.lazy,  # type: ignore
+                             compact=self.compact, stats=stats)
+        elif stats is not None:
+            stats.leaves += 1
+            if self.secure and not isinstance(value, Secure):
+                start = time.perf_counter()
+                value = compact_secure(value, self.message) if self.compact else Secure(value, self.message)
+                stats.secure_seconds += time.perf_counter() - start
+                stats.secured += 1
         elif self.secure and not isinstance(value, Secure):
-            value = Secure(value, self.message)
+            value = compact_secure(value, self.message) if self.compact else Secure(value, self.message)
+        return value
+
+    def _materialize(self, key: Any) -> Any:
+        """
+        Converts a pending value of a lazy AttrDict and caches the result in place.
+
+        Args:
+            key: The key whose value should be converted.
+
+        Returns:
+            The converted value.
+        """
+        value = self._convert_value(super().__getitem__(key))
+        super().__setitem__(key, value)
+        self._pending.discard(key)
         return value
 
     def _get_original(self, item: str) -> Any:
         """
         Retrieves the original value of the specified item, without any securing.
 
+        Nested AttrDicts are returned as plain dictionaries revealed at every depth.
+
         Args:
             item: The attribute/key name to access.
 
@@ -76,12 +129,26 @@ class AttrDict(dict):  # type: ignore
             if isinstance(value, Secure):
                 return value._get_original()
             elif isinstance(value, AttrDict):
-                return {k: v._get_original() if isinstance(v, Secure) else v for k, v in value.items()}
+                return value.to_dict(reveal=True)
             else:
                 return value
         else:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
 
+    def to_dict(self, reveal: bool = False) -> dict:  # type: ignore[type-arg]
+        """
+        Export the AttrDict and everything nested in it as plain dictionaries and lists, without recursion.
+
+        Args:
+            reveal: If True, secured values are exported with their original values; otherwise they are replaced
+                by their message.
+
+        Returns:
+            The exported dictionary.
+        """
+        from .export import to_dict
+        return to_dict(self, reveal=reveal)
+
     def __getattr__(self, item: str) -> Any:
         """
         Enables attribute-style access to dictionary keys.
@@ -110,10 +177,10 @@ class AttrDict(dict):  # type: ignore
 
         This directly modifies the dictionary if `key` is not a special attribute.
         """
-        if key in ['secure', 'message']:
+        if key in self._attributes:
             super().__setattr__(key, value)
         else:
-            self[key] = self._convert_value(value)
+            self[key] = value
 
     def __setitem__(self, key: str, value: Any) -> None:
         """
@@ -124,3 +191,123 @@ class AttrDict(dict):  # type: ignore
             value: The value to set, which will be secured if applicable.
         """
         super().__setitem__(key, self._convert_value(value))
+        self._pending.discard(key)
+        if self._observer is not None:
+            self._observer(self, key)
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Returns the value for `key`, converting it first if it is still pending in lazy mode.
+
+        Args:
+            key: The dictionary key to access.
+
+        Returns:
+            The converted value associated with `key`.
+        """
+        if self._stats is not None and self._stats.count_usage:
+            self._stats.accesses += 1
+        if key in self._pending:
+            return self._materialize(key)
+        return super().__getitem__(key)
+
+    def __delitem__(self, key: Any) -> None:
+        """Deletes `key`, forgetting any pending conversion for it."""
+        super().__delitem__(key)
+        self._pending.discard(key)
+        if self._observer is not None:
+            self._observer(self, key)
+
+    def __iter__(self):  # type: ignore
+        """
+        Iterates over the keys.
+
+        Overriding this keeps `dict(ad)` and `{**ad}` from copying the raw storage directly, so they go through
+        `__getitem__` and never expose unconverted values of a lazy AttrDict.
+        """
+        return super().__iter__()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the converted value for `key` if present, else `default`."""
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):  # type: ignore
+        """Returns the items view, converting every pending value first."""
+        if self._pending:
+            self._convert_dicts()
+        return super().items()
+
+    def values(self):  # type: ignore
+        """Returns the values view, converting every pending value first."""
+        if self._pending:
+            self._convert_dicts()
+        return super().values()
+
+    def copy(self) -> dict:  # type: ignore[type-arg]
+        """Returns a shallow plain-dict copy, converting every pending value first."""
+        if self._pending:
+            self._convert_dicts()
+        return super().copy()
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        """Removes `key` and returns its converted value, or `default` if given and the key is missing."""
+        if key in self._pending:
+            self._materialize(key)
+        value = super().pop(key, *default)
+        if self._observer is not None:
+            self._observer(self, key)
+        return value
+
+
+class PlainView(MutableMapping):  # type: ignore[type-arg]
+    """
+    A plain-mapping view over an AttrDict tree, without attribute-style access.
+
+    The view holds a reference to the tree and copies nothing: nested mappings are returned as views over the
+    same nested AttrDicts, leaves (including Secure values) are returned as stored, and assignments go through
+    to the tree, where they are converted and secured as usual. Creating a view, or getting the tree back from
+    one, is O(1), which makes switching between both representations cheap regardless of the config size.
+
+    Attributes:
+        tree (AttrDict): The underlying tree.
+
+    Examples:
+        >>> view = PlainView(AttrDict({'db': {'host': 'localhost'}}))
+        >>> view['db']['host']
+        'localhost'
+    """
+
+    __slots__ = ('tree',)
+
+    def __init__(self, tree: AttrDict) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            tree: The AttrDict to expose as a plain mapping.
+        """
+        self.tree = tree
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self.tree[key]
+        return PlainView(value) if isinstance(value, AttrDict) else value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.tree[key] = value.tree if isinstance(value, PlainView) else value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.tree[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(dict.keys(self.tree))
+
+    def __len__(self) -> int:
+        return len(self.tree)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.tree
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self.tree)})"
@@ -0,0 +1,117 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+
+class ConfigCache:
+    """
+    An on-disk cache of parsed configuration trees.
+
+    Each source file gets one entry in `cache_dir`, named after a hash of its absolute path. An entry stores the
+    source size, modification time and content hash next to the parsed tree, pickled with the highest protocol.
+    When size and modification time still match, the entry is returned without reading the source at all. When
+    they differ, the source is read and hashed, and the entry is reused only if the content is unchanged.
+
+    Only point `cache_dir` at a directory you trust: entries are unpickled, so anyone able to write there can run
+    code in the loading process.
+
+    Attributes:
+        cache_dir (Path): Directory holding the cache entries.
+
+    Examples:
+        >>> cache = ConfigCache('.secured-cache')
+        >>> data = cache.load('config.yaml', yaml.safe_load)
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """
+        Initialize the cache, creating `cache_dir` if it does not exist.
+
+        Args:
+            cache_dir: Directory where cache entries are stored.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, path: Path) -> Path:
+        """
+        Returns the location of the cache entry for a source file.
+
+        Args:
+            path: Resolved path of the source file.
+
+        Returns:
+            Path of the cache entry.
+        """
+        return self.cache_dir / f"{hashlib.sha256(str(path).encode()).hexdigest()}.pickle"
+
+    def _read_entry(self, entry: Path) -> Tuple[int, int, str, Any] | None:
+        """
+        Reads a cache entry, ignoring missing or corrupt entries.
+
+        Args:
+            entry: Path of the cache entry.
+
+        Returns:
+            A `(size, mtime_ns, digest, data)` tuple, or None if the entry cannot be used.
+        """
+        try:
+            with open(entry, 'rb') as file:
+                return pickle.load(file)  # type: ignore[no-any-return]
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+
+    def _write_entry(self, entry: Path, record: Tuple[int, int, str, Any]) -> None:
+        """
+        Atomically writes a cache entry, so concurrent readers never see a partial file.
+
+        Args:
+            entry: Path of the cache entry.
+            record: The `(size, mtime_ns, digest, data)` tuple to store.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(record, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, path: str | Path, parse: Callable[[bytes], Any]) -> Any:
+        """
+        Returns the parsed content of `path`, from the cache when the source is unchanged.
+
+        Args:
+            path: Path of the source file.
+            parse: Callable turning the raw file content into the parsed tree, used on a cache miss.
+
+        Returns:
+            The parsed tree.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+        """
+        source = Path(path).resolve()
+        stat = source.stat()
+        entry = self._entry_path(source)
+        record = self._read_entry(entry)
+        if record is not None and record[:2] == (stat.st_size, stat.st_mtime_ns):
+            return record[3]
+
+        content = source.read_bytes()
+        digest = hashlib.blake2b(content).hexdigest()
+        if record is not None and record[2] == digest:
+            data = record[3]
+        else:
+            data = parse(content)
+        self._write_entry(entry, (stat.st_size, stat.st_mtime_ns, digest, data))
+        return data
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        for entry in self.cache_dir.glob('*.pickle'):
+            entry.unlink(missing_ok=True)
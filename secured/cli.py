@@ -0,0 +1,338 @@
+"""
+The `secured` command: validate, precompile and benchmark configuration files.
+
+    secured validate configs/ --schema schema.yaml --workers 8 --json
+    secured precompile configs/ --output configs.scfg
+    secured bench configs/service.yaml --secure --repeat 5 --json
+
+Exit codes: 0 on success, 1 when a file is invalid, 2 on usage errors such as a missing path.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from functools import reduce
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import yaml  # type: ignore
+
+from .loader import read_config, safe_load
+from .schema import Schema, SchemaError
+from .shared import encode
+
+EXIT_OK = 0
+EXIT_INVALID = 1
+EXIT_USAGE = 2
+CONFIG_SUFFIXES = {'.yaml', '.yml', '.json', '.toml', '.env'}
+T = TypeVar('T')
+SCHEMA_TYPES = {'int': int, 'float': float, 'bool': bool, 'str': str, 'duration': timedelta, 'list': list}
+
+
+def find_configs(paths: Sequence[str]) -> Tuple[List[str], List[str]]:
+    """
+    Expand files and directories into the configuration files they contain, searching directories recursively.
+
+    Args:
+        paths: Files and directories given on the command line.
+
+    Returns:
+        The configuration files in a stable order, and the paths that do not exist.
+    """
+    files: List[str] = []
+    missing: List[str] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(str(file) for file in path.rglob('*')
+                                if file.is_file() and (file.suffix.lower() in CONFIG_SUFFIXES
+                                                       or file.name.startswith('.env'))))
+        elif path.is_file():
+            files.append(str(path))
+        else:
+            missing.append(str(path))
+    return list(dict.fromkeys(files)), missing
+
+
+def load_schema(path: str) -> Schema:
+    """
+    Read a schema file mapping dotted paths to type names.
+
+    Type names are `int`, `float`, `bool`, `str`, `duration` and `list`; a one-item list such as `[int]` declares
+    a list whose items are coerced.
+
+    Args:
+        path: Path of the YAML schema file.
+
+    Raises:
+        ValueError: If the file is not a mapping or names an unknown type.
+    """
+    with open(path, 'rb') as file:
+        fields = safe_load(file) or {}
+    if not isinstance(fields, dict):
+        raise ValueError(f"Schema {path} must map dotted paths to type names.")
+    types: Dict[str, Any] = {}
+    for field, name in fields.items():
+        item = name[0] if isinstance(name, list) and len(name) == 1 else None
+        if (item if item is not None else name) not in SCHEMA_TYPES:
+            raise ValueError(f"Unknown type {name!r} for {field} in schema {path}.")
+        types[field] = [SCHEMA_TYPES[item]] if item is not None else SCHEMA_TYPES[name]
+    return Schema(types)
+
+
+def config_name(path: str) -> str:
+    """Return the attribute name Secured gives the config loaded from `path`."""
+    return Path(path).stem.replace('-', '_')
+
+
+def load_file(path: str, schema: Optional[Schema] = None) -> Tuple[Dict[str, Any], Any]:
+    """
+    Parse a configuration file and validate it against a schema, the way Secured would load it.
+
+    This is a module-level function so it can be submitted to a process pool.
+
+    Args:
+        path: Path of the file.
+        schema: Optional schema; its paths start with the config name, like with Secured.
+
+    Returns:
+        A report with the `path`, whether it is `valid`, the `error` message if not, every schema failure as
+        `schema_errors`, and the `seconds` taken; and the parsed data with coerced values, or None if invalid.
+    """
+    start = time.perf_counter()
+    report: Dict[str, Any] = {'path': path, 'valid': False, 'error': None, 'schema_errors': []}
+    data = None
+    try:
+        data = read_config(path)
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a mapping at the top level, got {type(data).__name__}")
+        if schema is not None:
+            data = schema.apply(data, config_name(path))
+        report['valid'] = True
+    except SchemaError as e:
+        data = None
+        report['error'] = f"{len(e.errors)} value(s) do not match the schema"
+        report['schema_errors'] = [{'path': field, 'reason': reason} for field, reason in e.errors]
+    except (OSError, ImportError, ValueError, yaml.YAMLError) as e:
+        data = None
+        report['error'] = f"{type(e).__name__}: {e}"
+    report['seconds'] = time.perf_counter() - start
+    return report, data
+
+
+def check_file(path: str, schema: Optional[Schema] = None) -> Dict[str, Any]:
+    """Validate a configuration file like `load_file`, returning only the report."""
+    return load_file(path, schema)[0]
+
+
+def run_files(function: Callable[[str, Optional[Schema]], T], files: List[str], schema: Optional[Schema],
+              workers: int) -> List[T]:
+    """
+    Apply `check_file` or `load_file` to files, across a process pool when `workers` is above 1.
+
+    Args:
+        function: The module-level function to apply.
+        files: Paths of the files.
+        schema: Optional schema.
+        workers: Number of worker processes.
+
+    Returns:
+        The result for each file, in order.
+    """
+    if workers <= 1 or len(files) <= 1:
+        return [function(path, schema) for path in files]
+    with ProcessPoolExecutor(min(workers, len(files))) as pool:
+        return list(pool.map(function, files, repeat(schema), chunksize=max(1, len(files) // (workers * 4))))
+
+
+def _describe(report: Dict[str, Any]) -> str:
+    """Format the report of a file as human-readable lines."""
+    line = f"{'ok  ' if report['valid'] else 'FAIL'} {report['path']}" + (f": {report['error']}" if report['error'] else '')
+    return line + ''.join(f"\n       {error['path']}: {error['reason']}" for error in report['schema_errors'])
+
+
+def _emit(args: argparse.Namespace, result: Dict[str, Any], lines: List[str]) -> None:
+    """Print a result as JSON when `--json` was given, otherwise as human-readable lines."""
+    if args.json:
+        print(json.dumps(result, indent=2, default=str))
+    else:
+        print('\n'.join(lines))
+
+
+def _usage_error(message: str) -> int:
+    """Report a usage error on stderr and return its exit code."""
+    print(f"secured: error: {message}", file=sys.stderr)
+    return EXIT_USAGE
+
+
+def validate(args: argparse.Namespace) -> int:
+    """Run the `validate` command."""
+    files, missing = find_configs(args.paths)
+    if missing:
+        return _usage_error(f"no such file or directory: {', '.join(missing)}")
+    if not files:
+        return _usage_error("no configuration files found")
+    try:
+        schema = load_schema(args.schema) if args.schema else None
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return _usage_error(str(e))
+    start = time.perf_counter()
+    reports = run_files(check_file, files, schema, args.workers)
+    invalid = [report for report in reports if not report['valid']]
+    lines = [_describe(report) for report in reports]
+    lines.append(f"{len(reports) - len(invalid)} valid, {len(invalid)} invalid")
+    _emit(args, {'valid': not invalid, 'files': reports, 'seconds': time.perf_counter() - start}, lines)
+    return EXIT_INVALID if invalid else EXIT_OK
+
+
+def precompile(args: argparse.Namespace) -> int:
+    """Run the `precompile` command."""
+    files, missing = find_configs(args.paths)
+    if missing:
+        return _usage_error(f"no such file or directory: {', '.join(missing)}")
+    if not files:
+        return _usage_error("no configuration files found")
+    names: Dict[str, str] = {}
+    for path in files:
+        if names.setdefault(config_name(path), path) != path:
+            return _usage_error(f"{path} and {names[config_name(path)]} would both be loaded as "
+                                f"'{config_name(path)}'")
+    try:
+        schema = load_schema(args.schema) if args.schema else None
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        return _usage_error(str(e))
+    start = time.perf_counter()
+    loaded = run_files(load_file, files, schema, args.workers)
+    invalid = [report for report, _ in loaded if not report['valid']]
+    if invalid:
+        _emit(args, {'valid': False, 'files': invalid}, [_describe(report) for report in invalid] + ["nothing written"])
+        return EXIT_INVALID
+    configs = {config_name(path): data for path, (_, data) in zip(files, loaded)}
+    content = encode(configs, secure=configs if args.secure else (), message=args.message)
+    output = Path(args.output)
+    fd, tmp_path = tempfile.mkstemp(dir=output.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    result = {'output': str(output), 'configs': sorted(configs), 'bytes': len(content),
+              'seconds': time.perf_counter() - start}
+    _emit(args, result, [f"wrote {len(configs)} config(s), {len(content)} bytes, to {output}"])
+    return EXIT_OK
+
+
+def _leaf_paths(configs: Dict[str, Any]) -> List[Tuple[Any, ...]]:
+    """List the key path of every leaf of the loaded configs, starting with the config name."""
+    paths = []
+    stack: List[Tuple[Tuple[Any, ...], Any]] = [((), configs)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (key,), child) for key, child in node.items())
+        else:
+            paths.append(path)
+    return paths
+
+
+def bench(args: argparse.Namespace) -> int:
+    """Run the `bench` command."""
+    from .secured import Secured
+
+    files, missing = find_configs(args.paths)
+    if missing:
+        return _usage_error(f"no such file or directory: {', '.join(missing)}")
+    if not files:
+        return _usage_error("no configuration files found")
+    unsupported = [path for path in files if Path(path).suffix.lower() not in ('.yaml', '.yml')]
+    if unsupported:
+        return _usage_error(f"bench loads YAML files only: {', '.join(unsupported)}")
+    loaded = [load_file(path) for path in files]
+    invalid = [report for report, _ in loaded if not report['valid']]
+    if invalid:
+        _emit(args, {'valid': False, 'files': invalid}, [_describe(report) for report in invalid])
+        return EXIT_INVALID
+    options = dict(secure=args.secure, lazy=args.lazy, compiled=args.compiled)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        secured = Secured(files, stats=True, **options)
+        timings.append(time.perf_counter() - start)
+    paths = _leaf_paths({config_name(path): data for path, (_, data) in zip(files, loaded)})
+    dotted = ['.'.join(str(key) for key in path) for path in paths]
+    start = time.perf_counter()
+    for path in dotted:
+        secured.get(path)
+    lookup = time.perf_counter() - start
+    start = time.perf_counter()
+    for path in paths:
+        reduce(lambda node, key: node[key], path[1:], getattr(secured, path[0]))
+    traversal = time.perf_counter() - start
+    per_leaf = lambda seconds: seconds / len(paths) if paths else 0.0  # noqa: E731
+    result = {
+        'files': secured.stats.as_dict()['files'],  # type: ignore[union-attr]
+        'options': options,
+        'load': {'best': min(timings), 'worst': max(timings), 'runs': len(timings)},
+        'access': {'leaves': len(paths), 'get_per_leaf': per_leaf(lookup), 'traversal_per_leaf': per_leaf(traversal)},
+    }
+    lines = [f"{'file':<40} {'read ms':>9} {'parse ms':>9} {'convert ms':>11} {'leaves':>8}"]
+    lines.extend(f"{file['path'][-40:]:<40} {file['read'] * 1000:9.3f} {file['parse'] * 1000:9.3f} "
+                 f"{file['convert'] * 1000:11.3f} {file['leaves']:8d}" for file in result['files'])
+    lines.append(f"load: best {min(timings) * 1000:.3f} ms over {len(timings)} run(s)")
+    lines.append(f"access: {len(paths)} leaves, get {per_leaf(lookup) * 1e6:.3f} us/leaf, "
+                 f"traversal {per_leaf(traversal) * 1e6:.3f} us/leaf")
+    _emit(args, result, lines)
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the parser of the `secured` command."""
+    parser = argparse.ArgumentParser(prog='secured', description="Validate, precompile and benchmark configs.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_command(name: str, description: str, workers: bool = True) -> argparse.ArgumentParser:
+        command = commands.add_parser(name, help=description, description=description)
+        command.add_argument('paths', nargs='+', help="configuration files or directories searched recursively")
+        command.add_argument('--json', action='store_true', help="print a machine-readable JSON report")
+        if workers:
+            command.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                                 help="number of worker processes (default: one per CPU)")
+            command.add_argument('--schema', help="YAML file mapping dotted paths to type names")
+        return command
+
+    add_command('validate', "Parse every file and validate it against an optional schema.").set_defaults(run=validate)
+    command = add_command('precompile', "Validate files and encode them into one memory-mappable artifact, "
+                                        "loaded with Secured.from_shared(SharedConfig.open(path)).")
+    command.add_argument('--output', '-o', required=True, help="path of the artifact to write")
+    command.add_argument('--secure', action='store_true', help="secure the leaves of every config when read back")
+    command.add_argument('--message', default="<Sensitive data secured>", help="message of the secured leaves")
+    command.set_defaults(run=precompile)
+    command = add_command('bench', "Report load timings and access costs of configs.", workers=False)
+    command.add_argument('--repeat', type=int, default=5, help="number of timed loads (default: 5)")
+    command.add_argument('--secure', action='store_true', help="load with secure=True")
+    command.add_argument('--lazy', action='store_true', help="load with lazy=True")
+    command.add_argument('--compiled', action='store_true', help="load with compiled=True")
+    command.set_defaults(run=bench)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point of the `secured` command.
+
+    Args:
+        argv: Command-line arguments without the program name; `sys.argv[1:]` when None.
+
+    Returns:
+        The exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if getattr(args, 'workers', 1) < 1 or getattr(args, 'repeat', 1) < 1:
+        return _usage_error("--workers and --repeat must be at least 1")
+    return args.run(args)  # type: ignore[no-any-return]
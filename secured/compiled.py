@@ -0,0 +1,209 @@
+import keyword
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+from .secure import Secure, compact_secure
+from .snapshot import Path, _keys
+
+
+class CompiledNode(Mapping):  # type: ignore[type-arg]
+    """
+    Base class of the slotted node classes generated by `compile_tree`, one per distinct mapping shape.
+
+    Each key that is a valid identifier becomes a slot, so reading `config.db.host` is a plain slot lookup, as
+    fast as any attribute, instead of a failed attribute lookup followed by `__getattr__` and a dict access. Keys
+    that cannot be attributes (such as `my-key`, integers, or names like `items` that would hide a mapping
+    method) are kept in a small side dictionary and are reachable with `node[key]`, just like on AttrDict.
+    Nodes are read-only mappings; `set` and `delete` return a new root sharing every unchanged subtree.
+
+    Examples:
+        >>> config = compile_tree({'db': {'host': 'db.local', 'port': 5432}}, secure=True)
+        >>> config.db.host
+        <Sensitive data secured>
+        >>> config['db']['port'].to_int()
+        5432
+    """
+
+    __slots__ = ('_extra',)
+    _keys: Tuple[Any, ...] = ()
+    _slots: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def _make(cls, values: Iterable[Any]) -> 'CompiledNode':
+        """
+        Create a node from values already converted, given in the order of the class keys.
+
+        Args:
+            values: The values of the node.
+        """
+        node = object.__new__(cls)
+        extra = None
+        for key, value in zip(cls._keys, values):
+            if key in cls._slots:
+                object.__setattr__(node, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        object.__setattr__(node, '_extra', extra)
+        return node
+
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._slots:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._slots or (self._extra is not None and key in self._extra)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _rebuild, (self._keys, list(self.values()))
+
+    def _get_original(self, item: str) -> Any:
+        """
+        Retrieves the original value of the specified item, without any securing.
+
+        Nested nodes are returned as plain dictionaries revealed at every depth.
+
+        Raises:
+            AttributeError: If the item does not exist.
+        """
+        if item not in self:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
+        value = self[item]
+        if isinstance(value, Secure):
+            return value._get_original()
+        if isinstance(value, CompiledNode):
+            return value.to_dict(reveal=True)
+        return value
+
+    def to_dict(self, reveal: bool = False) -> Dict[Any, Any]:
+        """
+        Export the node and everything nested in it as plain dictionaries and lists, without recursion.
+
+        Args:
+            reveal: If True, secured values are exported with their original values.
+        """
+        from .export import to_dict
+        return to_dict(self, reveal=reveal)
+
+    def set(self, path: Path, value: Any) -> 'CompiledNode':
+        """
+        Return a new root with `value` stored at `path`, creating missing intermediate nodes.
+
+        Nodes whose keys change get the class of their new shape. Only the nodes on the path are copied.
+
+        Args:
+            path: Dotted path or tuple of keys, relative to this node.
+            value: The value to store, already converted (e.g. with `compile_tree`).
+        """
+        keys = _keys(path)
+        if not keys:
+            raise ValueError("Cannot replace the root of a compiled config.")
+        if len(keys) > 1:
+            child = self[keys[0]] if keys[0] in self else None
+            value = (child if isinstance(child, CompiledNode) else _node_class(())._make(())).set(keys[1:], value)
+        items = dict(self.items())
+        items[keys[0]] = value
+        return _node_class(tuple(items))._make(items.values())
+
+    def delete(self, path: Path) -> 'CompiledNode':
+        """
+        Return a new root without the key at `path`.
+
+        Args:
+            path: Dotted path or tuple of keys, relative to this node.
+
+        Raises:
+            KeyError: If the path does not exist.
+        """
+        keys = _keys(path)
+        items = dict(self.items())
+        if len(keys) == 1:
+            del items[keys[0]]
+        else:
+            child = items[keys[0]]
+            if not isinstance(child, CompiledNode):
+                raise KeyError(keys[1])
+            items[keys[0]] = child.delete(keys[1:])
+        return _node_class(tuple(items))._make(items.values())
+
+
+_RESERVED = frozenset(dir(CompiledNode))
+_classes: Dict[Tuple[Any, ...], type] = {}
+
+
+def _node_class(keys: Tuple[Any, ...]) -> type:
+    """
+    Return the node class of a mapping shape, generating it on first use.
+
+    Args:
+        keys: The keys of the mapping, in order.
+    """
+    node_class = _classes.get(keys)
+    if node_class is None:
+        slots = tuple(key for key in keys if isinstance(key, str) and key.isidentifier()
+                      and not keyword.iskeyword(key) and key not in _RESERVED)
+        node_class = _classes.setdefault(keys, type('CompiledNode', (CompiledNode,), {
+            '__slots__': slots, '_keys': keys, '_slots': frozenset(slots)}))
+    return node_class
+
+
+def _rebuild(keys: Tuple[Any, ...], values: List[Any]) -> CompiledNode:
+    """Recreate a node when unpickling, since the generated classes cannot be imported by name."""
+    return _node_class(keys)._make(values)
+
+
+def compile_tree(data: Any, secure: bool = False, message: str = "<Sensitive data secured>",
+                 compact: bool = False) -> Any:
+    """
+    Build a config from parsed data using generated slotted classes, one per distinct mapping shape.
+
+    Mappings become CompiledNode instances, and leaves are secured like AttrDict leaves when `secure` is True,
+    lists included. Mappings with the same keys share one class, so a config with thousands of nodes of a few
+    shapes generates only a few classes. The tree is built bottom-up without recursion.
+
+    Args:
+        data: The parsed data.
+        secure: If True, leaves are wrapped in Secure.
+        message: Custom message of the secured leaves.
+        compact: If True, leaves are secured with `compact_secure`.
+
+    Returns:
+        The compiled config, or the converted leaf if `data` is not a mapping.
+    """
+    def leaf(value: Any) -> Any:
+        if secure and not isinstance(value, Secure):
+            return compact_secure(value, message) if compact else Secure(value, message)
+        return value
+
+    if not isinstance(data, Mapping):
+        return leaf(data)
+    built: Dict[int, CompiledNode] = {}
+    stack: List[Tuple[Mapping, bool]] = [(data, False)]  # type: ignore[type-arg]
+    while stack:
+        node, ready = stack.pop()
+        if ready:
+            values = [built[id(value)] if isinstance(value, Mapping) else leaf(value) for value in node.values()]
+            built[id(node)] = _node_class(tuple(node))._make(values)
+        elif id(node) not in built:
+            stack.append((node, True))
+            stack.extend((value, False) for value in node.values() if isinstance(value, Mapping))
+    return built[id(data)]
@@ -0,0 +1,229 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .providers import _copy
+from .secure import Secure
+
+
+class DecryptionError(Exception):
+    """
+    Raised when an encrypted value cannot be decrypted, e.g. because it was encrypted with another key.
+
+    Deliberately not a ValueError, so `Secure.to_int` and `Secure.to_float` do not mistake it for a conversion
+    failure and silently return the message.
+    """
+
+
+class Ciphertext(str):
+    """The token of a value tagged `!encrypted` in YAML, left undecrypted until a Cipher is applied."""
+
+    __slots__ = ()
+
+
+class Cipher:
+    """
+    Base class of the ciphers used to encrypt config values at rest.
+
+    Subclasses implement `encrypt` and `decrypt` on text tokens, so encrypted values can be written as
+    `!encrypted <token>` in YAML files. `decrypt` may be called from several threads at once.
+    """
+
+    def encrypt(self, plaintext: str) -> str:
+        """
+        Encrypt a value.
+
+        Args:
+            plaintext: The value to encrypt.
+
+        Returns:
+            The token to store in the config file.
+        """
+        raise NotImplementedError
+
+    def decrypt(self, token: str) -> str:
+        """
+        Decrypt a token.
+
+        Args:
+            token: A token returned by `encrypt`.
+
+        Returns:
+            The plaintext.
+
+        Raises:
+            DecryptionError: If the token cannot be decrypted.
+        """
+        raise NotImplementedError
+
+
+class FernetCipher(Cipher):
+    """
+    A cipher using Fernet (AES-128-CBC with HMAC-SHA256) from the optional `cryptography` package.
+
+    Examples:
+        >>> cipher = FernetCipher.from_key_file('config.key')
+        >>> cipher.encrypt('password123')
+        'gAAAAABm...'
+    """
+
+    def __init__(self, key: bytes | str) -> None:
+        """
+        Args:
+            key: A url-safe base64-encoded 32-byte key, as created by `generate_key`.
+
+        Raises:
+            ImportError: If `cryptography` is not installed.
+        """
+        try:
+            from cryptography.fernet import Fernet, InvalidToken  # type: ignore
+        except ImportError as e:
+            raise ImportError("FernetCipher requires the 'cryptography' package.") from e
+        self._fernet = Fernet(key)
+        self._invalid_token = InvalidToken
+
+    @staticmethod
+    def generate_key() -> bytes:
+        """Create a new random key."""
+        from cryptography.fernet import Fernet  # type: ignore
+        return Fernet.generate_key()
+
+    @classmethod
+    def from_key_file(cls, path: str | Path) -> 'FernetCipher':
+        """
+        Create a cipher from a file holding the key.
+
+        Args:
+            path: Path of the key file; surrounding whitespace is ignored.
+        """
+        return cls(Path(path).read_bytes().strip())
+
+    def encrypt(self, plaintext: str) -> str:
+        return self._fernet.encrypt(plaintext.encode('utf-8')).decode('ascii')
+
+    def decrypt(self, token: str) -> str:
+        try:
+            return self._fernet.decrypt(token.encode('ascii')).decode('utf-8')
+        except (self._invalid_token, UnicodeError) as e:
+            raise DecryptionError("Could not decrypt value; was it encrypted with this key?") from e
+
+
+class EncryptedSecure(Secure):
+    """
+    A Secure holding a ciphertext, decrypted the first time its original value is used.
+
+    `_get_original`, `to_int`, `to_float` and compositions all decrypt on first use and then reuse the cached
+    plaintext. Until then the value costs no decryption, so configs start as fast as with plaintext values. The
+    secured text is the ciphertext token, so comparing two encrypted values, or diffing reloaded configs, never
+    decrypts them; compare `_get_original()` to check the plaintext.
+    """
+
+    __slots__ = ('_message', '_cipher', '_plaintext')
+
+    def __new__(cls, token: str, cipher: Cipher, message: str = "<Sensitive data secured>"):  # type: ignore
+        """
+        Create the encrypted value without decrypting it.
+
+        Args:
+            token: The ciphertext token.
+            cipher: The cipher that decrypts the token.
+            message: A placeholder message to display instead of the content.
+        """
+        instance = str.__new__(cls, token)
+        instance._message = message
+        instance._cipher = cipher
+        instance._plaintext = None
+        return instance
+
+    def __init__(self, token: str, cipher: Cipher, message: str = "<Sensitive data secured>") -> None:
+        pass
+
+    @property
+    def _original(self) -> str:  # type: ignore[override]
+        """The plaintext, decrypted on first access."""
+        plaintext = self._plaintext
+        if plaintext is None:
+            plaintext = self._plaintext = self._cipher.decrypt(str.__str__(self))
+        return plaintext
+
+    @property
+    def decrypted(self) -> bool:
+        """Whether the plaintext has been decrypted already."""
+        return self._plaintext is not None
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return EncryptedSecure, (str.__str__(self), self._cipher, self._message)
+
+
+def decrypt_tree(data: Any, cipher: Cipher, message: str = "<Sensitive data secured>") -> Any:
+    """
+    Replace the Ciphertext leaves of a parsed tree by EncryptedSecure values, without decrypting anything.
+
+    Only the containers on the way to an encrypted value are copied, so a tree without any is returned as is.
+
+    Args:
+        data: The parsed tree.
+        cipher: The cipher that decrypts the values.
+        message: Custom message of the encrypted values.
+
+    Returns:
+        The tree with wrapped encrypted values.
+    """
+    if isinstance(data, Ciphertext):
+        return EncryptedSecure(data, cipher, message)
+    copies: Dict[Tuple[Any, ...], Any] = {}
+    stack: List[Tuple[Tuple[Any, ...], Any]] = [((), data)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend((path + (key,), value) for key, value in node.items())
+        elif isinstance(node, list):
+            stack.extend((path + (index,), value) for index, value in enumerate(node))
+        elif isinstance(node, Ciphertext):
+            _copy(data, path[:-1], copies)[path[-1]] = EncryptedSecure(node, cipher, message)
+    return copies.get((), data)
+
+
+def iter_encrypted(data: Any) -> Iterator[EncryptedSecure]:
+    """
+    Yield the encrypted values of a config, descending into mappings, lists and tuples.
+
+    Args:
+        data: A parsed tree, AttrDict, FrozenAttrDict or any other mapping.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, EncryptedSecure):
+            yield node
+        elif hasattr(node, 'items') and not isinstance(node, str):
+            stack.extend(value for _, value in node.items())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+
+
+def decrypt_all(values: Iterable[EncryptedSecure], max_workers: int = 4) -> int:
+    """
+    Decrypt encrypted values up front in a thread pool, so later accesses find their plaintext cached.
+
+    Args:
+        values: The values to decrypt; values decrypted already are skipped.
+        max_workers: Number of threads decrypting concurrently.
+
+    Returns:
+        The number of values decrypted.
+
+    Raises:
+        DecryptionError: If a value cannot be decrypted.
+    """
+    pending = [value for value in values if not value.decrypted]
+    if not pending:
+        return 0
+    if max_workers <= 1 or len(pending) == 1:
+        for value in pending:
+            value._get_original()
+    else:
+        with ThreadPoolExecutor(min(max_workers, len(pending)), thread_name_prefix='secured-decrypt') as pool:
+            list(pool.map(EncryptedSecure._get_original, pending))
+    return len(pending)
+
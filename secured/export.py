@@ -0,0 +1,254 @@
+import datetime
+import json
+import math
+import re
+from collections.abc import Mapping
+from itertools import repeat
+from typing import IO, Any, Iterator, List, Optional, Tuple
+
+from .attribute import AttrDict
+from .secure import Secure
+
+_MAP, _SEQ, _KEY, _SCALAR, _END = range(5)
+_PLAIN = re.compile(r'^[A-Za-z_][A-Za-z0-9_./-]*$')
+_RESERVED = {'y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null'}
+
+
+def _events(data: Any, reveal: bool, message: Optional[str]) -> Iterator[Tuple[int, Any]]:
+    """
+    Walk a config iteratively, yielding `(kind, value)` events with secrets already revealed or masked.
+
+    Mappings yield `_MAP` with their length, then a `_KEY` event before each value, and `_END`; sequences yield
+    `_SEQ`, their items and `_END`; everything else yields a single `_SCALAR`. The pending values of lazy
+    AttrDicts are read without converting them, masking their leaves when the AttrDict is secured.
+
+    Args:
+        data: An AttrDict, any other mapping, a list or a leaf.
+        reveal: If True, Secure values are replaced by their original values, otherwise by their message.
+        message: Message masking every secret, instead of the message of each Secure value.
+    """
+    # Each frame iterates over (key, value, mask) triples; `mask` is the message hiding plain leaves of a
+    # secured AttrDict that were not converted yet, or None.
+    stack: List[Iterator[Tuple[Any, Any, Optional[str]]]] = [iter([(None, data, None)])]
+    keyed = [False]
+    while stack:
+        for key, value, mask in stack[-1]:
+            if keyed[-1]:
+                yield _KEY, key
+            if isinstance(value, Secure):
+                if not reveal:
+                    yield _SCALAR, message if message is not None else str(value)
+                    continue
+                value, mask = value._get_original(), None
+            elif mask is not None and not reveal and not isinstance(value, Mapping):
+                yield _SCALAR, message if message is not None else mask
+                continue
+            if isinstance(value, AttrDict):
+                child_mask = value.message if value.secure else None
+                yield _MAP, len(value)
+                stack.append(zip(dict.keys(value), dict.values(value), repeat(child_mask)))
+                keyed.append(True)
+                break
+            if isinstance(value, Mapping):
+                yield _MAP, len(value)
+                stack.append(zip(value.keys(), value.values(), repeat(mask)))
+                keyed.append(True)
+                break
+            if isinstance(value, (list, tuple)):
+                yield _SEQ, len(value)
+                stack.append(zip(repeat(None), value, repeat(mask)))
+                keyed.append(False)
+                break
+            yield _SCALAR, value
+        else:
+            stack.pop()
+            keyed.pop()
+            if stack:
+                yield _END, None
+
+
+def to_dict(data: Any, reveal: bool = False, message: Optional[str] = None) -> Any:
+    """
+    Export a config as plain dictionaries, lists and values, without recursion.
+
+    Works on AttrDict, FrozenAttrDict and any other mapping, at any depth. Lazy AttrDicts are exported without
+    converting their pending values.
+
+    Args:
+        data: The config to export.
+        reveal: If True, secrets are exported with their original values; otherwise they are replaced by the
+            message of each Secure value.
+        message: Message replacing every secret instead, when not revealing.
+
+    Returns:
+        The exported config.
+
+    Examples:
+        >>> to_dict(AttrDict({'db': {'password': 'pw'}}, secure=True), reveal=True)
+        {'db': {'password': 'pw'}}
+    """
+    root: List[Any] = []
+    containers: List[Any] = [root]
+    key: Any = None
+    for kind, value in _events(data, reveal, message):
+        if kind == _KEY:
+            key = value
+            continue
+        if kind == _END:
+            containers.pop()
+            continue
+        node = {} if kind == _MAP else [] if kind == _SEQ else value
+        parent = containers[-1]
+        if isinstance(parent, list):
+            parent.append(node)
+        else:
+            parent[key] = node
+        if kind == _MAP or kind == _SEQ:
+            containers.append(node)
+    return root[0]
+
+
+def _json_key(key: Any) -> str:
+    """Format a mapping key as a JSON string."""
+    return json.dumps(key if isinstance(key, str) else str(key).lower() if isinstance(key, bool) else str(key))
+
+
+def _json_scalar(value: Any) -> str:
+    """Format a leaf as JSON, falling back to its text for types JSON does not have."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return json.dumps(value)
+    return json.dumps(value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else str(value))
+
+
+def iter_json(data: Any, reveal: bool = False, message: Optional[str] = None,
+              indent: Optional[int] = None) -> Iterator[str]:
+    """
+    Serialize a config to JSON piece by piece, without recursion or an intermediate copy.
+
+    Args:
+        data: The config to serialize.
+        reveal: If True, secrets are written with their original values, otherwise masked.
+        message: Message replacing every secret instead of the message of each Secure value.
+        indent: Number of spaces per nesting level, or None for a single line.
+
+    Returns:
+        An iterator over the chunks of the document.
+    """
+    newline = '\n' if indent is not None else ''
+    step = ' ' * (indent or 0)
+    counts: List[int] = []
+    kinds: List[int] = []
+    pending_key: Optional[str] = None
+    for kind, value in _events(data, reveal, message):
+        if kind == _KEY:
+            pending_key = _json_key(value)
+            continue
+        if kind == _END:
+            closing = '}' if kinds.pop() == _MAP else ']'
+            yield (newline + step * len(kinds) if counts.pop() else '') + closing
+            continue
+        if counts:
+            separator = ', ' if indent is None else ','
+            yield (separator if counts[-1] else '') + newline + step * len(counts)
+            counts[-1] += 1
+        if pending_key is not None:
+            yield pending_key + ': '
+            pending_key = None
+        if kind == _SCALAR:
+            yield _json_scalar(value)
+        else:
+            yield '{' if kind == _MAP else '['
+            counts.append(0)
+            kinds.append(kind)
+    yield newline
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Format a leaf as a YAML flow scalar, quoting strings that would read back as another value."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return '.nan'
+        if math.isinf(value):
+            return '.inf' if value > 0 else '-.inf'
+        text = repr(value)
+        # YAML 1.1 only reads exponents as floats when the mantissa has a dot
+        return text.replace('e', '.0e', 1) if 'e' in text and '.' not in text else text
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    text = value if isinstance(value, str) else str(value)
+    if _PLAIN.match(text) and text.lower() not in _RESERVED:
+        return text
+    return json.dumps(text)
+
+
+def iter_yaml(data: Any, reveal: bool = False, message: Optional[str] = None, indent: int = 2) -> Iterator[str]:
+    """
+    Serialize a config to block-style YAML line by line, without recursion or an intermediate copy.
+
+    Args:
+        data: The config to serialize.
+        reveal: If True, secrets are written with their original values, otherwise masked.
+        message: Message replacing every secret instead of the message of each Secure value.
+        indent: Number of spaces per nesting level.
+
+    Returns:
+        An iterator over the lines of the document.
+    """
+    kinds: List[int] = []
+    key: Any = None
+    events = _events(data, reveal, message)
+    for kind, value in events:
+        if kind == _KEY:
+            key = value
+            continue
+        if kind == _END:
+            kinds.pop()
+            continue
+        prefix = ' ' * (indent * max(len(kinds) - 1, 0))
+        if kinds:
+            prefix += _yaml_scalar(key) + ':' if kinds[-1] == _MAP else '-'
+        if kind == _SCALAR or not value:
+            inline = _yaml_scalar(value) if kind == _SCALAR else '{}' if kind == _MAP else '[]'
+            yield (prefix + ' ' + inline if kinds else inline) + '\n'
+            if kind != _SCALAR:
+                next(events)
+            continue
+        if kinds:
+            yield prefix + '\n'
+        kinds.append(kind)
+
+
+def write_json(data: Any, stream: IO[str], reveal: bool = False, message: Optional[str] = None,
+               indent: Optional[int] = None) -> None:
+    """
+    Write a config to a text stream as JSON, masking secrets unless `reveal` is True.
+
+    Args:
+        data: The config to write.
+        stream: The text stream, e.g. an open file or `sys.stdout`.
+        reveal: If True, secrets are written with their original values.
+        message: Message replacing every secret instead of the message of each Secure value.
+        indent: Number of spaces per nesting level, or None for a single line.
+    """
+    stream.writelines(iter_json(data, reveal, message, indent))
+
+
+def write_yaml(data: Any, stream: IO[str], reveal: bool = False, message: Optional[str] = None,
+               indent: int = 2) -> None:
+    """
+    Write a config to a text stream as block-style YAML, masking secrets unless `reveal` is True.
+
+    Args:
+        data: The config to write.
+        stream: The text stream, e.g. an open file or `sys.stdout`.
+        reveal: If True, secrets are written with their original values.
+        message: Message replacing every secret instead of the message of each Secure value.
+        indent: Number of spaces per nesting level.
+    """
+    stream.writelines(iter_yaml(data, reveal, message, indent))
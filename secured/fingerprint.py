@@ -0,0 +1,233 @@
+import hashlib
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Tuple
+
+from .encryption import EncryptedSecure
+from .secure import Secure
+from .snapshot import Path, _keys
+
+_MISSING = object()
+
+
+class Fingerprints:
+    """
+    Merkle-style content hashes of config subtrees, by key path.
+
+    Every mapping and every value below a mapping gets a BLAKE2b digest computed over its plaintext, so two
+    configs with the same content get the same digests whether or not they are secured, and the digests never
+    reveal the values. Encrypted values are hashed by their ciphertext, so fingerprinting never decrypts them.
+    A mapping digest is derived from the sum of its keyed child digests, which makes updates incremental: setting
+    or deleting a path hashes only the new subtree, then adjusts each ancestor in constant time. Lists are hashed
+    as a whole, like `diff_trees` compares them.
+
+    Since weak secrets could be guessed from an unkeyed digest, pass a `key` when fingerprints leave the process;
+    configs fingerprinted on different nodes can only be compared when they use the same key.
+
+    Attributes:
+        key (bytes): Secret key of the BLAKE2b hashes, up to 64 bytes; empty for unkeyed hashes.
+        digest_size (int): Size of the digests in bytes, up to 64.
+
+    Examples:
+        >>> fingerprints = Fingerprints()
+        >>> fingerprints.set('config', {'db': {'host': 'a.local', 'port': 5432}})
+        >>> other = Fingerprints()
+        >>> other.set('config', {'db': {'host': 'b.local', 'port': 5432}})
+        >>> fingerprints.diff(other)
+        [('config', 'db', 'host')]
+    """
+
+    def __init__(self, key: bytes = b'', digest_size: int = 32) -> None:
+        self.key = key
+        self.digest_size = digest_size
+        self._modulus = 1 << (8 * digest_size)
+        self._sums: Dict[Tuple[Any, ...], int] = {(): 0}
+        self._children: Dict[Tuple[Any, ...], Dict[Any, None]] = {(): {}}
+        self._digests: Dict[Tuple[Any, ...], bytes] = {(): self._mapping_digest(0)}
+
+    def __contains__(self, path: Path) -> bool:
+        return _keys(path) in self._digests
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def _hash(self, *parts: bytes) -> bytes:
+        """Hash the concatenation of `parts` with the key and digest size of these fingerprints."""
+        return hashlib.blake2b(b''.join(parts), digest_size=self.digest_size, key=self.key).digest()
+
+    def _term(self, key: Any, digest: bytes) -> int:
+        """The contribution of a child to the digest of its mapping."""
+        return int.from_bytes(self._hash(b'K', repr(key).encode('utf-8'), b'\0', digest), 'big')
+
+    def _mapping_digest(self, total: int) -> bytes:
+        """The digest of a mapping whose child terms add up to `total`."""
+        return self._hash(b'M', total.to_bytes(self.digest_size, 'big'))
+
+    def _leaf_digest(self, value: Any) -> bytes:
+        """The digest of a value that is neither a mapping nor a list."""
+        return self._hash(b'L', type(value).__name__.encode('utf-8'), b':', repr(value).encode('utf-8'))
+
+    def _build(self, root: Tuple[Any, ...], data: Any) -> bytes:
+        """
+        Hash `data` bottom-up without recursion, storing the digests of its mappings and their values.
+
+        Args:
+            root: Key path of `data`.
+            data: The subtree to hash.
+
+        Returns:
+            The digest of `data`.
+        """
+        results: List[bytes] = []
+        # Frames are (path, node, store, ready): `store` is False below lists, whose items get no path entries,
+        # and `ready` marks the second visit of a container, once the digests of its children are computed.
+        stack: List[Tuple[Tuple[Any, ...], Any, bool, bool]] = [(root, data, True, False)]
+        while stack:
+            path, node, store, ready = stack.pop()
+            if isinstance(node, EncryptedSecure):
+                node = _Token(str.__str__(node))
+            elif isinstance(node, Secure):
+                node = node._get_original()
+            if isinstance(node, Mapping):
+                items = list(dict.items(node) if isinstance(node, dict) else node.items())
+                if not ready:
+                    stack.append((path, node, store, True))
+                    stack.extend((path + (key,), value, store, False) for key, value in reversed(items))
+                    continue
+                children = results[len(results) - len(items):]
+                del results[len(results) - len(items):]
+                total = sum(self._term(key, digest) for (key, _), digest in zip(items, children)) % self._modulus
+                digest = self._mapping_digest(total)
+                if store:
+                    self._sums[path] = total
+                    self._children[path] = dict.fromkeys(key for key, _ in items)
+            elif isinstance(node, (list, tuple)):
+                if not ready:
+                    stack.append((path, node, store, True))
+                    stack.extend((path + (index,), node[index], False, False) for index in reversed(range(len(node))))
+                    continue
+                children = results[len(results) - len(node):]
+                del results[len(results) - len(node):]
+                digest = self._hash(b'S', *children)
+            else:
+                digest = self._leaf_digest(node)
+            if store:
+                self._digests[path] = digest
+            results.append(digest)
+        return results[0]
+
+    def _discard(self, root: Tuple[Any, ...]) -> None:
+        """Forget the digests of a subtree, without updating its ancestors."""
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            self._digests.pop(path, None)
+            self._sums.pop(path, None)
+            children = self._children.pop(path, None)
+            if children:
+                stack.extend(path + (key,) for key in children)
+
+    def _propagate(self, path: Tuple[Any, ...], old: Optional[bytes], new: Optional[bytes]) -> None:
+        """
+        Update the digests of the ancestors of `path` after its digest changed from `old` to `new`.
+
+        Each ancestor takes constant time: the old term of the changed child is subtracted from its sum and
+        the new one added, and propagation stops as soon as a digest is unchanged.
+        """
+        while path and old != new:
+            parent, key = path[:-1], path[-1]
+            total = self._sums[parent]
+            if old is not None:
+                total -= self._term(key, old)
+            if new is not None:
+                total += self._term(key, new)
+            total %= self._modulus
+            self._sums[parent] = total
+            old, new = self._digests[parent], self._mapping_digest(total)
+            self._digests[parent] = new
+            path = parent
+
+    def set(self, path: Path, value: Any) -> None:
+        """
+        Hash `value` as the new content of `path` and update the digests of its ancestors.
+
+        Args:
+            path: Dotted path or tuple of keys; its parent must be a fingerprinted mapping.
+            value: The new value, parsed or converted, e.g. an AttrDict.
+
+        Raises:
+            KeyError: If the parent of `path` is not a fingerprinted mapping.
+        """
+        keys = _keys(path)
+        if not keys:
+            raise ValueError("Cannot replace the root of the fingerprints.")
+        children = self._children.get(keys[:-1])
+        if children is None:
+            raise KeyError(keys[:-1])
+        old = self._digests.get(keys)
+        self._discard(keys)
+        children[keys[-1]] = None
+        self._propagate(keys, old, self._build(keys, value))
+
+    def delete(self, path: Path) -> None:
+        """
+        Forget the digests of `path` and everything below it, updating the digests of its ancestors.
+
+        Args:
+            path: Dotted path or tuple of keys.
+
+        Raises:
+            KeyError: If the path is not fingerprinted.
+        """
+        keys = _keys(path)
+        if not keys or keys not in self._digests:
+            raise KeyError(keys)
+        old = self._digests[keys]
+        self._discard(keys)
+        self._children[keys[:-1]].pop(keys[-1], None)
+        self._propagate(keys, old, None)
+
+    def get(self, path: Path = (), default: Any = None) -> Any:
+        """
+        Return the hexadecimal digest of a path.
+
+        Args:
+            path: Dotted path or tuple of keys; the empty default is the digest of everything.
+            default: Value returned when the path is not fingerprinted.
+        """
+        digest = self._digests.get(_keys(path) if path else (), _MISSING)
+        return default if digest is _MISSING else digest.hex()  # type: ignore[union-attr]
+
+    def diff(self, other: 'Fingerprints', path: Path = ()) -> List[Tuple[Any, ...]]:
+        """
+        Compute the key paths at which two fingerprinted configs differ, like `diff_trees`.
+
+        Only subtrees whose digests differ are descended into, so the time depends on the size of the changed
+        region rather than the size of the configs. Both fingerprints must use the same key and digest size.
+
+        Args:
+            other: The fingerprints to compare with.
+            path: Dotted path or tuple of keys of the subtree to compare; everything by default.
+
+        Returns:
+            The key paths, as tuples, of the smallest subtrees that changed.
+        """
+        changes: List[Tuple[Any, ...]] = []
+        stack = [_keys(path) if path else ()]
+        while stack:
+            keys = stack.pop()
+            digest, other_digest = self._digests.get(keys), other._digests.get(keys)
+            if digest == other_digest:
+                continue
+            children, other_children = self._children.get(keys), other._children.get(keys)
+            if digest is None or other_digest is None or children is None or other_children is None:
+                changes.append(keys)
+                continue
+            names = list(children) + [key for key in other_children if key not in children]
+            stack.extend(keys + (key,) for key in reversed(names))
+        return changes
+
+
+class _Token(str):
+    """The ciphertext of an encrypted value, hashed under its own type name so it never equals a plaintext."""
+
+    __slots__ = ()
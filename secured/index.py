@@ -0,0 +1,151 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .attribute import AttrDict
+from .snapshot import FrozenAttrDict
+
+_MISSING = object()
+
+
+class PathIndex:
+    """
+    A flat index from dotted key paths to the values of loaded configs.
+
+    Every mapping and leaf gets an entry such as `config.databases.db3.connection.host`, so a lookup is a single
+    dictionary access no matter how deep the value sits. Indexed `AttrDict` nodes report assignments and
+    deletions back to the index, which then re-indexes only the affected subtree. Lazy `AttrDict` nodes are not
+    descended into upfront, nor are other mappings such as shared configs; paths below them are resolved on first
+    lookup and cached from then on. Immutable FrozenAttrDict snapshots are indexed the same way and updated with
+    `set` when a new snapshot is published.
+
+    Attributes:
+        listener (Optional[Callable[[str, Any], None]]): Called with the dotted path and the new value, or
+            `_MISSING` for a deletion, after an indexed AttrDict node was assigned or deleted.
+
+    Examples:
+        >>> index = PathIndex()
+        >>> index.add('config', AttrDict({'db': {'host': 'localhost'}}))
+        >>> index.get('config.db.host')
+        'localhost'
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: Dict[str, Any] = {}
+        self._prefixes: Dict[int, str] = {}
+        self.listener: Optional[Callable[[str, Any], None]] = None
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, prefix: str, node: Any) -> None:
+        """
+        Index `node` and, unless it is lazy, everything below it.
+
+        Args:
+            prefix: Dotted path of `node`.
+            node: The value to index.
+        """
+        stack: List[Tuple[str, Any]] = [(prefix, node)]
+        while stack:
+            path, value = stack.pop()
+            self._entries[path] = value
+            if isinstance(value, FrozenAttrDict):
+                stack.extend((f"{path}.{key}", child) for key, child in value.items())
+                continue
+            if not isinstance(value, dict):
+                continue
+            if isinstance(value, AttrDict):
+                value._observer = self._on_set
+                self._prefixes[id(value)] = path
+                if value.lazy:
+                    continue
+            stack.extend((f"{path}.{key}", child) for key, child in dict.items(value))
+
+    def set(self, path: str, value: Any) -> None:
+        """
+        Replace the entry of a single path, without touching the paths below it.
+
+        Args:
+            path: Dotted path.
+            value: The new value.
+        """
+        self._entries[path] = value
+
+    def discard(self, prefix: str) -> None:
+        """
+        Remove `prefix` and every path below it from the index.
+
+        Args:
+            prefix: Dotted path of the subtree to remove.
+        """
+        below = prefix + '.'
+        for path in [path for path in self._entries if path == prefix or path.startswith(below)]:
+            value = self._entries.pop(path)
+            if isinstance(value, AttrDict) and self._prefixes.pop(id(value), None) is not None:
+                value._observer = None
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """
+        Return the value at a dotted path.
+
+        Args:
+            path: Dotted key path, starting with the config name.
+            default: Value returned when the path does not exist.
+
+        Returns:
+            The indexed value, or `default`.
+        """
+        try:
+            return self._entries[path]
+        except KeyError:
+            return self._resolve(path, default)
+
+    def _resolve(self, path: str, default: Any) -> Any:
+        """
+        Resolve a path that is not indexed yet by walking down from its deepest indexed ancestor.
+
+        Args:
+            path: Dotted key path.
+            default: Value returned when the path does not exist.
+
+        Returns:
+            The value found, which is indexed for later lookups, or `default`.
+        """
+        keys = path.split('.')
+        for depth in range(len(keys) - 1, 0, -1):
+            ancestor = '.'.join(keys[:depth])
+            if ancestor in self._entries:
+                break
+        else:
+            return default
+        node = self._entries[ancestor]
+        for key in keys[depth:]:
+            if not isinstance(node, Mapping) or key not in node:
+                return default
+            node = node[key]
+            ancestor = f"{ancestor}.{key}"
+            self.add(ancestor, node)
+        return node
+
+    def _on_set(self, node: AttrDict, key: Any) -> None:
+        """
+        Re-index a single key after it was assigned or deleted on an indexed node.
+
+        Args:
+            node: The node that changed.
+            key: The key that was assigned or deleted.
+        """
+        prefix = self._prefixes.get(id(node))
+        if prefix is None:
+            return
+        path = f"{prefix}.{key}"
+        self.discard(path)
+        value = dict.__getitem__(node, key) if key in node else _MISSING
+        if value is not _MISSING:
+            self.add(path, value)
+        if self.listener is not None:
+            self.listener(path, value)
@@ -0,0 +1,122 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class FileStats:
+    """
+    Timings and counts collected while loading one file.
+
+    Attributes:
+        path (str): Path of the file.
+        read (float): Seconds spent reading the file, or loading it from the parsed-config cache.
+        parse (float): Seconds spent parsing the YAML (zero on a cache hit).
+        convert (float): Seconds spent applying the schema and building the config, Secure wrapping included.
+        secure (float): Part of `convert` spent creating Secure values.
+        bytes_read (int): Size of the file in bytes.
+        nodes (int): Number of AttrDict nodes created.
+        leaves (int): Number of leaf values converted.
+        secured (int): Number of Secure values created.
+    """
+
+    __slots__ = ('path', 'read', 'parse', 'convert', 'secure', 'bytes_read', 'nodes', 'leaves', 'secured')
+
+    def __init__(self, path: str, read: float = 0.0, parse: float = 0.0, bytes_read: int = 0) -> None:
+        self.path = path
+        self.read = read
+        self.parse = parse
+        self.bytes_read = bytes_read
+        self.convert = 0.0
+        self.secure = 0.0
+        self.nodes = 0
+        self.leaves = 0
+        self.secured = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class LoadStats:
+    """
+    Opt-in instrumentation of Secured loading and, optionally, of config usage.
+
+    Pass an instance (or `stats=True`) to `Secured` to collect per-file read/parse/convert timings, bytes read,
+    and node, leaf and Secure counts. With `count_usage=True`, item and attribute accesses on the loaded
+    AttrDicts and `Secured.compose` calls are counted as well. Totals are kept across files, including values
+    converted later by lazy configs. When no stats object is attached, the instrumented code paths only pay a
+    check against None.
+
+    Counters are updated without locking, so totals may be slightly off when configs are used from several
+    threads at once.
+
+    Attributes:
+        files (List[FileStats]): Statistics of each loaded file, in load order.
+        nodes (int): Total AttrDict nodes created.
+        leaves (int): Total leaf values converted.
+        secured (int): Total Secure values created.
+        secure_seconds (float): Total seconds spent creating Secure values.
+        accesses (int): AttrDict item and attribute reads, when `count_usage` is enabled.
+        compositions (int): `Secured.compose` calls, when `count_usage` is enabled.
+
+    Examples:
+        >>> stats = LoadStats(callback=lambda file: metrics.send(file.as_dict()))
+        >>> secured = Secured('config.yaml', stats=stats)
+        >>> stats.as_dict()['files'][0]['parse']
+        0.0012
+    """
+
+    def __init__(self, count_usage: bool = False, callback: Optional[Callable[[FileStats], Any]] = None) -> None:
+        """
+        Initialize empty statistics.
+
+        Args:
+            count_usage: If True, also count accesses and compositions.
+            callback: Called with the FileStats of each file once it is loaded.
+        """
+        self.count_usage = count_usage
+        self.callback = callback
+        self.files: List[FileStats] = []
+        self.nodes = 0
+        self.leaves = 0
+        self.secured = 0
+        self.secure_seconds = 0.0
+        self.accesses = 0
+        self.compositions = 0
+
+    @contextmanager
+    def track_file(self, path: str, timings: Dict[str, Any]) -> Iterator[FileStats]:
+        """
+        Attribute the conversion work done inside the block to a file.
+
+        Args:
+            path: Path of the file.
+            timings: Read/parse timings and byte count returned by `read_yaml_timed`.
+
+        Yields:
+            FileStats: The statistics of the file, completed when the block exits successfully.
+        """
+        file_stats = FileStats(path, timings['read'], timings['parse'], timings['bytes'])
+        nodes, leaves, secured, secure_seconds = self.nodes, self.leaves, self.secured, self.secure_seconds
+        start = time.perf_counter()
+        yield file_stats
+        file_stats.convert = time.perf_counter() - start
+        file_stats.nodes = self.nodes - nodes
+        file_stats.leaves = self.leaves - leaves
+        file_stats.secured = self.secured - secured
+        file_stats.secure = self.secure_seconds - secure_seconds
+        self.files.append(file_stats)
+        if self.callback is not None:
+            self.callback(file_stats)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return every statistic as plain dictionaries and lists, ready to forward to a metrics system."""
+        return {
+            'files': [file_stats.as_dict() for file_stats in self.files],
+            'nodes': self.nodes,
+            'leaves': self.leaves,
+            'secured': self.secured,
+            'secure_seconds': self.secure_seconds,
+            'accesses': self.accesses,
+            'compositions': self.compositions,
+        }
@@ -0,0 +1,265 @@
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .cache import ConfigCache
+from .loader import nest_keys, read_config
+from .watcher import _stat_signature, diff_trees
+
+_MISSING = object()
+_SHADOWED = object()
+
+
+class FileLayer:
+    """
+    A layer read from a YAML, JSON, TOML or `.env` file, the format following the file name.
+
+    Attributes:
+        path (str): Path of the file.
+        optional (bool): If True, a missing file is an empty layer instead of an error.
+    """
+
+    __slots__ = ('path', 'optional')
+
+    def __init__(self, path: str | Path, optional: bool = False) -> None:
+        self.path = str(path)
+        self.optional = optional
+
+    def signature(self) -> Any:
+        """Return the size and modification time of the file, which change when it must be read again."""
+        return _stat_signature(Path(self.path))
+
+    def read(self, cache: Optional[ConfigCache] = None) -> Any:
+        """
+        Read and parse the file.
+
+        Args:
+            cache: Optional cache of parsed files.
+
+        Raises:
+            FileNotFoundError: If the file does not exist and the layer is not optional.
+        """
+        try:
+            return read_config(self.path, cache)
+        except FileNotFoundError:
+            if self.optional:
+                return {}
+            raise
+
+    def __repr__(self) -> str:
+        return self.path
+
+
+class EnvLayer:
+    """
+    A layer read from the environment variables starting with a prefix, e.g. `APP__DATABASES__DB3__HOST`.
+
+    Variable names are lowercased and split on the separator like `nest_keys`; values are kept as strings.
+
+    Attributes:
+        prefix (str): Prefix of the variables, without the separator.
+        separator (str): Separator between key levels.
+        environ (Mapping[str, str]): The variables to read, `os.environ` by default.
+    """
+
+    __slots__ = ('prefix', 'separator', 'environ')
+
+    def __init__(self, prefix: str, separator: str = '__', environ: Optional[Mapping[str, str]] = None) -> None:
+        self.prefix = prefix
+        self.separator = separator
+        self.environ = os.environ if environ is None else environ
+
+    def signature(self) -> Any:
+        """Return the matching variables, which change when the layer must be read again."""
+        start = self.prefix + self.separator
+        return tuple(sorted(item for item in self.environ.items() if item[0].startswith(start)))
+
+    def read(self, cache: Optional[ConfigCache] = None) -> Any:
+        """
+        Collect the matching variables into a tree.
+
+        Args:
+            cache: Unused, accepted for symmetry with FileLayer.
+        """
+        return nest_keys(self.signature(), self.separator, self.prefix)
+
+    def __repr__(self) -> str:
+        return f"{self.prefix}{self.separator}*"
+
+
+Layer = Union[FileLayer, EnvLayer]
+
+
+def merge_trees(base: Any, override: Any) -> Any:
+    """
+    Deep-merge two parsed trees without modifying them.
+
+    Mappings are merged key by key; any other value in `override` replaces the one in `base`. Unchanged subtrees
+    of either side are shared with the result.
+
+    Args:
+        base: The lower-precedence tree.
+        override: The higher-precedence tree.
+
+    Returns:
+        The merged tree.
+
+    Examples:
+        >>> merge_trees({'db': {'host': 'a', 'port': 1}}, {'db': {'host': 'b'}})
+        {'db': {'host': 'b', 'port': 1}}
+    """
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = merge_trees(merged[key], value) if key in merged else value
+    return merged
+
+
+def _replace(tree: Any, path: Tuple[Any, ...], value: Any) -> Any:
+    """
+    Return a copy of `tree` with the value at `path` replaced, or removed when `value` is `_MISSING`.
+
+    Only the mappings along the path are copied, so the rest of the tree is shared with the original.
+    """
+    if not path:
+        return {} if value is _MISSING else value
+    key, rest = path[0], path[1:]
+    if not isinstance(tree, dict):
+        if value is _MISSING:
+            return tree
+        tree = {}
+    copy = dict(tree)
+    if rest:
+        child = tree.get(key, _MISSING)
+        if value is _MISSING and not isinstance(child, dict):
+            return tree
+        copy[key] = _replace({} if child is _MISSING else child, rest, value)
+    elif value is _MISSING:
+        if key not in copy:
+            return tree
+        del copy[key]
+    else:
+        copy[key] = value
+    return copy
+
+
+class LayeredConfig:
+    """
+    A single tree merged from several layers, later layers taking precedence over earlier ones.
+
+    Mappings are merged key by key across layers, while any other value replaces whatever the lower layers have
+    at that path, including whole subtrees. The merged tree is computed once; on `refresh` only the layers whose
+    files or variables changed are read again, and only the paths that changed inside them are merged again.
+    Merged trees are never modified: each refresh produces a new tree sharing every unchanged subtree with the
+    previous one.
+
+    Examples:
+        >>> layered = LayeredConfig(['base.yaml', 'production.toml', FileLayer('.env', optional=True),
+        ...                          EnvLayer('APP')])
+        >>> layered.load()['databases']['db3']['host']
+        'db3.internal'
+
+    Attributes:
+        layers (List[Layer]): The layers, from lowest to highest precedence.
+        cache (ConfigCache | None): Optional cache of parsed files.
+        data (Any): The merged tree.
+    """
+
+    def __init__(self, layers: Sequence[Layer | str | Path], cache: Optional[ConfigCache] = None) -> None:
+        """
+        Args:
+            layers: Layers from lowest to highest precedence; paths are turned into FileLayer objects.
+            cache: Optional cache of parsed files.
+        """
+        self.layers: List[Layer] = [layer if isinstance(layer, (FileLayer, EnvLayer)) else FileLayer(layer)
+                                    for layer in layers]
+        self.cache = cache
+        self.data: Any = {}
+        self._signatures: List[Any] = [None] * len(self.layers)
+        self._trees: List[Any] = [{} for _ in self.layers]
+
+    def __repr__(self) -> str:
+        return ', '.join(repr(layer) for layer in self.layers)
+
+    def paths(self) -> List[str]:
+        """Return the paths of the file layers."""
+        return [layer.path for layer in self.layers if isinstance(layer, FileLayer)]
+
+    def _read(self, index: int) -> Tuple[Any, Any]:
+        """Return the current signature and parsed tree of a layer, an empty document counting as empty."""
+        layer = self.layers[index]
+        signature = layer.signature()
+        tree = layer.read(self.cache)
+        return signature, {} if tree is None else tree
+
+    def load(self) -> Any:
+        """
+        Read every layer and merge them.
+
+        Returns:
+            The merged tree.
+        """
+        results = [self._read(index) for index in range(len(self.layers))]
+        self._signatures = [signature for signature, _ in results]
+        self._trees = [tree for _, tree in results]
+        data: Any = {}
+        for tree in self._trees:
+            data = merge_trees(data, tree)
+        self.data = data
+        return data
+
+    def stale(self) -> List[int]:
+        """Return the indexes of the layers whose files or variables changed since they were last read."""
+        return [index for index, layer in enumerate(self.layers) if layer.signature() != self._signatures[index]]
+
+    def refresh(self, force: bool = False) -> Any:
+        """
+        Read the changed layers again and merge the paths that changed in them.
+
+        Every changed layer is read before anything is merged, so an error leaves the merged tree as it was.
+
+        Args:
+            force: If True, read every layer again.
+
+        Returns:
+            The merged tree, the same object as before when nothing changed.
+        """
+        stale = range(len(self.layers)) if force else self.stale()
+        results = {index: self._read(index) for index in stale}
+        changes = set()
+        for index, (signature, tree) in results.items():
+            changes.update(diff_trees(self._trees[index], tree))
+            self._signatures[index] = signature
+            self._trees[index] = tree
+        data = self.data
+        merged: List[Tuple[Any, ...]] = []
+        for path in sorted(changes, key=len):
+            if not any(path[:len(parent)] == parent for parent in merged):
+                data = _replace(data, path, self._merged_at(path))
+                merged.append(path)
+        self.data = data
+        return data
+
+    def _merged_at(self, path: Tuple[Any, ...]) -> Any:
+        """
+        Merge the value every layer has at a path, or return `_MISSING` when the merged tree has none.
+
+        Args:
+            path: Key path in the merged tree.
+        """
+        value: Any = _MISSING
+        for tree in self._trees:
+            node = tree
+            for key in path:
+                if not isinstance(node, dict):
+                    node = _SHADOWED
+                    break
+                node = node.get(key, _MISSING)
+                if node is _MISSING:
+                    break
+            if node is _SHADOWED:
+                value = _MISSING
+            elif node is not _MISSING:
+                value = merge_trees(value, node) if isinstance(value, dict) else node
+        return value
@@ -0,0 +1,297 @@
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .cache import ConfigCache
+from .encryption import Ciphertext
+from .providers import SecretReference
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10
+    try:
+        import tomli as tomllib  # type: ignore
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore
+
+_loader: Any = None
+
+
+class _YAMLNotLoaded(Exception):
+    """Stands in for `yaml.YAMLError` while PyYAML is not imported; never raised."""
+
+
+def _config_loader() -> Any:
+    """
+    Return the loader used by `safe_load`, importing PyYAML and creating the loader the first time.
+
+    The loader is the libyaml-backed `CSafeLoader` when PyYAML was built with it, and the pure-Python
+    `SafeLoader` otherwise, extended to construct `!secret` values as SecretReference and `!encrypted` ones as
+    Ciphertext.
+    """
+    global _loader
+    if _loader is None:
+        import yaml  # type: ignore
+
+        class ConfigLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):  # type: ignore
+            """The safe loader, also constructing `!secret` values as SecretReference and `!encrypted` ones as Ciphertext."""
+
+        ConfigLoader.add_constructor('!secret', lambda loader, node: SecretReference.parse(loader.construct_scalar(node)))
+        ConfigLoader.add_constructor('!encrypted', lambda loader, node: Ciphertext(loader.construct_scalar(node).strip()))
+        _loader = ConfigLoader
+    return _loader
+
+
+def __getattr__(name: str) -> Any:
+    """Create `SafeLoader` and `ConfigLoader` on first access, so importing this module does not import PyYAML."""
+    if name == 'ConfigLoader':
+        return _config_loader()
+    if name == 'SafeLoader':
+        return _config_loader().__bases__[0]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def yaml_error() -> type:
+    """
+    Return `yaml.YAMLError`, without importing PyYAML when nothing has imported it yet.
+
+    Meant for `except yaml_error():` clauses: until PyYAML is imported no YAML error can be raised, so a
+    stand-in exception class that is never raised is returned instead.
+    """
+    yaml = sys.modules.get('yaml')
+    return yaml.YAMLError if yaml is not None else _YAMLNotLoaded
+
+
+_DOTENV_LINE = re.compile(r'''^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_.]*)\s*=\s*'''
+                          r'''(?:"((?:[^"\\]|\\.)*)"|'([^']*)'|(.*?))(?:\s+#.*)?\s*$''')
+_DOTENV_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '"': '"', '\\': '\\'}
+
+
+def safe_load(stream: Any) -> Any:
+    """
+    Parse a YAML document with the libyaml-backed `CSafeLoader` when PyYAML was built with it.
+
+    Falls back to the pure-Python `SafeLoader` otherwise. Both loaders only construct standard Python objects,
+    plus SecretReference objects for values tagged `!secret` and Ciphertext objects for values tagged
+    `!encrypted`.
+
+    Args:
+        stream: A string, bytes or file object containing the YAML document.
+
+    Returns:
+        The parsed document.
+    """
+    import yaml  # type: ignore
+
+    return yaml.load(stream, Loader=_config_loader())
+
+
+def read_yaml(path: str, cache: Optional[ConfigCache] = None) -> Any:
+    """
+    Read and parse a single YAML file, going through the parsed-config cache when one is given.
+
+    This is a module-level function so it can be submitted to both thread and process pools.
+
+    Args:
+        path: Path to the YAML file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The parsed YAML content.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    if cache is not None:
+        return cache.load(path, safe_load)
+    with open(path, 'r') as file:
+        return safe_load(file)
+
+
+def read_yaml_timed(path: str, cache: Optional[ConfigCache] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Read and parse a single YAML file like `read_yaml`, timing the read and the parse separately.
+
+    On the cached path, loading the entry (or parsing on a miss) is reported as the read time.
+
+    Args:
+        path: Path to the YAML file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The parsed YAML content and a dictionary with the `read` and `parse` seconds and the `bytes` read.
+    """
+    start = time.perf_counter()
+    if cache is not None:
+        data = cache.load(path, safe_load)
+        return data, {'read': time.perf_counter() - start, 'parse': 0.0, 'bytes': os.path.getsize(path)}
+    with open(path, 'rb') as file:
+        content = file.read()
+    read = time.perf_counter() - start
+    data = safe_load(content)
+    return data, {'read': read, 'parse': time.perf_counter() - start - read, 'bytes': len(content)}
+
+
+def read_json(path: str, cache: Optional[ConfigCache] = None) -> Any:
+    """
+    Read and parse a single JSON file, going through the parsed-config cache when one is given.
+
+    Args:
+        path: Path to the JSON file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The parsed JSON content.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not valid JSON.
+    """
+    if cache is not None:
+        return cache.load(path, json.loads)
+    with open(path, 'rb') as file:
+        return json.loads(file.read())
+
+
+def read_toml(path: str, cache: Optional[ConfigCache] = None) -> Any:
+    """
+    Read and parse a single TOML file with `tomllib`, or the `tomli` backport on Python 3.10.
+
+    Args:
+        path: Path to the TOML file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The parsed TOML content.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not valid TOML.
+        ImportError: If neither `tomllib` nor `tomli` is available.
+    """
+    if tomllib is None:
+        raise ImportError("Reading TOML files on Python 3.10 requires the 'tomli' package.")
+    parse = lambda content: tomllib.loads(content.decode('utf-8'))  # noqa: E731
+    if cache is not None:
+        return cache.load(path, parse)
+    with open(path, 'rb') as file:
+        return parse(file.read())
+
+
+def parse_dotenv(content: str) -> Dict[str, str]:
+    """
+    Parse the `KEY=value` lines of a `.env` file.
+
+    Blank lines, comments and an `export` prefix are ignored. Values may be single-quoted (taken literally),
+    double-quoted (supporting `\\n`, `\\t`, `\\r`, `\\"` and `\\\\` escapes) or unquoted, in which case a trailing
+    ` # comment` is dropped.
+
+    Args:
+        content: The content of the file.
+
+    Returns:
+        The variables in the order they appear.
+
+    Raises:
+        ValueError: If a line is not a valid assignment.
+    """
+    variables: Dict[str, str] = {}
+    for number, line in enumerate(content.splitlines(), 1):
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        match = _DOTENV_LINE.match(line)
+        if match is None:
+            raise ValueError(f"Invalid .env line {number}: {line!r}")
+        key, double, single, bare = match.groups()
+        if double is not None:
+            variables[key] = re.sub(r'\\(.)', lambda escape: _DOTENV_ESCAPES.get(escape[1], escape[0]), double)
+        else:
+            variables[key] = single if single is not None else bare
+    return variables
+
+
+def nest_keys(items: Iterable[Tuple[str, Any]], separator: str = '__', prefix: str = '') -> Dict[str, Any]:
+    """
+    Build a tree from flat variable names, e.g. `APP__DATABASES__DB3__HOST` into `databases.db3.host`.
+
+    Names are lowercased and split on `separator` after removing `prefix` and the separator following it. Names
+    without the prefix are skipped. When a name is both a value and the parent of other names, the later one wins.
+
+    Args:
+        items: `(name, value)` pairs, e.g. `os.environ.items()`.
+        separator: Separator between key levels.
+        prefix: Prefix the names must start with, or an empty string to keep every name.
+
+    Returns:
+        The nested tree.
+
+    Examples:
+        >>> nest_keys([('APP__DB__HOST', 'db.local'), ('OTHER', '1')], prefix='APP')
+        {'db': {'host': 'db.local'}}
+    """
+    start = prefix + separator if prefix else ''
+    tree: Dict[str, Any] = {}
+    for name, value in items:
+        if not name.startswith(start) or len(name) == len(start):
+            continue
+        *parents, leaf = name[len(start):].lower().split(separator)
+        node = tree
+        for key in parents:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = node[key] = {}
+            node = child
+        node[leaf] = value
+    return tree
+
+
+def read_dotenv(path: str, cache: Optional[ConfigCache] = None) -> Any:
+    """
+    Read a `.env` file into a tree, splitting variable names on `__` like `nest_keys`.
+
+    Args:
+        path: Path to the `.env` file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The nested variables, with string values.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If a line is not a valid assignment.
+    """
+    parse = lambda content: nest_keys(parse_dotenv(content.decode('utf-8')).items())  # noqa: E731
+    if cache is not None:
+        return cache.load(path, parse)
+    with open(path, 'rb') as file:
+        return parse(file.read())
+
+
+def read_config(path: str, cache: Optional[ConfigCache] = None) -> Any:
+    """
+    Read and parse a configuration file, choosing the format from its name.
+
+    `.json` files are read as JSON, `.toml` files as TOML, `.env` files (including names such as `.env.local`
+    or `prod.env`) as dotenv files, and anything else as YAML.
+
+    Args:
+        path: Path to the file.
+        cache: Optional cache of parsed files.
+
+    Returns:
+        The parsed content.
+    """
+    name = Path(path).name
+    suffix = Path(path).suffix.lower()
+    if suffix == '.json':
+        return read_json(path, cache)
+    if suffix == '.toml':
+        return read_toml(path, cache)
+    if suffix == '.env' or name == '.env' or name.startswith('.env.'):
+        return read_dotenv(path, cache)
+    return read_yaml(path, cache)
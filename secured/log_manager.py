@@ -1,4 +1,12 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+from typing import Optional, Sequence
+
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+OVERFLOW_POLICIES = ('drop_new', 'drop_oldest')
+
 
 def setup_default_logger() -> logging.Logger:
     """
@@ -22,7 +30,118 @@ def setup_default_logger() -> logging.Logger:
     logger.setLevel(logging.INFO)
     if not logger.handlers:
         ch = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        formatter = logging.Formatter(DEFAULT_FORMAT)
         ch.setFormatter(formatter)
         logger.addHandler(ch)
     return logger
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    A handler that never blocks the logging thread: records go into a bounded queue and are written out by a
+    background listener thread.
+
+    Filters attached to this handler, such as a RedactingFilter, run in the logging thread before the record is
+    queued, so secrets are removed before the record reaches any output. When the queue is full, the `overflow`
+    policy either drops the new record (`drop_new`) or evicts the oldest queued one (`drop_oldest`). Dropped
+    records are counted, and a warning with the count is queued as soon as there is room again. Closing the
+    handler, which also happens at interpreter exit, stops the listener after it has written every queued record.
+
+    Attributes:
+        overflow (str): The overflow policy.
+        dropped (int): Number of records dropped so far; approximate when several threads log at once.
+        listener (logging.handlers.QueueListener): The listener writing records to the target handlers.
+
+    Examples:
+        >>> handler = BoundedQueueHandler([logging.FileHandler('app.log')], capacity=1000)
+        >>> logging.getLogger('app').addHandler(handler)
+    """
+
+    def __init__(self, handlers: Sequence[logging.Handler], capacity: int = 10000, overflow: str = 'drop_new') -> None:
+        """
+        Initialize the handler and start its listener thread.
+
+        Args:
+            handlers: Handlers writing the records out, called from the listener thread.
+            capacity: Maximum number of queued records.
+            overflow: `drop_new` or `drop_oldest`.
+
+        Raises:
+            ValueError: If `overflow` is not a known policy or `capacity` is not positive.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}; expected one of {', '.join(OVERFLOW_POLICIES)}.")
+        if capacity < 1:
+            raise ValueError("The queue capacity must be at least 1.")
+        super().__init__(queue.Queue(capacity))
+        self.overflow = overflow
+        self.dropped = 0
+        self._unreported = 0
+        self._closed = False
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.listener.start()
+        atexit.register(self.close)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record without blocking, applying the overflow policy when the queue is full."""
+        try:
+            if self._unreported:
+                notice = logging.LogRecord(record.name, logging.WARNING, __file__, 0,
+                                           "%d log record(s) dropped because the log queue was full",
+                                           (self._unreported,), None)
+                self.queue.put_nowait(notice)
+                self._unreported = 0
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == 'drop_oldest':
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+        self.dropped += 1
+        self._unreported += 1
+
+    def close(self) -> None:
+        """Write every queued record out, stop the listener thread and close the handler."""
+        with self.lock:  # type: ignore[union-attr]
+            closed, self._closed = self._closed, True
+        if not closed:
+            self.listener.stop()
+            atexit.unregister(self.close)
+        super().close()
+
+
+def setup_queue_logger(handlers: Optional[Sequence[logging.Handler]] = None, capacity: int = 10000,
+                       overflow: str = 'drop_new') -> logging.Logger:
+    """
+    Sets up and returns a logger that writes records from a background thread, so logging never blocks on output.
+
+    The logger has a single BoundedQueueHandler and does not propagate, so records are written only by the
+    listener thread. By default the listener writes to the console with the same format as `setup_default_logger`.
+    If the logger is already set up, it is returned unchanged.
+
+    Args:
+        handlers: Handlers writing the records out; a console handler when None.
+        capacity: Maximum number of records waiting to be written.
+        overflow: What to do when the queue is full: `drop_new` or `drop_oldest`.
+
+    Returns:
+        logging.Logger: The queue-backed logger.
+
+    Example:
+        >>> logger = setup_queue_logger(capacity=1000, overflow='drop_oldest')
+        >>> logger.error("Written by the listener thread")
+    """
+    logger = logging.getLogger(f"{__name__}.queue")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        if handlers is None:
+            ch = logging.StreamHandler()
+            ch.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+            handlers = [ch]
+        logger.addHandler(BoundedQueueHandler(handlers, capacity, overflow))
+    return logger
@@ -0,0 +1,347 @@
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .secure import Secure
+
+DEFAULT_PROVIDER = 'default'
+_REFERENCE = re.compile(r'\$\{([A-Za-z_][\w-]*):([^}]+)\}')
+_PROVIDER_PREFIX = re.compile(r'^([A-Za-z_][\w-]*):(.+)$')
+
+
+class SecretError(LookupError):
+    """Raised when secret references cannot be resolved, listing every reference that failed."""
+
+
+class SecretReference:
+    """
+    A reference to a secret held by a provider, as written with `!secret provider:key` or `${provider:key}`.
+
+    Attributes:
+        provider (str): Name of the provider.
+        key (str): Key of the secret in the provider.
+    """
+
+    __slots__ = ('provider', 'key')
+
+    def __init__(self, provider: str, key: str) -> None:
+        self.provider = provider
+        self.key = key
+
+    @classmethod
+    def parse(cls, text: str) -> 'SecretReference':
+        """
+        Parse the value of a `!secret` tag; without a `provider:` prefix the default provider is used.
+
+        Args:
+            text: The tagged value, e.g. `vault:db/password` or `db/password`.
+        """
+        match = _PROVIDER_PREFIX.match(text.strip())
+        return cls(match[1], match[2]) if match else cls(DEFAULT_PROVIDER, text.strip())
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SecretReference) and (self.provider, self.key) == (other.provider, other.key)
+
+    def __hash__(self) -> int:
+        return hash((self.provider, self.key))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return SecretReference, (self.provider, self.key)
+
+    def __repr__(self) -> str:
+        return f"SecretReference({self.provider!r}, {self.key!r})"
+
+
+class SecretProvider:
+    """
+    Base class of secret backends.
+
+    Subclasses implement `fetch_many`, fetching a batch of keys in as few round trips as the backend allows.
+    The resolver splits requests into batches of at most `batch_size` keys and may call `fetch_many` from
+    several threads at once.
+
+    Attributes:
+        batch_size (int): Maximum number of keys requested per `fetch_many` call.
+    """
+
+    batch_size: int = 100
+
+    def fetch_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Fetch several secrets.
+
+        Args:
+            keys: Keys of the secrets.
+
+        Returns:
+            The values by key; keys that do not exist are left out.
+        """
+        raise NotImplementedError
+
+    def fetch(self, key: str) -> Any:
+        """
+        Fetch a single secret.
+
+        Raises:
+            SecretError: If the secret does not exist.
+        """
+        values = self.fetch_many([key])
+        if key not in values:
+            raise SecretError(f"Secret {key!r} not found.")
+        return values[key]
+
+
+class MappingProvider(SecretProvider):
+    """
+    An in-process provider serving secrets from a mapping, e.g. for tests or secrets injected at startup.
+
+    Examples:
+        >>> MappingProvider({'db/password': 'pw'}).fetch('db/password')
+        'pw'
+    """
+
+    def __init__(self, secrets: Mapping[str, Any]) -> None:
+        self.secrets = secrets
+
+    def fetch_many(self, keys: List[str]) -> Dict[str, Any]:
+        return {key: self.secrets[key] for key in keys if key in self.secrets}
+
+
+class FileProvider(SecretProvider):
+    """
+    A provider reading each secret from a file named after its key, like Docker and Kubernetes secret mounts.
+
+    The key `db/password` is read from `<directory>/db/password`; a single trailing newline is removed.
+
+    Attributes:
+        directory (Path): Directory holding the secret files.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def fetch_many(self, keys: List[str]) -> Dict[str, Any]:
+        root = self.directory.resolve()
+        values = {}
+        for key in keys:
+            path = (root / key).resolve()
+            if root not in path.parents or not path.is_file():
+                continue
+            text = path.read_text()
+            values[key] = text[:-1] if text.endswith('\n') else text
+        return values
+
+
+class SecretResolver:
+    """
+    Resolves secret references through named providers, with batching, concurrency and a TTL cache.
+
+    Uncached references are grouped by provider and fetched in batches of the provider's `batch_size`, all
+    batches running concurrently in a thread pool, so resolving hundreds of references costs about one round
+    trip per provider. Values are cached for `ttl` seconds. Once an entry is older than `refresh_after` times the
+    TTL it is still served, but refreshed in the background, so hot references never wait for the backend.
+
+    Attributes:
+        providers (Dict[str, SecretProvider]): The providers by name.
+        ttl (float): Seconds a fetched value is served from the cache.
+        refresh_after (float): Fraction of the TTL after which cached values are refreshed in the background.
+        message (str): Custom message of the resolved Secure values.
+
+    Examples:
+        >>> resolver = SecretResolver({'default': MappingProvider({'db/password': 'pw'})})
+        >>> resolver.resolve_tree({'db': {'password': SecretReference('default', 'db/password')}})
+        {'db': {'password': <Sensitive data secured>}}
+    """
+
+    def __init__(self, providers: Mapping[str, SecretProvider], ttl: float = 300.0, refresh_after: float = 0.8,
+                 max_workers: int = 8, message: str = "<Sensitive data secured>") -> None:
+        self.providers = dict(providers)
+        self.ttl = ttl
+        self.refresh_after = refresh_after
+        self.message = message
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cache: Dict[SecretReference, Tuple[Any, float]] = {}
+        self._refreshing: Set[SecretReference] = set()
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        """Return the thread pool, created on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix='secured-secrets')
+            return self._executor
+
+    def resolve(self, references: Iterable[SecretReference]) -> Dict[SecretReference, Any]:
+        """
+        Resolve references, serving cached values and fetching the others in concurrent batches.
+
+        Args:
+            references: The references to resolve; duplicates are fetched once.
+
+        Returns:
+            The plain values by reference.
+
+        Raises:
+            SecretError: If a provider is unknown, a secret does not exist or a fetch fails.
+        """
+        now = time.monotonic()
+        values: Dict[SecretReference, Any] = {}
+        missing: Set[SecretReference] = set()
+        refresh: Set[SecretReference] = set()
+        with self._lock:
+            for reference in references:
+                if reference in values or reference in missing:
+                    continue
+                entry = self._cache.get(reference)
+                age = now - entry[1] if entry is not None else self.ttl
+                if age >= self.ttl:
+                    missing.add(reference)
+                    continue
+                values[reference] = entry[0]  # type: ignore[index]
+                if age >= self.ttl * self.refresh_after and reference not in self._refreshing:
+                    refresh.add(reference)
+            self._refreshing |= refresh
+        if refresh:
+            self._pool().submit(self._refresh, refresh)
+        if missing:
+            values.update(self._fetch(missing))
+        return values
+
+    def _refresh(self, references: Set[SecretReference]) -> None:
+        """Fetch references again in the background; failures keep the cached values until they expire."""
+        try:
+            self._fetch(references)
+        except SecretError:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing -= references
+
+    def _fetch(self, references: Set[SecretReference]) -> Dict[SecretReference, Any]:
+        """
+        Fetch references from their providers in concurrent batches and cache the values.
+
+        Raises:
+            SecretError: If a provider is unknown, a secret does not exist or a fetch fails.
+        """
+        by_provider: Dict[str, List[str]] = {}
+        for reference in sorted(references, key=lambda reference: (reference.provider, reference.key)):
+            by_provider.setdefault(reference.provider, []).append(reference.key)
+        unknown = sorted(name for name in by_provider if name not in self.providers)
+        if unknown:
+            raise SecretError(f"Unknown secret providers: {', '.join(unknown)}")
+        jobs = [(name, keys[start:start + self.providers[name].batch_size])
+                for name, keys in by_provider.items()
+                for start in range(0, len(keys), self.providers[name].batch_size)]
+        if len(jobs) == 1:
+            future: Future = Future()  # type: ignore[type-arg]
+            try:
+                future.set_result(self.providers[jobs[0][0]].fetch_many(jobs[0][1]))
+            except Exception as e:
+                future.set_exception(e)
+            batches = [(jobs[0][0], future)]
+        else:
+            pool = self._pool()
+            batches = [(name, pool.submit(self.providers[name].fetch_many, keys)) for name, keys in jobs]
+        fetched_at = time.monotonic()
+        values: Dict[SecretReference, Any] = {}
+        errors: List[str] = []
+        for name, future in batches:
+            try:
+                for key, value in future.result().items():
+                    values[SecretReference(name, key)] = value
+            except Exception as e:
+                errors.append(f"provider {name!r} failed: {e}")
+        if not errors:
+            errors = [f"secret {reference.key!r} not found in provider {reference.provider!r}"
+                      for reference in references if reference not in values]
+        if errors:
+            raise SecretError('; '.join(errors))
+        with self._lock:
+            self._cache.update((reference, (value, fetched_at)) for reference, value in values.items())
+        return values
+
+    def resolve_tree(self, data: Any) -> Any:
+        """
+        Replace the secret references of a parsed tree by Secure values, resolving them all in one batch.
+
+        Tagged `!secret` values and strings that are a single `${provider:key}` become Secure values of the
+        secret; strings embedding references among other text become Secure values of the rendered string. Only
+        the containers on the way to a reference are copied, so a tree without references is returned as is.
+
+        Args:
+            data: The parsed tree.
+
+        Returns:
+            The tree with its references resolved.
+
+        Raises:
+            SecretError: If a reference cannot be resolved.
+        """
+        found: List[Tuple[Tuple[Any, ...], Any]] = []
+        stack: List[Tuple[Tuple[Any, ...], Any]] = [((), data)]
+        while stack:
+            path, node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend((path + (key,), value) for key, value in node.items())
+            elif isinstance(node, list):
+                stack.extend((path + (index,), value) for index, value in enumerate(node))
+            elif isinstance(node, SecretReference) or (type(node) is str and '${' in node and _REFERENCE.search(node)):
+                found.append((path, node))
+        if not found:
+            return data
+        references = [node if isinstance(node, SecretReference) else SecretReference(*match.groups())
+                      for _, node in found
+                      for match in ([None] if isinstance(node, SecretReference) else _REFERENCE.finditer(node))]
+        values = self.resolve(references)
+        copies: Dict[Tuple[Any, ...], Any] = {}
+        for path, node in found:
+            if isinstance(node, SecretReference):
+                value = values[node]
+            else:
+                whole = _REFERENCE.fullmatch(node)
+                value = values[SecretReference(*whole.groups())] if whole else _REFERENCE.sub(
+                    lambda match: str(values[SecretReference(*match.groups())]), node)
+            if not path:
+                return Secure(value, self.message)
+            _copy(data, path[:-1], copies)[path[-1]] = Secure(value, self.message)
+        return copies[()]
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Stop the thread pool used for concurrent and background fetches."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def _copy(data: Any, path: Tuple[Any, ...], copies: Dict[Tuple[Any, ...], Any]) -> Any:
+    """
+    Return the copy of the container at `path`, copying it and its ancestors the first time it is requested.
+
+    Args:
+        data: The original tree.
+        path: Key path of the container.
+        copies: The containers copied so far, by path.
+    """
+    copy = copies.get(path)
+    if copy is None:
+        if path:
+            parent = _copy(data, path[:-1], copies)
+            original = parent[path[-1]]
+        else:
+            original = data
+        copy = dict(original) if isinstance(original, dict) else list(original)
+        if path:
+            parent[path[-1]] = copy
+        copies[path] = copy
+    return copy
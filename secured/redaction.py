@@ -0,0 +1,265 @@
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .secure import Secure
+
+
+def iter_plaintexts(data: Any, min_length: int = 4) -> Iterator[str]:
+    """
+    Yield the text of every scalar leaf of a parsed configuration, descending into mappings and lists.
+
+    Secure leaves, such as resolved secret references, yield the text of their original value.
+
+    Args:
+        data: The parsed configuration.
+        min_length: Shorter texts are skipped, since masking them would redact unrelated words and numbers.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif isinstance(node, Secure):
+            stack.append(node._get_original())
+        elif node is not None and not isinstance(node, bool):
+            text = str(node)
+            if len(text) >= min_length:
+                yield text
+
+
+class SecretRedactor:
+    """
+    Replaces every occurrence of a set of secrets in a text, in time linear in the text length.
+
+    The secrets are kept in an Aho-Corasick automaton, so a single pass over the text finds all occurrences no
+    matter how many secrets there are. Overlapping and adjacent occurrences are masked together by one
+    `message`. Secrets are reference counted, since the same value often appears in several leaves. Adding and
+    removing secrets updates the trie in place; the failure links are recomputed once, on the next `redact`
+    after a change, instead of after every single update.
+
+    Attributes:
+        message (str): Text that replaces each redacted span.
+
+    Examples:
+        >>> redactor = SecretRedactor(["password123"], message="<Hidden>")
+        >>> redactor.redact("login with password123 failed")
+        'login with <Hidden> failed'
+    """
+
+    def __init__(self, secrets: Iterable[str] = (), message: str = "<Sensitive data secured>") -> None:
+        """
+        Initialize the redactor.
+
+        Args:
+            secrets: Initial secrets.
+            message: Text that replaces each redacted span.
+        """
+        self.message = message
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [0]
+        self._depth: List[int] = [0]
+        self._counts: Dict[str, int] = {}
+        self._dirty = False
+        self.update(added=secrets)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, secret: str) -> bool:
+        return secret in self._counts
+
+    def add(self, secret: str) -> None:
+        """
+        Add one occurrence of a secret.
+
+        Args:
+            secret: The plaintext to redact.
+        """
+        if not secret:
+            return
+        count = self._counts.get(secret, 0)
+        self._counts[secret] = count + 1
+        if count:
+            return
+        state = 0
+        for char in secret:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(0)
+                self._depth.append(self._depth[state] + 1)
+                self._goto[state][char] = next_state
+            state = next_state
+        self._dirty = True
+
+    def remove(self, secret: str) -> None:
+        """
+        Remove one occurrence of a secret; it stops being redacted once every occurrence is removed.
+
+        Args:
+            secret: The plaintext that no longer needs redacting.
+        """
+        count = self._counts.get(secret, 0)
+        if count > 1:
+            self._counts[secret] = count - 1
+        elif count == 1:
+            del self._counts[secret]
+            self._dirty = True
+
+    def update(self, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """
+        Add and remove several secrets at once.
+
+        Args:
+            added: Secrets to add.
+            removed: Secrets to remove.
+        """
+        for secret in removed:
+            self.remove(secret)
+        for secret in added:
+            self.add(secret)
+
+    def _build(self) -> None:
+        """Recompute the failure links and, per state, the length of the longest secret ending there."""
+        terminal = set()
+        for secret in self._counts:
+            state = 0
+            for char in secret:
+                state = self._goto[state][char]
+            terminal.add(state)
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+        self._output[0] = 0
+        while queue:
+            state = queue.popleft()
+            fail_output = self._output[self._fail[state]]
+            self._output[state] = self._depth[state] if state in terminal else fail_output
+            for char, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                queue.append(child)
+        self._dirty = False
+
+    def spans(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find the merged `(start, end)` spans of the text covered by secrets.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            Non-overlapping spans in increasing order.
+        """
+        if self._dirty:
+            self._build()
+        goto, fail, output = self._goto, self._fail, self._output
+        spans: List[Tuple[int, int]] = []
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            length = output[state]
+            if length:
+                start, end = index + 1 - length, index + 1
+                if spans and start <= spans[-1][1]:
+                    spans[-1] = (min(spans[-1][0], start), end)
+                else:
+                    spans.append((start, end))
+        return spans
+
+    def redact(self, text: str) -> str:
+        """
+        Replace every secret in a text by the message.
+
+        Args:
+            text: The text to redact.
+
+        Returns:
+            The redacted text, or `text` itself when it contains no secret.
+        """
+        if not self._counts:
+            return text
+        spans = self.spans(text)
+        if not spans:
+            return text
+        pieces, position = [], 0
+        for start, end in spans:
+            pieces.append(text[position:start])
+            pieces.append(self.message)
+            position = end
+        pieces.append(text[position:])
+        return ''.join(pieces)
+
+
+class RedactingFilter(logging.Filter):
+    """
+    A logging filter that removes secrets from log records before they are emitted.
+
+    The message is formatted with its arguments and redacted; redacted records get the redacted text as their
+    message and no arguments. Attach it to the handlers that write records out, so records propagated from
+    other loggers are covered as well.
+
+    Examples:
+        >>> handler.addFilter(RedactingFilter(secured.redactor))
+    """
+
+    def __init__(self, redactor: SecretRedactor, name: str = '') -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            redactor: The redactor holding the secrets.
+            name: Passed to `logging.Filter`.
+        """
+        super().__init__(name)
+        self.redactor = redactor
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Redact the record in place; never drops it."""
+        message = record.getMessage()
+        redacted = self.redactor.redact(message)
+        if redacted is not message:
+            record.msg = redacted
+            record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        if record.exc_text:
+            record.exc_text = self.redactor.redact(record.exc_text)
+        return True
+
+
+class RedactingFormatter(logging.Formatter):
+    """
+    A formatter that redacts secrets from the fully formatted output, including tracebacks and stack info.
+
+    Examples:
+        >>> handler.setFormatter(RedactingFormatter(secured.redactor, '%(levelname)s - %(message)s'))
+    """
+
+    def __init__(self, redactor: SecretRedactor, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the formatter.
+
+        Args:
+            redactor: The redactor holding the secrets.
+            *args: Passed to `logging.Formatter`.
+            **kwargs: Passed to `logging.Formatter`.
+        """
+        super().__init__(*args, **kwargs)
+        self.redactor = redactor
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record and redact the result."""
+        return self.redactor.redact(super().format(record))
@@ -0,0 +1,180 @@
+import re
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)\s*(ms|s|m|h|d|w)')
+_TRUE = {'true', 'yes', 'on', '1'}
+_FALSE = {'false', 'no', 'off', '0'}
+
+
+class SchemaError(ValueError):
+    """
+    Raised when configuration values cannot be coerced to the types declared in a schema.
+
+    Attributes:
+        errors (List[Tuple[str, str]]): Every `(dotted_path, reason)` pair found, not just the first one.
+    """
+
+    def __init__(self, errors: List[Tuple[str, str]]) -> None:
+        self.errors = errors
+        details = '\n'.join(f"  {path}: {reason}" for path, reason in errors)
+        super().__init__(f"{len(errors)} configuration value(s) do not match the schema:\n{details}")
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"expected an integer, got {type(value).__name__}")
+    return int(value)
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, bool):
+        raise ValueError("expected a number, got bool")
+    return float(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def _to_duration(value: Any) -> timedelta:
+    if isinstance(value, timedelta):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(seconds=value)
+    text = str(value).strip().lower()
+    parts = _DURATION.findall(text)
+    if not parts or _DURATION.sub('', text).strip():
+        raise ValueError(f"expected a duration such as '30s', '5m' or '1h30m', got {value!r}")
+    return timedelta(seconds=sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts))
+
+
+def _to_list(value: Any) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    raise ValueError(f"expected a list or a comma-separated string, got {type(value).__name__}")
+
+
+COERCERS: Dict[Any, Callable[[Any], Any]] = {
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+    timedelta: _to_duration,
+    list: _to_list,
+}
+
+
+class Schema:
+    """
+    Declared types for configuration values, applied once when a config is created.
+
+    Fields map dotted paths to a type. Paths start with the config name, like the keys accepted by
+    `Secured.get`, and a `*` segment matches every key at that level. Supported types are `int`, `float`,
+    `bool` (accepting true/false, yes/no, on/off and 1/0), `datetime.timedelta` (from seconds or strings
+    such as '250ms', '30s' or '1h30m'), `list` (from a list or a comma-separated string), a one-element list
+    such as `[int]` for a list whose items are coerced, or any callable that converts the value or raises.
+    Paths that do not exist in the data are ignored.
+
+    Attributes:
+        fields (Dict[str, Any]): The declared type of each dotted path.
+
+    Examples:
+        >>> schema = Schema({'config.databases.*.connection.port': int, 'config.timeout': timedelta})
+        >>> schema.apply({'databases': {'db3': {'connection': {'port': '5432'}}}}, 'config')
+        {'databases': {'db3': {'connection': {'port': 5432}}}}
+    """
+
+    def __init__(self, fields: Mapping[str, Any]) -> None:
+        """
+        Initialize the schema.
+
+        Args:
+            fields: The declared type of each dotted path.
+        """
+        self.fields = dict(fields)
+        self._paths = [(path.split('.'), kind) for path, kind in self.fields.items()]
+
+    def apply(self, data: Any, name: str) -> Any:
+        """
+        Coerce the values of a config to their declared types.
+
+        Dictionaries on the way to a coerced value are copied, so `data` itself is left untouched.
+
+        Args:
+            data: The parsed config.
+            name: Name of the config, matched against the first segment of each path.
+
+        Returns:
+            The config with coerced values.
+
+        Raises:
+            SchemaError: If any value cannot be coerced; the error lists every failure.
+        """
+        errors: List[Tuple[str, str]] = []
+        for keys, kind in self._paths:
+            if keys[0] in ('*', name):
+                data = self._coerce(data, keys[1:], kind, name, errors)
+        if errors:
+            raise SchemaError(errors)
+        return data
+
+    def _coerce(self, node: Any, keys: List[str], kind: Any, path: str, errors: List[Tuple[str, str]]) -> Any:
+        """
+        Coerce the values below `node` that match the remaining path segments.
+
+        Args:
+            node: The current subtree.
+            keys: Remaining path segments.
+            kind: The declared type.
+            path: Dotted path of `node`, used in error messages.
+            errors: Collected `(dotted_path, reason)` pairs.
+
+        Returns:
+            `node`, or a copy of it with coerced values.
+        """
+        if not keys:
+            try:
+                return coerce(node, kind)
+            except (TypeError, ValueError) as e:
+                errors.append((path, str(e)))
+                return node
+        if not isinstance(node, dict):
+            return node
+        key, rest = keys[0], keys[1:]
+        matches = list(node) if key == '*' else [key] if key in node else []
+        if not matches:
+            return node
+        node = dict(node)
+        for match in matches:
+            node[match] = self._coerce(node[match], rest, kind, f"{path}.{match}", errors)
+        return node
+
+
+def coerce(value: Any, kind: Any) -> Any:
+    """
+    Convert a single value to a declared type.
+
+    Args:
+        value: The value to convert.
+        kind: A type supported by `Schema`, a one-element list of such a type, or a converting callable.
+
+    Returns:
+        The converted value.
+
+    Raises:
+        ValueError: If the value cannot be converted.
+        TypeError: If the value has a type the conversion does not accept.
+    """
+    if isinstance(kind, list):
+        return [coerce(item, kind[0]) for item in _to_list(value)]
+    return COERCERS.get(kind, kind)(value)
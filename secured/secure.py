@@ -1,7 +1,11 @@
-from typing import Union
+from typing import Any, Callable, Dict, Tuple, Union
 
 
 class Secure(str):
+    # No per-instance dict here, so CompactSecure can do without one; plain Secure values get theirs
+    # from the _InstanceSecure subclass.
+    __slots__ = ()
+
     def __new__(cls, original: str, message: str = "<Sensitive data secured>"):
         """
         Create a new Secure instance that appears as a custom message.
@@ -13,6 +17,8 @@ class Secure(str):
         Returns:
             Secure: A new Secure instance displaying the placeholder message.
         """
+        if cls is Secure:
+            cls = _InstanceSecure
         instance = super(Secure, cls).__new__(cls, original)
         instance._original = original
         instance._message = message
@@ -71,4 +77,77 @@ class Secure(str):
         Returns:
             str: The original data.
         """
-        return self._original
+        return self._original
+
+
+class _InstanceSecure(Secure):
+    """A Secure that stores its original value and message on the instance."""
+
+
+class CompactSecure(Secure):
+    """
+    A Secure without a per-instance dict, for configs with very many secured leaves.
+
+    The secured text itself is the only per-instance storage: the original value is rebuilt from it on access,
+    and the placeholder message is a class attribute shared by every value with that message. Instances are
+    created through `compact_secure`, which keeps one subclass per message and original type.
+    """
+
+    __slots__ = ()
+    _message: str = "<Sensitive data secured>"
+    _decode: Callable[[str], Any] = str
+
+    def __new__(cls, original: Any, message: str = "<Sensitive data secured>"):  # type: ignore
+        """
+        Create the compact instance; `message` is carried by the class and ignored here.
+
+        Args:
+            original: The original value to secure.
+            message: Unused, kept for signature compatibility with Secure.
+        """
+        return str.__new__(cls, original)
+
+    @property
+    def _original(self) -> Any:  # type: ignore[override]
+        """The original value, rebuilt from the secured text."""
+        return type(self)._decode(str.__str__(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle through `compact_secure`, since the per-message subclasses are created at runtime."""
+        return compact_secure, (self._original, self._message)
+
+
+_DECODERS: Dict[type, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: lambda text: text == 'True',
+    type(None): lambda text: None,
+}
+_compact_classes: Dict[Tuple[str, type], type] = {}
+
+
+def compact_secure(original: Any, message: str = "<Sensitive data secured>") -> Secure:
+    """
+    Secure a value using the compact representation when its type allows it.
+
+    Strings, integers, floats, booleans and None round-trip exactly through their text and are stored as
+    CompactSecure. Any other type falls back to a regular Secure, which keeps the original object.
+
+    Args:
+        original: The original value to secure.
+        message: A placeholder message to display instead of the original content.
+
+    Returns:
+        Secure: A CompactSecure, or a regular Secure for other types.
+    """
+    kind = type(original)
+    decode = _DECODERS.get(kind)
+    if decode is None:
+        return Secure(original, message)
+    secure_class = _compact_classes.get((message, kind))
+    if secure_class is None:
+        secure_class = type('CompactSecure', (CompactSecure,),
+                            {'__slots__': (), '_message': message, '_decode': staticmethod(decode)})
+        _compact_classes[(message, kind)] = secure_class
+    return secure_class(original)
@@ -1,15 +1,112 @@
+import logging
 import os
-import yaml # type: ignore
-from typing import List, Dict, Any
+from contextlib import nullcontext
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
 
-from .log_manager import setup_default_logger
+from .cache import ConfigCache
+from .compiled import compile_tree
+from .composition import Composition, compile_composition
+from .encryption import Cipher, decrypt_all, decrypt_tree, iter_encrypted
+from .export import iter_json, iter_yaml, to_dict
+from .fingerprint import Fingerprints
+from .instrumentation import LoadStats
+from .layers import EnvLayer, FileLayer, LayeredConfig
+from .loader import read_yaml, read_yaml_timed, yaml_error
+from .providers import SecretError, SecretProvider, SecretResolver
+from .redaction import RedactingFilter, SecretRedactor, iter_plaintexts
+from .schema import Schema, SchemaError
+from .snapshot import FrozenAttrDict, freeze
+from .log_manager import setup_default_logger, setup_queue_logger
 from .secure import Secure
 from pathlib import Path
-from .attribute import AttrDict
+from .attribute import AttrDict, PlainView
+from .index import _MISSING, PathIndex
+from .watcher import ConfigWatcher, _stat_signature, diff_trees
+
+if TYPE_CHECKING:
+    from .shared import SharedConfig
+
+
+def _tree(config: Any) -> Any:
+    """
+    Return the AttrDict behind a config, whichever representation it is currently exposed as.
+
+    Args:
+        config: An AttrDict, a PlainView or any other value.
+    """
+    return config.tree if isinstance(config, PlainView) else config
+
+
+def _subtree(data: Any, path: Tuple[Any, ...]) -> Any:
+    """
+    Return the subtree of parsed data at a key path, or None if it does not exist.
+
+    Args:
+        data: The parsed data.
+        path: Key path, as reported by `diff_trees`.
+    """
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def _has_path(data: Any, path: Tuple[Any, ...]) -> bool:
+    """
+    Check whether a key path exists in parsed data.
+
+    Args:
+        data: The parsed data.
+        path: Key path, as reported by `diff_trees`.
+    """
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return False
+        data = data[key]
+    return True
+
+
+def _outcome(result: Any) -> Any:
+    """
+    Return a result gathered with `return_exceptions=True`, raising it if it is an exception.
+
+    Args:
+        result: The gathered result.
+    """
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+class _Source:
+    """Bookkeeping for a loaded YAML file or layered config, used to reload it incrementally."""
+
+    __slots__ = ('path', 'name', 'secure', 'signature', 'data', 'layers')
+
+    def __init__(self, path: str, name: str, secure: bool, signature: Optional[Tuple[int, int]], data: Any,
+                 layers: Optional[LayeredConfig] = None) -> None:
+        self.path = path
+        self.name = name
+        self.secure = secure
+        self.signature = signature
+        self.data = data
+        self.layers = layers
+
 
 class Secured:
     def __init__(self, yaml_paths: str | List[str] = None, secure: bool = False, # type: ignore
-                 as_attrdict: bool = True, message: str = "<Sensitive data secured>", logger=None):
+                 as_attrdict: bool = True, message: str = "<Sensitive data secured>", logger=None,
+                 lazy: bool = False, cache_dir: str | None = None, max_workers: int = 1,
+                 process_pool: bool = False, compact: bool = False,
+                 schema: Mapping[str, Any] | Schema | None = None, stats: LoadStats | bool | None = None,
+                 frozen: bool = False,
+                 secret_providers: SecretResolver | Mapping[str, SecretProvider] | None = None,
+                 cipher: Cipher | None = None, compiled: bool = False, fingerprints: Fingerprints | bool = False,
+                 queue_logging: bool = False):
         """
         Initialize a Secured object to manage YAML configuration securely.
 
@@ -18,12 +115,62 @@ class Secured:
             secure: Flag to determine if data should be secured. Defaults to False.
             as_attrdict: If True, loaded data will be stored as AttrDict objects. Defaults to True.
             message: Custom message to use when data is secured. Defaults to "<Sensitive data secured>".
-            logger: External logger for logging messages, can be None. If None, a default logger is created.
+            logger: External logger for logging messages, can be None. If None, a default logger is created the first
+                time something is logged.
+            lazy: If True, AttrDict configs convert nested values on first access instead of at load time.
+            cache_dir: Directory for a persistent cache of parsed YAML files. Files whose size, modification
+                time or content are unchanged are loaded from the cache instead of being parsed again.
+            max_workers: Number of files read and parsed concurrently. Defaults to 1 (serial loading).
+            process_pool: If True, concurrent parsing uses a process pool instead of a thread pool, which avoids
+                the GIL for CPU-bound parsing at the cost of pickling the parsed trees back.
+            compact: If True, secured AttrDict leaves use the memory-compact CompactSecure representation.
+            schema: Declared types by dotted path (see `Schema`). Matching values are coerced once when a file
+                is loaded, and secured leaves then hold the typed value, so `to_int`/`to_float` no longer parse.
+            stats: A LoadStats instance, or True for a new one, collecting per-file load timings and counts.
+                Available afterwards as the `stats` attribute. Defaults to None (no instrumentation).
+            frozen: If True, configs are immutable FrozenAttrDict snapshots that threads can read without locks.
+                Reloads publish new snapshots that share every unchanged subtree with the previous ones.
+            secret_providers: A SecretResolver, or providers by name for a new one, resolving `!secret provider:key` and
+                `${provider:key}` values into Secure leaves when files are loaded. All references of a file
+                are resolved in one batch, concurrently across providers, and cached with a TTL.
+            cipher: Cipher decrypting values tagged `!encrypted`, e.g. `FernetCipher.from_key_file(path)`. They
+                become EncryptedSecure leaves, decrypted the first time their original value is used.
+            compiled: If True, configs are built from slotted classes generated per mapping shape, so attribute
+                reads cost about as much as plain attribute access. Compiled configs are read-only; reloads
+                publish a new root that shares every unchanged subtree.
+            fingerprints: A Fingerprints instance, or True for a new unkeyed one, keeping a content hash of every
+                subtree, updated on assignment and on reload. See `fingerprint` and `diff_fingerprints`.
+            queue_logging: If True and no logger is given, the default logger is `setup_queue_logger()`, which
+                writes records from a background thread so loading and reloading never block on log output.
         """
         self.as_attrdict = as_attrdict
         self.secure = secure
         self.message = message
-        self.logger = logger or setup_default_logger()
+        self.lazy = lazy
+        self.compact = compact
+        self.schema = Schema(schema) if isinstance(schema, Mapping) else schema
+        self.stats = LoadStats() if stats is True else stats or None
+        self.frozen = frozen
+        self._resolver = (SecretResolver(secret_providers, message=message) if isinstance(secret_providers, Mapping)
+                          else secret_providers)
+        self.cipher = cipher
+        self.compiled = compiled
+        self._snapshot = FrozenAttrDict()
+        self._read_file = read_yaml_timed if self.stats is not None else read_yaml
+        self._logger: Optional[logging.Logger] = logger
+        self.queue_logging = queue_logging
+        self.cache = ConfigCache(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.process_pool = process_pool
+        self._sources: List[_Source] = []
+        self._callbacks: List[Callable[[List[str]], Any]] = []
+        self._reload_lock = threading.Lock()
+        self._index = PathIndex()
+        self._fingerprints = Fingerprints() if fingerprints is True else fingerprints or None
+        if self._fingerprints is not None:
+            self._index.listener = self._on_assignment
+        self._redactor: Optional[SecretRedactor] = None
+        self._shared: Optional[SharedConfig] = None
         self.load_yaml(yaml_paths=yaml_paths, secure=secure)
 
 
@@ -36,23 +183,736 @@ class Secured:
         secure: Indicates if the data should be secured.
 
         Processes each YAML file, converting content to AttrDict or secure data structures as required.
+        Files are attached in the order given, even when they are parsed concurrently.
+
+        Raises:
+            SchemaError: If values do not match the schema, listing the failures of every loaded file. Files
+                without failures are still attached.
         """
         if not yaml_paths:
             return
         yaml_paths = [yaml_paths] if isinstance(yaml_paths, str) else yaml_paths
 
-        for path in yaml_paths:
+        signatures = [_stat_signature(Path(path)) for path in yaml_paths]
+        self._attach(yaml_paths, signatures, self._readers(yaml_paths), secure)
+
+    @classmethod
+    async def aload(cls, yaml_paths: str | List[str] = None, secure: bool = False,  # type: ignore
+                    **kwargs: Any) -> 'Secured':
+        """
+        Create a Secured object without blocking the running event loop.
+
+        Accepts the same arguments as the constructor. The files are read and parsed concurrently in the
+        loop's default executor, and the result has the same AttrDict/Secure structure as `Secured(...)`.
+
+        Args:
+            yaml_paths: Paths to YAML files that should be loaded.
+            secure: Flag to determine if data should be secured. Defaults to False.
+            **kwargs: Any other constructor argument.
+
+        Returns:
+            Secured: The loaded object.
+
+        Example:
+            secured = await Secured.aload(['config.yaml', 'secrets.yaml'], secure=True)
+        """
+        secured = cls(secure=secure, **kwargs)
+        await secured.aload_yaml(yaml_paths, secure=secure)
+        return secured
+
+    async def aload_yaml(self, yaml_paths: str | List[str], secure: bool) -> None:
+        """
+        Asynchronous version of `load_yaml`, reading and parsing the files off the event loop.
+
+        Args:
+            yaml_paths: Paths to the YAML configuration files.
+            secure: Indicates if the data should be secured.
+
+        Raises:
+            SchemaError: If values do not match the schema, as in `load_yaml`.
+        """
+        if not yaml_paths:
+            return
+        yaml_paths = [yaml_paths] if isinstance(yaml_paths, str) else yaml_paths
+
+        signatures = [_stat_signature(Path(path)) for path in yaml_paths]
+        results = await self._read_in_executor(yaml_paths, self._read_file)
+        self._attach(yaml_paths, signatures, [partial(_outcome, result) for result in results], secure)
+
+    async def _read_in_executor(self, yaml_paths: List[str], read_file: Callable[..., Any] = read_yaml) -> List[Any]:
+        """
+        Read and parse files concurrently in the running loop's default executor.
+
+        Args:
+            yaml_paths: Paths to the YAML configuration files.
+            read_file: Function reading and parsing one file.
+
+        Returns:
+            The parsed content, or the raised exception, of each file in order.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(None, read_file, path, self.cache)
+                                      for path in yaml_paths), return_exceptions=True)
+
+    def _attach(self, yaml_paths: List[str], signatures: List[Optional[Tuple[int, int]]],
+                readers: List[Callable[[], Any]], secure: bool) -> None:
+        """
+        Convert parsed files into configs and attach them as attributes, logging files that failed to load.
+
+        Args:
+            yaml_paths: Paths to the YAML configuration files.
+            signatures: Size and modification time of each file, taken before it was read.
+            readers: Callables returning the parsed content of each file or raising its loading error.
+            secure: Indicates if the data should be secured.
+
+        Raises:
+            SchemaError: If values do not match the schema, listing the failures of every file.
+        """
+        schema_errors: List[Tuple[str, str]] = []
+        for path, signature, read in zip(yaml_paths, signatures, readers):
             try:
-                with open(path, 'r') as file:
-                    file_data = yaml.safe_load(file)
+                file_data, timings = read() if self.stats is not None else (read(), None)
                 file_name = Path(path).stem.replace('-', '_')
-                setattr(self, file_name, self.create_config(file_data, secure=secure))
+                with self.stats.track_file(path, timings) if self.stats is not None else nullcontext():
+                    file_data = self._apply_schema(file_name, self._resolve_secrets(file_data))
+                    config = self.create_config(file_data, secure=secure)
+                self._publish(file_name, config)
+                replaced = [source for source in self._sources if source.name == file_name]
+                self._sources = [source for source in self._sources if source.name != file_name]
+                self._sources.append(_Source(path, file_name, secure, signature, file_data))
+                if self._redactor is not None:
+                    self._redactor.update(
+                        added=iter_plaintexts(file_data) if secure else (),
+                        removed=(text for source in replaced if source.secure for text in iter_plaintexts(source.data)))
             except FileNotFoundError:
                 self.logger.error(f"File {path} not found.")
                 continue
-            except yaml.YAMLError as e:
+            except yaml_error() as e:
                 self.logger.error(f"Error parsing YAML file {path}: {e}")
                 continue
+            except SecretError as e:
+                self.logger.error(f"Could not resolve the secrets of YAML file {path}: {e}")
+                continue
+            except SchemaError as e:
+                self.logger.error(f"Schema validation failed for YAML file {path}: {e}")
+                schema_errors.extend(e.errors)
+                continue
+        if schema_errors:
+            raise SchemaError(schema_errors)
+
+    def load_layers(self, layers: List[FileLayer | EnvLayer | str], name: str = 'config', secure: bool = False) -> None:
+        """
+        Merge several sources into a single config, later layers taking precedence over earlier ones.
+
+        Paths may point to YAML, JSON, TOML or `.env` files; wrap them in FileLayer to make them optional, and use
+        EnvLayer for prefixed environment variables. The layers are merged once into one tree, which is indexed
+        like any loaded file, so reads cost the same however many layers there are. `reload` reads again only
+        the layers that changed, and merges again only the paths that changed in them.
+
+        Args:
+            layers: The layers, from lowest to highest precedence.
+            name: Attribute name of the merged config.
+            secure: Indicates if the data should be secured.
+
+        Raises:
+            SchemaError: If the merged values do not match the schema.
+
+        Example:
+            secured.load_layers(['base.yaml', 'production.toml', FileLayer('.env', optional=True), EnvLayer('APP')])
+            secured.config.databases.db3.host  # APP__DATABASES__DB3__HOST if set
+        """
+        layered = LayeredConfig(layers, cache=self.cache)
+        try:
+            data = self._apply_schema(name, self._resolve_secrets(layered.load()))
+        except FileNotFoundError as e:
+            self.logger.error(f"File {e.filename} not found.")
+            return
+        except yaml_error() as e:
+            self.logger.error(f"Error parsing layers {layered!r}: {e}")
+            return
+        except SecretError as e:
+            self.logger.error(f"Could not resolve the secrets of layers {layered!r}: {e}")
+            return
+        except SchemaError as e:
+            self.logger.error(f"Schema validation failed for layers {layered!r}: {e}")
+            raise
+        except ValueError as e:
+            self.logger.error(f"Error parsing layers {layered!r}: {e}")
+            return
+        self._publish(name, self.create_config(data, secure=secure))
+        replaced = [source for source in self._sources if source.name == name]
+        self._sources = [source for source in self._sources if source.name != name]
+        self._sources.append(_Source(repr(layered), name, secure, None, data, layered))
+        if self._redactor is not None:
+            self._redactor.update(
+                added=iter_plaintexts(data) if secure else (),
+                removed=(text for source in replaced if source.secure for text in iter_plaintexts(source.data)))
+
+    def _resolve_secrets(self, data: Any) -> Any:
+        """
+        Replace the secret references and encrypted values of a loaded file by Secure values.
+
+        References are resolved if secret providers are configured. Encrypted values are wrapped, without being
+        decrypted, if a cipher is configured.
+
+        Args:
+            data: The parsed file.
+
+        Returns:
+            The data with resolved secrets.
+
+        Raises:
+            SecretError: If a reference cannot be resolved.
+        """
+        if self._resolver is not None:
+            data = self._resolver.resolve_tree(data)
+        return decrypt_tree(data, self.cipher, self.message) if self.cipher is not None else data
+
+    def decrypt(self, max_workers: int = 4) -> int:
+        """
+        Decrypt every encrypted value of the loaded configs up front, in a thread pool.
+
+        Services that would rather pay the decryption cost at startup than on first access call this after
+        loading; later accesses then find the plaintext cached.
+
+        Args:
+            max_workers: Number of threads decrypting concurrently.
+
+        Returns:
+            The number of values decrypted.
+
+        Raises:
+            DecryptionError: If a value cannot be decrypted.
+        """
+        return decrypt_all((value for source in self._sources if hasattr(self, source.name)
+                            for value in iter_encrypted(getattr(self, source.name))), max_workers)
+
+    def _apply_schema(self, name: str, data: Any) -> Any:
+        """
+        Coerce the values of a loaded file to the types declared in the schema, if there is one.
+
+        Args:
+            name: Name of the config.
+            data: The parsed file.
+
+        Returns:
+            The data with coerced values.
+
+        Raises:
+            SchemaError: If any value does not match the schema.
+        """
+        return self.schema.apply(data, name) if self.schema is not None else data
+
+    def _readers(self, yaml_paths: List[str]) -> List[Callable[[], Any]]:
+        """
+        Create one callable per path that returns the parsed file or raises its loading error.
+
+        With `max_workers` above 1 every file is submitted to a pool up front and the callables wait for their
+        result; otherwise each callable reads its file when called.
+
+        Args:
+            yaml_paths: Paths to the YAML configuration files.
+
+        Returns:
+            Callables in the same order as `yaml_paths`.
+        """
+        if self.max_workers <= 1 or len(yaml_paths) <= 1:
+            return [partial(self._read_file, path, self.cache) for path in yaml_paths]
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(self.max_workers, len(yaml_paths))
+        pool: Executor = ProcessPoolExecutor(workers) if self.process_pool else ThreadPoolExecutor(workers)
+        futures = [pool.submit(self._read_file, path, self.cache) for path in yaml_paths]
+        pool.shutdown(wait=False)
+        return [future.result for future in futures]
+
+    def reload(self, force: bool = False) -> List[str]:
+        """
+        Reparse the loaded YAML files that changed on disk and apply the differences in place.
+
+        Only files whose size or modification time changed are read again (all of them with `force`), and only
+        the changed layers of layered configs. The new content is diffed against the previous one, and each
+        changed subtree is rebuilt completely before it is stored into its existing parent with a single
+        assignment. References held to unchanged parts of the config, including the top-level config objects,
+        stay valid and see the new values, and readers never observe a partially built subtree. Files that went
+        missing, no longer parse or no longer match the schema are logged and keep their current values.
+
+        Args:
+            force: If True, reparse every loaded file regardless of its size and modification time.
+
+        Returns:
+            The dotted key paths that changed, e.g. `config.databases.db3.connection.host`.
+        """
+        stale = self._stale_sources(force)
+        return self._refresh(stale, [self._reader(source, force) for source, _ in stale])
+
+    async def areload(self, force: bool = False) -> List[str]:
+        """
+        Asynchronous version of `reload`, reading and parsing the changed files off the event loop.
+
+        The changes are applied, and the `on_change` callbacks run, on the event loop.
+
+        Args:
+            force: If True, reparse every loaded file regardless of its size and modification time.
+
+        Returns:
+            The dotted key paths that changed.
+        """
+        import asyncio
+
+        stale = self._stale_sources(force)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(loop.run_in_executor(None, self._reader(source, force)) for source, _ in stale),
+                                       return_exceptions=True)
+        return self._refresh(stale, [partial(_outcome, result) for result in results])
+
+    def _stale_sources(self, force: bool) -> List[Tuple[_Source, Optional[Tuple[int, int]]]]:
+        """
+        Find the loaded files whose size or modification time changed since they were last read.
+
+        Args:
+            force: If True, consider every loaded file stale.
+
+        Returns:
+            The stale files with their current size and modification time.
+        """
+        stale = []
+        for source in list(self._sources):
+            if source.layers is not None:
+                if force or source.layers.stale():
+                    stale.append((source, None))
+                continue
+            signature = _stat_signature(Path(source.path))
+            if signature != source.signature or force:
+                stale.append((source, signature))
+        return stale
+
+    def _reader(self, source: _Source, force: bool) -> Callable[[], Any]:
+        """
+        Create a callable returning the new content of a stale file or layered config.
+
+        Args:
+            source: The stale file or layered config.
+            force: If True, read every layer of a layered config again.
+        """
+        if source.layers is not None:
+            return partial(source.layers.refresh, force)
+        return partial(read_yaml, source.path, self.cache)
+
+    def _refresh(self, stale: List[Tuple[_Source, Optional[Tuple[int, int]]]],
+                 readers: List[Callable[[], Any]]) -> List[str]:
+        """
+        Apply the newly parsed content of stale files and notify the `on_change` callbacks.
+
+        Args:
+            stale: The stale files with their current size and modification time.
+            readers: Callables returning the parsed content of each stale file or raising its loading error.
+
+        Returns:
+            The dotted key paths that changed.
+        """
+        changed: List[str] = []
+        with self._reload_lock:
+            for (source, signature), read in zip(stale, readers):
+                try:
+                    file_data = self._apply_schema(source.name, self._resolve_secrets(read()))
+                except FileNotFoundError:
+                    self.logger.error(f"File {source.path} not found.")
+                    continue
+                except yaml_error() as e:
+                    self.logger.error(f"Error parsing YAML file {source.path}: {e}")
+                    continue
+                except SecretError as e:
+                    self.logger.error(f"Could not resolve the secrets of {source.path}: {e}")
+                    continue
+                except SchemaError as e:
+                    self.logger.error(f"Schema validation failed for YAML file {source.path}: {e}")
+                    continue
+                except ValueError as e:
+                    self.logger.error(f"Error parsing {source.path}: {e}")
+                    continue
+                changes = diff_trees(source.data, file_data)
+                listener, self._index.listener = self._index.listener, None
+                try:
+                    self._apply_changes(source, file_data, changes)
+                finally:
+                    self._index.listener = listener
+                if self._fingerprints is not None and () not in changes:
+                    for path in changes:
+                        if _has_path(file_data, path):
+                            self._fingerprints.set((source.name,) + path, _subtree(file_data, path))
+                        else:
+                            self._fingerprints.delete((source.name,) + path)
+                if self._redactor is not None and source.secure:
+                    self._redactor.update(
+                        added=(text for path in changes for text in iter_plaintexts(_subtree(file_data, path))),
+                        removed=(text for path in changes for text in iter_plaintexts(_subtree(source.data, path))))
+                source.signature = signature
+                source.data = file_data
+                changed.extend('.'.join(str(key) for key in (source.name,) + path) for path in changes)
+        if changed:
+            for callback in list(self._callbacks):
+                callback(changed)
+        return changed
+
+    def _apply_changes(self, source: _Source, file_data: Any, changes: List[Tuple[Any, ...]]) -> None:
+        """
+        Store the changed subtrees of a reloaded file into the live config.
+
+        Args:
+            source: The reloaded file.
+            file_data: The newly parsed content of the file.
+            changes: Key paths of the changed subtrees, as returned by `diff_trees`.
+        """
+        if self.frozen:
+            self._apply_frozen_changes(source, file_data, changes)
+            return
+        if self.compiled:
+            self._apply_compiled_changes(source, file_data, changes)
+            return
+        config = _tree(getattr(self, source.name))
+        for path in changes:
+            if not path:
+                self._publish(source.name, self.create_config(file_data, secure=source.secure))
+                continue
+            parent, new_parent = config, file_data
+            for key in path[:-1]:
+                parent, new_parent = parent[key], new_parent[key]
+            key = path[-1]
+            if key not in new_parent:
+                del parent[key]
+            else:
+                parent[key] = new_parent[key]
+
+    def _apply_compiled_changes(self, source: _Source, file_data: Any, changes: List[Tuple[Any, ...]]) -> None:
+        """
+        Build a new compiled config of a reloaded file, copying only the paths that changed, and publish it.
+
+        Args:
+            source: The reloaded file.
+            file_data: The newly parsed content of the file.
+            changes: Key paths of the changed subtrees, as returned by `diff_trees`.
+        """
+        if () in changes:
+            self._publish(source.name, self.create_config(file_data, secure=source.secure))
+            return
+        config = getattr(self, source.name)
+        for path in changes:
+            if _has_path(file_data, path):
+                config = config.set(path, compile_tree(_subtree(file_data, path), source.secure, self.message,
+                                                       self.compact))
+            else:
+                config = config.delete(path)
+        self._publish_changes(source.name, config, changes)
+
+    def _apply_frozen_changes(self, source: _Source, file_data: Any, changes: List[Tuple[Any, ...]]) -> None:
+        """
+        Build a new snapshot of a reloaded file, copying only the paths that changed, and publish it.
+
+        Args:
+            source: The reloaded file.
+            file_data: The newly parsed content of the file.
+            changes: Key paths of the changed subtrees, as returned by `diff_trees`.
+        """
+        if () in changes:
+            self._publish(source.name, self.create_config(file_data, secure=source.secure))
+            return
+        config = getattr(self, source.name)
+        for path in changes:
+            if _has_path(file_data, path):
+                config = config.set(path, freeze(_subtree(file_data, path), source.secure, self.message, self.compact))
+            else:
+                config = config.delete(path)
+        self._publish_changes(source.name, config, changes)
+
+    def _publish_changes(self, name: str, config: Any, changes: List[Tuple[Any, ...]]) -> None:
+        """
+        Attach a new root of an immutable config and re-index only the paths that changed.
+
+        Args:
+            name: Attribute name of the config.
+            config: The new root.
+            changes: Key paths of the changed subtrees, none of them empty.
+        """
+        setattr(self, name, config)
+        if self.frozen:
+            self._snapshot = self._snapshot.set((name,), config)
+        for path in changes:
+            dotted = '.'.join(str(key) for key in (name,) + path)
+            self._index.discard(dotted)
+            node = config
+            for depth, key in enumerate(path[:-1]):
+                node = node[key]
+                self._index.set('.'.join(str(part) for part in (name,) + path[:depth + 1]), node)
+            if path[-1] in node:
+                self._index.add(dotted, node[path[-1]])
+        self._index.set(name, config)
+
+    def snapshot(self) -> FrozenAttrDict:
+        """
+        Return an immutable snapshot of every loaded config, keyed by config name.
+
+        In frozen mode this is the current published snapshot, obtained without copying or locking; it stays
+        unchanged, and valid, however many reloads happen while it is in use. Otherwise a frozen copy of the
+        current configs is built.
+
+        Returns:
+            FrozenAttrDict: The snapshot, e.g. `secured.snapshot().config.databases.db3.connection.host`.
+        """
+        if self.frozen:
+            return self._snapshot
+        return FrozenAttrDict({source.name: freeze(_tree(getattr(self, source.name)))
+                               for source in self._sources if hasattr(self, source.name)})
+
+    def share(self, name: Optional[str] = None) -> 'SharedConfig':
+        """
+        Encode the loaded configs once into a read-only shared memory segment for worker processes.
+
+        Workers forked afterwards pass the returned object to `from_shared`, other processes pass its `name`.
+        Secured configs stay secured in the workers. The caller owns the segment and should `unlink` it once
+        the workers are done.
+
+        Args:
+            name: Name of the segment; a random one is chosen when None.
+
+        Returns:
+            SharedConfig: The shared configs.
+
+        Example:
+            shared = Secured('config.yaml', secure=True).share()
+            # in each worker
+            config = Secured.from_shared(shared).config
+        """
+        configs = {source.name: _tree(getattr(self, source.name))
+                   for source in self._sources if hasattr(self, source.name)}
+        secure = [source.name for source in self._sources if source.secure]
+        from .shared import SharedConfig
+
+        return SharedConfig.create(configs, secure=secure, message=self.message, name=name)
+
+    @classmethod
+    def from_shared(cls, shared: 'SharedConfig | str', **kwargs: Any) -> 'Secured':
+        """
+        Create a Secured object reading the configs shared by another process, without parsing any file.
+
+        Configs are read-only SharedNode mappings decoded lazily on access, so each worker only holds the values
+        it actually uses. Since no file is attached, `reload` and `watch` have no effect.
+
+        Args:
+            shared: A SharedConfig inherited from the parent, or the name of its segment.
+            **kwargs: Any other constructor argument except `yaml_paths`; the message is taken from `shared`.
+
+        Returns:
+            Secured: The object exposing the shared configs.
+        """
+        from .shared import SharedConfig
+
+        shared = SharedConfig.attach(shared) if isinstance(shared, str) else shared
+        kwargs['message'] = shared.message
+        secured = cls(**kwargs)
+        secured._shared = shared
+        for name, config in shared.configs().items():
+            secured._publish(name, config)
+        return secured
+
+    def to_dict(self, reveal: bool = False) -> Dict[str, Any]:
+        """
+        Export every loaded config as plain dictionaries and lists, keyed by config name.
+
+        Args:
+            reveal: If True, secrets are exported with their original values, e.g. to hand the config to a
+                library; otherwise they are replaced by the instance message.
+
+        Returns:
+            The exported configs.
+        """
+        return {name: to_dict(_tree(config), reveal, None if reveal else self.message)
+                for name, config in self._configs()}
+
+    def dump(self, stream: IO[str], format: str = 'yaml', reveal: bool = False, indent: Optional[int] = None) -> None:
+        """
+        Stream every loaded config, keyed by config name, to a text stream as YAML or JSON.
+
+        The document is written piece by piece without building an intermediate copy, so very large and very
+        deep configs can be dumped, e.g. for debug endpoints. Secrets are masked with the instance message.
+
+        Args:
+            stream: The text stream, e.g. an open file or `sys.stdout`.
+            format: `yaml` or `json`.
+            reveal: If True, secrets are written with their original values.
+            indent: Spaces per nesting level; defaults to 2 for YAML and a single line for JSON.
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        configs = {name: _tree(config) for name, config in self._configs()}
+        message = None if reveal else self.message
+        if format == 'yaml':
+            stream.writelines(iter_yaml(configs, reveal, message, 2 if indent is None else indent))
+        elif format == 'json':
+            stream.writelines(iter_json(configs, reveal, message, indent))
+        else:
+            raise ValueError(f"Unsupported format {format!r}; use 'yaml' or 'json'.")
+
+    def _configs(self) -> List[Tuple[str, Any]]:
+        """Return the name and current value of every attached config."""
+        names = [source.name for source in self._sources]
+        if self._shared is not None:
+            names.extend(self._shared.configs())
+        return [(name, getattr(self, name)) for name in dict.fromkeys(names) if hasattr(self, name)]
+
+    def _publish(self, name: str, config: Any) -> None:
+        """
+        Attach a config as an attribute and index it for dotted-path lookups.
+
+        Args:
+            name: Attribute name of the config.
+            config: The config to attach.
+        """
+        setattr(self, name, config)
+        if self.frozen:
+            self._snapshot = self._snapshot.set((name,), config)
+        self._index.discard(name)
+        self._index.add(name, _tree(config))
+        if self._fingerprints is not None:
+            self._fingerprints.set((name,), _tree(config))
+
+    def _on_assignment(self, path: str, value: Any) -> None:
+        """
+        Update the fingerprints after an indexed AttrDict node was assigned or deleted.
+
+        Args:
+            path: Dotted path of the assigned or deleted key.
+            value: The new value, or `_MISSING` for a deletion.
+        """
+        if value is _MISSING:
+            if path in self._fingerprints:  # type: ignore[operator]
+                self._fingerprints.delete(path)  # type: ignore[union-attr]
+        else:
+            self._fingerprints.set(path, value)  # type: ignore[union-attr]
+
+    def fingerprint(self, path: str = '') -> Optional[str]:
+        """
+        Return the content hash of a config subtree, to check cheaply that two processes or hosts hold the same
+        values without comparing, or revealing, the values themselves.
+
+        Args:
+            path: Dotted path, e.g. `config.databases.db3`; the empty default covers every loaded config.
+
+        Returns:
+            The hexadecimal digest, or None if the path does not exist.
+
+        Raises:
+            ValueError: If fingerprints are not enabled.
+        """
+        return self._require_fingerprints().get(path)
+
+    def diff_fingerprints(self, other: 'Secured | Fingerprints', path: str = '') -> List[str]:
+        """
+        Compare the fingerprints of two sets of configs, descending only into the subtrees that differ.
+
+        Args:
+            other: Another Secured object, or fingerprints received from another process; both must use the same
+                key.
+            path: Dotted path of the subtree to compare; everything by default.
+
+        Returns:
+            The dotted key paths of the smallest subtrees that differ.
+
+        Raises:
+            ValueError: If fingerprints are not enabled.
+        """
+        other = other._require_fingerprints() if isinstance(other, Secured) else other
+        return ['.'.join(str(key) for key in keys) for keys in self._require_fingerprints().diff(other, path)]
+
+    def _require_fingerprints(self) -> Fingerprints:
+        """Return the fingerprints, raising a ValueError if they are not enabled."""
+        if self._fingerprints is None:
+            raise ValueError("Fingerprints are not enabled; create Secured with fingerprints=True.")
+        return self._fingerprints
+
+    @property
+    def logger(self) -> logging.Logger:
+        """
+        The logger of loading errors.
+
+        If none was given, it is set up on first use with `setup_queue_logger` when `queue_logging` is enabled,
+        and with `setup_default_logger` otherwise.
+        """
+        if self._logger is None:
+            self._logger = setup_queue_logger() if self.queue_logging else setup_default_logger()
+        return self._logger
+
+    @logger.setter
+    def logger(self, logger: logging.Logger) -> None:
+        self._logger = logger
+
+    @property
+    def redactor(self) -> SecretRedactor:
+        """
+        The redactor holding the plaintext of every secured leaf loaded so far.
+
+        It is built on first access, then kept up to date incrementally: loading a file adds its secrets and
+        reloading only swaps the secrets of the changed subtrees. Values assigned directly on a config are not
+        tracked. Leaves shorter than four characters are not redacted.
+        """
+        if self._redactor is None:
+            self._redactor = SecretRedactor(
+                (text for source in self._sources if source.secure for text in iter_plaintexts(source.data)),
+                message=self.message)
+        return self._redactor
+
+    def redact_logs(self, logger: logging.Logger | None = None) -> RedactingFilter:
+        """
+        Remove the plaintext of secured leaves from the records written by a logger.
+
+        The filter is attached to every handler of the logger, so records propagated from child loggers are
+        redacted as well, or to the logger itself if it has no handlers. On a queue-backed logger the filter runs
+        in the logging thread, before the record is queued.
+
+        Args:
+            logger: The logger to protect. Defaults to this object's logger.
+
+        Returns:
+            RedactingFilter: The attached filter.
+
+        Example:
+            secured.redact_logs(logging.getLogger())
+        """
+        logger = logger or self.logger
+        redacting_filter = RedactingFilter(self.redactor)
+        for target in logger.handlers or [logger]:
+            target.addFilter(redacting_filter)
+        return redacting_filter
+
+    def on_change(self, callback: Callable[[List[str]], Any]) -> None:
+        """
+        Register a callback invoked after a reload changed the config.
+
+        Args:
+            callback: Called with the list of changed dotted key paths.
+        """
+        self._callbacks.append(callback)
+
+    def watch(self, interval: float = 1.0, use_inotify: bool = True) -> ConfigWatcher:
+        """
+        Start watching the loaded YAML files and reload them when they change.
+
+        For layered configs the file layers are watched; changes to environment layers are only picked up by
+        an explicit `reload`.
+
+        Args:
+            interval: Polling interval in seconds when inotify is not used.
+            use_inotify: If True, use inotify when the platform supports it, polling otherwise.
+
+        Returns:
+            The running watcher; call its `stop` method to stop watching.
+        """
+        paths = [path for source in self._sources
+                 for path in (source.layers.paths() if source.layers is not None else [source.path])]
+        return ConfigWatcher(paths, self.reload, interval=interval, use_inotify=use_inotify).start()
 
     def create_config(self, data:  Dict[str, Any], secure: bool) ->  Dict[str, Any]:  # type: ignore
         """
@@ -63,13 +923,17 @@ class Secured:
         secure (bool): Indicates if the data should be secured.
 
         Returns:
-        Union[AttrDict, dict]: Configured data in the form of an AttrDict or a dictionary with secure elements.
+        Union[AttrDict, PlainView]: Configured data as an AttrDict, or as a plain-mapping view over one when
+        `as_attrdict` is False. Both representations secure every leaf when `secure` is True. In frozen mode,
+        an immutable FrozenAttrDict. In compiled mode, a read-only CompiledNode.
         """
-        if self.as_attrdict:
-            return AttrDict(data, secure=secure, message=self.message)
-        else:
-            return {key: Secure(val, self.message) if secure and not isinstance(val, dict) else val
-                    for key, val in self._recursive_dict(data).items()}
+        if self.frozen:
+            return freeze(data, secure, self.message, self.compact)
+        if self.compiled:
+            return compile_tree(data, secure, self.message, self.compact)
+        config = AttrDict(data, secure=secure, message=self.message, lazy=self.lazy, compact=self.compact,
+                          stats=self.stats)
+        return config if self.as_attrdict else PlainView(config)
 
     def _recursive_dict(self, data:  Dict[str, Any]) -> Dict[str, Any]:  # type: ignore[type-arg]
         """
@@ -83,22 +947,30 @@ class Secured:
         """
         return {key: self._recursive_dict(val) if isinstance(val, dict) else val for key, val in data.items()}
 
-    def get(self, key: str, required: bool = False) -> Secure | None:
+    def get(self, key: str, required: bool = False) -> Any:
         """
         Retrieve configuration value by key, securing it.
 
+        The OS environment takes precedence: if an environment variable named `key` exists, its value is
+        returned as a Secure. Otherwise `key` is looked up as a dotted path into the loaded files, such as
+        `config.databases.db3.connection.host`, through an index built at load time and kept in sync with
+        assignments, so the lookup cost does not depend on the depth of the value.
+
         Args:
-            key: The key for the configuration value.
+            key: The environment variable name or dotted path of the configuration value.
             required: Whether the key is required (raises an error if not found).
 
         Returns:
-            The value associated with the key, secured.
+            The value associated with the key: a Secure for environment values, the stored value for files.
         Raises:
             ValueError: If the key is required but not found.
         """
         env_value = os.getenv(key)
         if env_value is not None:
             return Secure(env_value, self.message)
+        value = self._index.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         if required:
             self.logger.error(f"Key '{key}' not found in configuration or OS environment.")
             raise ValueError(f"Key '{key}' not found.")
@@ -108,13 +980,23 @@ class Secured:
         """
         Toggle the use of AttrDict for storing data.
 
+        Configs are switched between their AttrDict tree and a PlainView over that same tree, so toggling takes
+        constant time per config and never copies or reconverts data. Plain dictionaries assigned by hand are
+        converted to AttrDict once, the first time AttrDict is enabled.
+
         Args:
             use: Flag indicating whether to use AttrDict.
         """
         self.as_attrdict = use
         for key, value in self.__dict__.items():
-            if isinstance(value, (AttrDict, dict)):
-                self.__dict__[key] = AttrDict(value, secure=self.secure) if use else dict(value) # type: ignore
+            if use and isinstance(value, PlainView):
+                self.__dict__[key] = value.tree
+            elif not use and isinstance(value, AttrDict):
+                self.__dict__[key] = PlainView(value)
+            elif use and type(value) is dict:
+                self.__dict__[key] = AttrDict(value, secure=self.secure, message=self.message)
+                self._index.discard(key)
+                self._index.add(key, self.__dict__[key])
 
     def compose(self, composition: str, **secured_secrets) -> Secure:
         """
@@ -146,12 +1028,28 @@ class Secured:
             print(combined_secure)  # Output: <Sensitive data secured>
             print(combined_secure._get_original())  # Output: Connection to db-server.local with password password123
         """
-        # Create a context with the original values of Secure objects
-        context = {key: value._get_original() if isinstance(value, Secure) else value
-                for key, value in secured_secrets.items()}
+        if self.stats is not None and self.stats.count_usage:
+            self.stats.compositions += 1
+        # The format string is parsed once per template and message, then reused across calls
+        return compile_composition(composition, self.message).render(**secured_secrets)
 
-        # Replace Secure objects in the format string with their original values
-        composed = composition.format(**context)
+    def compile(self, composition: str, memoize: bool = False) -> Composition:
+        """
+        Precompile a format string into a reusable composition of secure secrets.
+
+        The returned object renders like `compose`, but can be kept around by hot paths, render many secret sets
+        at once with `render_many`, and, with `memoize=True`, return the same Secure instance when called again
+        with the identical Secure objects.
+
+        Args:
+            composition: The format string used to combine the secure secrets.
+            memoize: If True, results for identical Secure inputs are cached and reused.
 
-        # Return a new Secure instance with the combined secret
-        return Secure(composed, self.message)
+        Returns:
+            Composition: The compiled composition, rendering Secure values with this object's message.
+
+        Example:
+            auth_header = secured.compile("Bearer {token}", memoize=True)
+            header = auth_header.render(token=secured.config.token)
+        """
+        return Composition(composition, self.message, memoize=memoize)
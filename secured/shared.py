@@ -0,0 +1,347 @@
+import mmap
+import pickle
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .secure import Secure
+
+MAGIC = b'SCFG'
+VERSION = 1
+_HEADER = struct.Struct('<4sB3xQ')
+_COUNT = struct.Struct('<I')
+_OFFSET = struct.Struct('<Q')
+_PAIR = struct.Struct('<QQ')
+_FLOAT = struct.Struct('<d')
+_MAP, _LIST, _NONE, _TRUE, _FALSE, _INT, _FLOAT_TAG, _STR, _PICKLE = b'mlntxifsp'
+
+
+class _Encoder:
+    """Writes a parsed configuration into the shared binary format, storing each distinct scalar once."""
+
+    def __init__(self) -> None:
+        self.buffer = bytearray(_HEADER.size)
+        self._scalars: Dict[Tuple[type, Any], int] = {}
+
+    def _append(self, *chunks: bytes) -> int:
+        offset = len(self.buffer)
+        for chunk in chunks:
+            self.buffer += chunk
+        return offset
+
+    def encode(self, value: Any) -> int:
+        """
+        Append a value, children first, and return its offset.
+
+        Args:
+            value: The value to encode.
+        """
+        if isinstance(value, Mapping):
+            pairs = [_PAIR.pack(self.encode(key), self.encode(child)) for key, child in value.items()]
+            return self._append(b'm', _COUNT.pack(len(pairs)), *pairs)
+        if isinstance(value, (list, tuple)):
+            offsets = [_OFFSET.pack(self.encode(item)) for item in value]
+            return self._append(b'l', _COUNT.pack(len(offsets)), *offsets)
+        if isinstance(value, Secure):
+            value = value._get_original()
+        try:
+            key: Optional[Tuple[type, Any]] = (type(value), value)
+            offset = self._scalars.get(key)  # type: ignore[arg-type]
+        except TypeError:
+            key, offset = None, None
+        if offset is None:
+            offset = self._append(*_encode_scalar(value))
+            if key is not None:
+                self._scalars[key] = offset
+        return offset
+
+    def finish(self, root: int) -> bytes:
+        """Write the header and return the encoded bytes."""
+        self.buffer[:_HEADER.size] = _HEADER.pack(MAGIC, VERSION, root)
+        return bytes(self.buffer)
+
+
+def _encode_scalar(value: Any) -> Tuple[bytes, ...]:
+    """Return the tagged encoding of a scalar value."""
+    if value is None:
+        return (b'n',)
+    if value is True:
+        return (b't',)
+    if value is False:
+        return (b'x',)
+    if type(value) is int:
+        text = str(value).encode()
+        return b'i', _COUNT.pack(len(text)), text
+    if type(value) is float:
+        return b'f', _FLOAT.pack(value)
+    if type(value) is str:
+        text = value.encode('utf-8', 'surrogatepass')
+        return b's', _COUNT.pack(len(text)), text
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return b'p', _COUNT.pack(len(data)), data
+
+
+def encode(configs: Mapping[str, Any], secure: Iterable[str] = (), message: str = "<Sensitive data secured>") -> bytes:
+    """
+    Encode configs into the compact, read-only binary format used by SharedConfig.
+
+    Args:
+        configs: Parsed data (or AttrDict/FrozenAttrDict trees) by config name.
+        secure: Names of the configs whose leaves are secured when read back.
+        message: Custom message of the secured leaves.
+
+    Returns:
+        The encoded bytes.
+    """
+    encoder = _Encoder()
+    root = encoder.encode({'configs': configs, 'secure': sorted(secure), 'message': message})
+    return encoder.finish(root)
+
+
+def _decode(buffer: Any, offset: int, secure: bool, message: str) -> Any:
+    """
+    Decode the value at `offset`; mappings become lazily decoded SharedNode views.
+
+    Args:
+        buffer: The encoded bytes.
+        offset: Offset of the value.
+        secure: If True, leaves are wrapped in Secure.
+        message: Custom message of the secured leaves.
+    """
+    tag = buffer[offset]
+    if tag == _MAP:
+        return SharedNode(buffer, offset, secure, message)
+    if tag == _LIST:
+        count, = _COUNT.unpack_from(buffer, offset + 1)
+        start = offset + 1 + _COUNT.size
+        value: Any = [_decode(buffer, _OFFSET.unpack_from(buffer, start + index * _OFFSET.size)[0], False, message)
+                      for index in range(count)]
+    elif tag == _NONE:
+        value = None
+    elif tag == _TRUE:
+        value = True
+    elif tag == _FALSE:
+        value = False
+    elif tag == _FLOAT_TAG:
+        value, = _FLOAT.unpack_from(buffer, offset + 1)
+    else:
+        length, = _COUNT.unpack_from(buffer, offset + 1)
+        data = bytes(buffer[offset + 1 + _COUNT.size:offset + 1 + _COUNT.size + length])
+        if tag == _INT:
+            value = int(data)
+        elif tag == _STR:
+            value = data.decode('utf-8', 'surrogatepass')
+        elif tag == _PICKLE:
+            value = pickle.loads(data)
+        else:
+            raise ValueError(f"Corrupt shared config: unknown tag {tag} at offset {offset}")
+    return Secure(value, message) if secure else value
+
+
+class SharedNode(Mapping):
+    """
+    A read-only mapping over an encoded config node, decoded lazily on access.
+
+    The keys of a node are decoded the first time the node is used, and each value the first time it is read,
+    after which it is cached in the node. Nothing else is copied into the process, so memory grows with the
+    parts of the config a worker actually reads. Supports attribute-style access and secures leaves like
+    AttrDict.
+
+    Attributes:
+        secure (bool): Whether leaves are wrapped in Secure.
+        message (str): Custom message of the secured leaves.
+    """
+
+    __slots__ = ('_buffer', '_offset', 'secure', 'message', '_offsets', '_cache')
+
+    def __init__(self, buffer: Any, offset: int, secure: bool, message: str) -> None:
+        object.__setattr__(self, '_buffer', buffer)
+        object.__setattr__(self, '_offset', offset)
+        object.__setattr__(self, 'secure', secure)
+        object.__setattr__(self, 'message', message)
+        object.__setattr__(self, '_offsets', None)
+        object.__setattr__(self, '_cache', {})
+
+    def _load_offsets(self) -> Dict[Any, int]:
+        """Decode the keys of the node and remember where each value is stored."""
+        offsets = self._offsets
+        if offsets is None:
+            count, = _COUNT.unpack_from(self._buffer, self._offset + 1)
+            start = self._offset + 1 + _COUNT.size
+            offsets = {}
+            for index in range(count):
+                key_offset, value_offset = _PAIR.unpack_from(self._buffer, start + index * _PAIR.size)
+                offsets[_decode(self._buffer, key_offset, False, self.message)] = value_offset
+            object.__setattr__(self, '_offsets', offsets)
+        return offsets
+
+    def __getitem__(self, key: Any) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = _decode(self._buffer, self._load_offsets()[key], self.secure, self.message)
+            self._cache[key] = value
+            return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._load_offsets())
+
+    def __len__(self) -> int:
+        return len(self._load_offsets())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._load_offsets()
+
+    def __getattr__(self, item: str) -> Any:
+        """
+        Enables attribute-style access to keys.
+
+        Raises:
+            AttributeError: If the key does not exist.
+        """
+        if item.startswith('__') or item not in self._load_offsets():
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'")
+        return self[item]
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(keys={list(self)!r})"
+
+
+class SharedConfig:
+    """
+    Configs encoded once into a read-only shared memory segment or memory-mapped file.
+
+    A parent process creates the segment with `create` before forking; workers use the inherited object (or
+    `attach` by name from unrelated processes, or `open` a file written with `write`) and read the configs
+    through lazily decoded SharedNode views. Since the encoded configs are plain bytes, reading them never
+    touches reference counts on shared pages, so the pages stay shared across workers.
+
+    Examples:
+        >>> shared = SharedConfig.create({'config': {'db': {'host': 'db.local'}}}, secure=['config'])
+        >>> shared.configs()['config'].db.host
+        <Sensitive data secured>
+        >>> shared.unlink()
+    """
+
+    def __init__(self, buffer: Any, handle: Any = None) -> None:
+        """
+        Wrap an encoded buffer.
+
+        Args:
+            buffer: The encoded bytes, e.g. a memoryview over shared memory or an mmap.
+            handle: The SharedMemory or mmap owning the buffer, closed by `close`.
+
+        Raises:
+            ValueError: If the buffer does not hold a shared config of a supported version.
+        """
+        magic, version, root = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a shared config, or written by an incompatible version.")
+        self.buffer = buffer
+        self.handle = handle
+        meta = _decode(buffer, root, False, '')
+        self.message: str = meta['message']
+        self.secure: List[str] = meta['secure']
+        self._configs: SharedNode = meta['configs']
+
+    @classmethod
+    def create(cls, configs: Mapping[str, Any], secure: Iterable[str] = (), message: str = "<Sensitive data secured>",
+               name: Optional[str] = None) -> 'SharedConfig':
+        """
+        Encode configs into a new shared memory segment.
+
+        Args:
+            configs: Parsed data by config name.
+            secure: Names of the configs whose leaves are secured.
+            message: Custom message of the secured leaves.
+            name: Name of the segment; a random one is chosen when None.
+
+        Returns:
+            SharedConfig: The owner of the segment, responsible for calling `unlink` when done.
+        """
+        data = encode(configs, secure, message)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        segment.buf[:len(data)] = data
+        return cls(segment.buf, segment)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedConfig':
+        """
+        Attach to a segment created by another process.
+
+        Args:
+            name: Name of the segment, as given by the `name` attribute of the creator.
+
+        Returns:
+            SharedConfig: A read-only view; the creator remains responsible for unlinking the segment.
+        """
+        try:
+            segment = shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+        except TypeError:
+            segment = shared_memory.SharedMemory(name=name)
+            # Before Python 3.13 attaching registers the segment with the resource tracker, which would unlink it
+            # when this process exits although the creator still owns it.
+            resource_tracker.unregister(segment._name, 'shared_memory')  # type: ignore[attr-defined]
+        return cls(segment.buf, segment)
+
+    @classmethod
+    def open(cls, path: str | Path) -> 'SharedConfig':
+        """
+        Memory-map a file written with `write`; processes mapping the same file share its pages.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            SharedConfig: A read-only view of the file.
+        """
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mapping), mapping)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the shared memory segment, or None for memory-mapped files."""
+        return getattr(self.handle, 'name', None)
+
+    def configs(self) -> Dict[str, SharedNode]:
+        """
+        Return the configs by name, securing the configs that were secured when they were shared.
+
+        Returns:
+            Lazily decoded views of the configs.
+        """
+        offsets = self._configs._load_offsets()
+        return {name: _decode(self.buffer, offset, False, self.message) if name not in self.secure
+                else SharedNode(self.buffer, offset, True, self.message) for name, offset in offsets.items()}
+
+    def write(self, path: str | Path) -> None:
+        """
+        Write the encoded configs to a file that can later be opened with `open`.
+
+        Args:
+            path: Destination path.
+        """
+        Path(path).write_bytes(bytes(self.buffer))
+
+    def close(self) -> None:
+        """Release this process's mapping. Views obtained from it must not be used afterwards."""
+        self._configs = None  # type: ignore[assignment]
+        buffer, self.buffer = self.buffer, None
+        if isinstance(buffer, memoryview):
+            buffer.release()
+        if self.handle is not None:
+            self.handle.close()
+
+    def unlink(self) -> None:
+        """Close the mapping and destroy the shared memory segment; only the creator should call this."""
+        handle = self.handle
+        self.close()
+        if isinstance(handle, shared_memory.SharedMemory):
+            # A worker attaching through the same resource tracker may have unregistered the segment already.
+            resource_tracker.register(handle._name, 'shared_memory')  # type: ignore[attr-defined]
+            handle.unlink()
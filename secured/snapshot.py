@@ -0,0 +1,177 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple, Union
+
+from .secure import Secure, compact_secure
+
+Path = Union[str, Tuple[Any, ...]]
+
+
+def _keys(path: Path) -> Tuple[Any, ...]:
+    """Split a dotted path into keys; tuples are taken as keys already."""
+    return tuple(path.split('.')) if isinstance(path, str) else tuple(path)
+
+
+class FrozenAttrDict(Mapping):  # type: ignore[type-arg]
+    """
+    An immutable, hashable mapping with attribute-style access, used for config snapshots.
+
+    Nodes can be shared freely between threads without locking, since nothing can change them. Updates are
+    expressed with `set` and `delete`, which return a new root that copies only the nodes on the path to the
+    change and shares every other subtree with the original. Older roots stay valid for as long as someone
+    holds a reference to them.
+
+    Examples:
+        >>> config = freeze({'db': {'host': 'a.local'}, 'cache': {'ttl': 5}})
+        >>> updated = config.set('db.host', 'b.local')
+        >>> config.db.host, updated.db.host, updated.cache is config.cache
+        ('a.local', 'b.local', True)
+    """
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, data: Mapping = ()) -> None:  # type: ignore[type-arg,assignment]
+        """
+        Initialize the node. Values are stored as given; use `freeze` to convert nested mappings and lists.
+
+        Args:
+            data: The items of the node.
+        """
+        object.__setattr__(self, '_data', dict(data))
+        object.__setattr__(self, '_hash', None)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __getattr__(self, item: str) -> Any:
+        """
+        Enables attribute-style access to keys.
+
+        Raises:
+            AttributeError: If the key does not exist.
+        """
+        try:
+            return self._data[item]
+        except KeyError:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{item}'") from None
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(frozenset(self._data.items())))
+        return self._hash  # type: ignore[return-value]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FrozenAttrDict):
+            return self is other or self._data == other._data
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return type(self), (self._data,)
+
+    def set(self, path: Path, value: Any) -> 'FrozenAttrDict':
+        """
+        Return a new root with `value` stored at `path`, creating missing intermediate nodes.
+
+        Args:
+            path: Dotted path or tuple of keys, relative to this node.
+            value: The value to store, as given.
+
+        Returns:
+            FrozenAttrDict: The new root; this node is left unchanged.
+        """
+        keys = _keys(path)
+        if not keys:
+            raise ValueError("Cannot replace the root of a snapshot.")
+        child = self._data.get(keys[0])
+        if len(keys) > 1:
+            value = (child if isinstance(child, FrozenAttrDict) else FrozenAttrDict()).set(keys[1:], value)
+        data = dict(self._data)
+        data[keys[0]] = value
+        return FrozenAttrDict(data)
+
+    def delete(self, path: Path) -> 'FrozenAttrDict':
+        """
+        Return a new root without the key at `path`.
+
+        Args:
+            path: Dotted path or tuple of keys, relative to this node.
+
+        Returns:
+            FrozenAttrDict: The new root; this node is left unchanged.
+
+        Raises:
+            KeyError: If the path does not exist.
+        """
+        keys = _keys(path)
+        data = dict(self._data)
+        if len(keys) == 1:
+            del data[keys[0]]
+        else:
+            child = data[keys[0]]
+            if not isinstance(child, FrozenAttrDict):
+                raise KeyError(keys[1])
+            data[keys[0]] = child.delete(keys[1:])
+        return FrozenAttrDict(data)
+
+
+def freeze(value: Any, secure: bool = False, message: str = "<Sensitive data secured>",
+           compact: bool = False) -> Any:
+    """
+    Convert parsed data (or an AttrDict tree) into immutable nodes.
+
+    Mappings become FrozenAttrDict, lists become tuples, and leaves are secured like AttrDict leaves when
+    `secure` is True.
+
+    Args:
+        value: The data to freeze.
+        secure: If True, leaves are wrapped in Secure with `message`.
+        message: Custom message used when values are secured.
+        compact: If True, secured leaves use the CompactSecure representation.
+
+    Returns:
+        The frozen value.
+    """
+    if isinstance(value, FrozenAttrDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenAttrDict({key: freeze(child, secure, message, compact) for key, child in value.items()})
+    if isinstance(value, list) and not secure:
+        return tuple(freeze(item, secure, message, compact) for item in value)
+    if secure and not isinstance(value, Secure):
+        return compact_secure(value, message) if compact else Secure(value, message)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Convert frozen nodes back into plain dictionaries and lists, keeping Secure leaves as they are.
+
+    Args:
+        value: The frozen value.
+
+    Returns:
+        A mutable copy.
+    """
+    if isinstance(value, FrozenAttrDict):
+        return {key: thaw(child) for key, child in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
@@ -0,0 +1,214 @@
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def diff_trees(old: Any, new: Any, prefix: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+    """
+    Compute the key paths at which two parsed configuration trees differ.
+
+    Mappings present on both sides are compared key by key; any other value (including lists) is compared as a
+    whole. A key added or removed on one side is reported at the key itself, without descending into it. Subtrees
+    shared by both trees are skipped without being compared.
+
+    Args:
+        old: The previous tree.
+        new: The new tree.
+        prefix: Key path of `old` and `new` inside the enclosing tree.
+
+    Returns:
+        The key paths, as tuples, of the smallest subtrees that changed.
+
+    Examples:
+        >>> diff_trees({'a': {'b': 1, 'c': 2}}, {'a': {'b': 1, 'c': 3}, 'd': 4})
+        [('a', 'c'), ('d',)]
+    """
+    if old is new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes: List[Tuple[Any, ...]] = []
+        for key in list(old) + [key for key in new if key not in old]:
+            if key in old and key in new:
+                changes.extend(diff_trees(old[key], new[key], prefix + (key,)))
+            else:
+                changes.append(prefix + (key,))
+        return changes
+    if type(old) is type(new) and old == new:
+        return []
+    return [prefix]
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Returns the `(size, mtime_ns)` pair of a file, or None if it does not exist.
+
+    Args:
+        path: Path of the file.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+class _Inotify:
+    """A minimal ctypes binding to Linux inotify that reports changes to a set of files."""
+
+    def __init__(self, paths: List[Path]) -> None:
+        """
+        Watch the parent directories of `paths`, so atomic replacements of the files are seen as well.
+
+        Args:
+            paths: Resolved paths of the files to watch.
+
+        Raises:
+            OSError: If inotify is not available on this platform.
+        """
+        import ctypes
+        import ctypes.util
+
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError("inotify is not available")
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.names: Dict[int, set] = {}  # type: ignore[type-arg]
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        for path in paths:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(path.parent), mask)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path.parent}")
+            self.names.setdefault(wd, set()).add(os.fsencode(path.name))
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for events and report whether any watched file was touched.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            True if at least one event concerned a watched file.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        changed = False
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buffer):
+                wd, _, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b'\0')
+                offset += length
+                changed = changed or name in self.names.get(wd, ())
+
+    def close(self) -> None:
+        """Release the inotify file descriptor."""
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """
+    Watches a set of files on a background thread and calls back when any of them changes.
+
+    Uses inotify on Linux and falls back to polling file size and modification time every `interval` seconds
+    elsewhere, or when `use_inotify` is False.
+
+    Attributes:
+        paths (List[Path]): Resolved paths of the watched files.
+        interval (float): Polling interval, also used as the wake-up period for stopping the thread.
+        using_inotify (bool): Whether the watcher runs on inotify rather than polling.
+
+    Examples:
+        >>> watcher = ConfigWatcher(['config.yaml'], lambda: print("changed")).start()
+        >>> watcher.stop()
+    """
+
+    def __init__(self, paths: List[str], callback: Callable[[], Any], interval: float = 1.0,
+                 use_inotify: bool = True) -> None:
+        """
+        Initialize the watcher without starting it.
+
+        Args:
+            paths: Paths of the files to watch.
+            callback: Called without arguments from the watcher thread after a change is detected.
+            interval: Seconds between polls, and the longest time `stop` has to wait for the thread.
+            use_inotify: If True, use inotify when the platform supports it.
+        """
+        self.paths = [Path(path).resolve() for path in paths]
+        self.callback = callback
+        self.interval = interval
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify:
+            try:
+                self._inotify = _Inotify(self.paths)
+            except OSError:
+                self._inotify = None
+        self.using_inotify = self._inotify is not None
+        self._signatures = [_stat_signature(path) for path in self.paths]
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='secured-watcher', daemon=True)
+
+    def start(self) -> 'ConfigWatcher':
+        """
+        Start the watcher thread.
+
+        Returns:
+            The watcher itself, for chaining.
+        """
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the watcher thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _poll(self) -> bool:
+        """
+        Compare the current size and modification time of every file with the last seen values.
+
+        Returns:
+            True if any file changed since the last poll.
+        """
+        signatures = [_stat_signature(path) for path in self.paths]
+        changed = signatures != self._signatures
+        self._signatures = signatures
+        return changed
+
+    def _run(self) -> None:
+        """Watcher loop, running until `stop` is called."""
+        while not self._stop.is_set():
+            if self._inotify is not None:
+                changed = self._inotify.wait(self.interval)
+            else:
+                changed = not self._stop.wait(self.interval) and self._poll()
+            if changed and not self._stop.is_set():
+                self.callback()
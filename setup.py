@@ -39,5 +39,10 @@ setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.10",
-    install_requires=dependencies
+    install_requires=dependencies,
+    entry_points={
+        "console_scripts": [
+            f"{name}={target}" for name, target in pyproject['tool']['poetry']['scripts'].items() # type: ignore
+        ],
+    },
 )
@@ -1,6 +1,6 @@
 import pytest
-from secured.attribute import AttrDict
-from secured.secure import Secure
+from secured.attribute import AttrDict, PlainView
+from secured.secure import CompactSecure, Secure
 
 def test_attribute_access():
     """Test attribute-style access to dictionary keys."""
@@ -89,3 +89,54 @@ def test_setitem_behavior():
     ad['password'] = 'my_secret'
     assert isinstance(ad.password, Secure)
     assert str(ad.password) == "<Custom Secured>"
+
+def test_single_conversion_pass(monkeypatch):
+    """Test that each nested dictionary is converted exactly once during initialization."""
+    calls = []
+    original_init = AttrDict.__init__
+
+    def counting_init(self, *args, **kwargs):
+        calls.append(1)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(AttrDict, '__init__', counting_init)
+    AttrDict({'a': {'b': {'c': {'d': 'value'}}}}, secure=True)
+    assert len(calls) == 4
+
+def test_lazy_conversion_on_access():
+    """Test that lazy mode converts nested values only when their key is first accessed."""
+    ad = AttrDict({'nested': {'password': 'my_secret'}, 'other': {'key': 'value'}}, secure=True, lazy=True)
+    assert type(dict.__getitem__(ad, 'nested')) is dict
+    nested = ad.nested
+    assert isinstance(nested, AttrDict)
+    assert nested.lazy
+    assert isinstance(nested.password, Secure)
+    assert ad.nested is nested
+    assert type(dict.__getitem__(ad, 'other')) is dict
+
+def test_lazy_views_are_converted():
+    """Test that copies and value views of a lazy AttrDict never expose unconverted values."""
+    ad = AttrDict({'password': 'my_secret', 'nested': {'key': 'value'}}, secure=True, lazy=True)
+    assert isinstance(dict(ad)['password'], Secure)
+    assert all(isinstance(value, (Secure, AttrDict)) for value in ad.values())
+    assert ad.get('missing', 'default') == 'default'
+
+def test_compact_leaves():
+    """Test that compact mode secures leaves with the compact representation."""
+    ad = AttrDict({'nested': {'port': 5432}}, secure=True, compact=True, message="<Custom Secured>")
+    assert isinstance(ad.nested.port, CompactSecure)
+    assert ad.nested.port.to_int() == 5432
+    assert str(ad.nested.port) == "<Custom Secured>"
+
+def test_plain_view_shares_tree():
+    """Test that a PlainView exposes the same data as plain mappings without copying it."""
+    ad = AttrDict({'nested': {'password': 'my_secret'}}, secure=True)
+    view = PlainView(ad)
+    assert isinstance(view['nested'], PlainView)
+    assert view['nested'].tree is ad.nested
+    assert dict(view['nested']) == {'password': 'my_secret'}
+    view['extra'] = {'key': 'value'}
+    assert isinstance(ad.extra, AttrDict)
+    assert isinstance(ad.extra.key, Secure)
+    del view['extra']
+    assert 'extra' not in ad and len(view) == 1
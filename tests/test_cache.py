@@ -0,0 +1,53 @@
+import os
+import yaml
+from secured.cache import ConfigCache
+from secured.secured import Secured
+
+def write_yaml(path, text):
+    path.write_text(text)
+    return path
+
+def test_cache_hit_skips_parsing(tmp_path):
+    """Test that an unchanged file is served from the cache without calling the parser."""
+    source = write_yaml(tmp_path / 'config.yaml', 'key: value\n')
+    cache = ConfigCache(tmp_path / 'cache')
+    assert cache.load(source, yaml.safe_load) == {'key': 'value'}
+
+    def fail(_):
+        raise AssertionError("parser should not be called")
+
+    assert cache.load(source, fail) == {'key': 'value'}
+
+def test_cache_reparses_changed_file(tmp_path):
+    """Test that a changed file is parsed again."""
+    source = write_yaml(tmp_path / 'config.yaml', 'key: value\n')
+    cache = ConfigCache(tmp_path / 'cache')
+    cache.load(source, yaml.safe_load)
+    write_yaml(source, 'key: other_value\n')
+    assert cache.load(source, yaml.safe_load) == {'key': 'other_value'}
+
+def test_cache_reuses_touched_file_with_same_content(tmp_path):
+    """Test that a file whose mtime changed but whose content did not is still served from the cache."""
+    source = write_yaml(tmp_path / 'config.yaml', 'key: value\n')
+    cache = ConfigCache(tmp_path / 'cache')
+    cache.load(source, yaml.safe_load)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.load(source, lambda _: {'parsed': 'again'}) == {'key': 'value'}
+
+def test_corrupt_entry_is_ignored(tmp_path):
+    """Test that a corrupt cache entry falls back to parsing."""
+    source = write_yaml(tmp_path / 'config.yaml', 'key: value\n')
+    cache = ConfigCache(tmp_path / 'cache')
+    cache.load(source, yaml.safe_load)
+    for entry in (tmp_path / 'cache').glob('*.pickle'):
+        entry.write_bytes(b'not a pickle')
+    assert cache.load(source, yaml.safe_load) == {'key': 'value'}
+
+def test_secured_with_cache_dir(tmp_path):
+    """Test that Secured loads the same config with and without the cache."""
+    cache_dir = tmp_path / 'cache'
+    first = Secured('examples/config.yaml', cache_dir=str(cache_dir))
+    second = Secured('examples/config.yaml', cache_dir=str(cache_dir))
+    assert first.config == second.config == Secured('examples/config.yaml').config
+    assert list(cache_dir.glob('*.pickle'))
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from secured.cli import main
+from secured.secured import Secured
+from secured.shared import SharedConfig
+
+@pytest.fixture
+def configs(tmp_path):
+    (tmp_path / 'nested').mkdir()
+    (tmp_path / 'app.yaml').write_text("db:\n  port: '5432'\n  password: pw\n")
+    (tmp_path / 'nested' / 'cache.json').write_text('{"ttl": 5}')
+    (tmp_path / 'notes.txt').write_text("not a config")
+    return tmp_path
+
+def test_validate_reports_every_file(configs, capsys):
+    """Test that validate finds configs recursively and reports them as JSON."""
+    assert main(['validate', str(configs), '--workers', '2', '--json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['valid'] is True
+    assert [file['path'] for file in report['files']] == [str(configs / 'app.yaml'),
+                                                          str(configs / 'nested' / 'cache.json')]
+
+def test_validate_exit_codes(configs, capsys):
+    """Test that invalid files exit with 1 and missing paths with 2."""
+    (configs / 'schema.yaml').write_text("app.db.port: int\napp.db.password: [int]\n")
+    (configs / 'broken.yaml').write_text("key: [unclosed\n")
+    assert main(['validate', str(configs / 'app.yaml'), str(configs / 'broken.yaml'),
+                 '--schema', str(configs / 'schema.yaml'), '--workers', '1']) == 1
+    output = capsys.readouterr().out
+    assert f"FAIL {configs / 'broken.yaml'}: " in output
+    assert "app.db.password: invalid literal" in output
+    assert output.endswith("0 valid, 2 invalid\n")
+    assert main(['validate', str(configs / 'missing.yaml')]) == 2
+    assert "no such file or directory" in capsys.readouterr().err
+
+def test_precompile_writes_a_loadable_artifact(configs, capsys):
+    """Test that precompiled configs load with Secured.from_shared."""
+    output = configs / 'configs.scfg'
+    assert main(['precompile', str(configs), '-o', str(output), '--secure', '--json', '--workers', '1']) == 0
+    assert json.loads(capsys.readouterr().out)['configs'] == ['app', 'cache']
+    shared = SharedConfig.open(output)
+    secured = Secured.from_shared(shared)
+    assert secured.app.db.password._get_original() == 'pw'
+    assert secured.get('cache.ttl')._get_original() == 5
+    shared.close()
+
+def test_precompile_rejects_invalid_files(configs, capsys):
+    """Test that nothing is written when a file is invalid."""
+    (configs / 'broken.yaml').write_text("- a list\n")
+    output = configs / 'configs.scfg'
+    assert main(['precompile', str(configs), '-o', str(output)]) == 1
+    assert "expected a mapping at the top level" in capsys.readouterr().out
+    assert not output.exists()
+
+def test_bench_reports_timings(configs, capsys):
+    """Test that bench reports load timings and access costs."""
+    assert main(['bench', str(configs / 'app.yaml'), '--repeat', '2', '--secure', '--json']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report['load']['runs'] == 2
+    assert report['access']['leaves'] == 2
+    assert report['files'][0]['leaves'] == 2
+    assert main(['bench', str(configs / 'nested' / 'cache.json')]) == 2
@@ -0,0 +1,66 @@
+import pickle
+
+import pytest
+from secured.compiled import CompiledNode, compile_tree
+from secured.secure import Secure
+from secured.secured import Secured
+
+def test_nodes_of_the_same_shape_share_a_class():
+    """Test that one slotted class is generated per mapping shape."""
+    config = compile_tree({'a': {'host': 'a.local', 'port': 1}, 'b': {'host': 'b.local', 'port': 2}})
+    assert type(config.a) is type(config.b)
+    assert type(config.a) is not type(config)
+    assert config.b.host == 'b.local'
+    assert not hasattr(config.a, '__dict__')
+
+def test_keys_that_cannot_be_attributes_are_still_reachable():
+    """Test that non-identifier, keyword and reserved keys are reachable by item access."""
+    config = compile_tree({'my-key': 1, 'class': 2, 'items': [3], 4: 'four', 'name': 'n'})
+    assert config['my-key'] == 1
+    assert config['class'] == 2
+    assert config['items'] == [3]
+    assert config[4] == 'four'
+    assert config.name == 'n'
+    assert list(config) == ['my-key', 'class', 'items', 4, 'name']
+    assert 'my-key' in config and 'missing' not in config
+    with pytest.raises(KeyError):
+        config['missing']
+
+def test_compiled_nodes_are_read_only_and_secure_leaves():
+    """Test that compiled nodes cannot be modified and secure their leaves."""
+    config = compile_tree({'db': {'password': 'pw', 'ports': [1, 2]}}, secure=True, message="<Hidden>")
+    assert isinstance(config.db.password, Secure)
+    assert str(config.db.password) == "<Hidden>"
+    assert config._get_original('db') == {'password': 'pw', 'ports': [1, 2]}
+    assert config.to_dict() == {'db': {'password': '<Hidden>', 'ports': '<Hidden>'}}
+    with pytest.raises(AttributeError):
+        config.db = 'other'
+
+def test_compiled_nodes_pickle_and_copy_only_the_changed_path():
+    """Test that compiled nodes pickle and that updates share unchanged subtrees."""
+    config = compile_tree({'db': {'host': 'a.local', 'port': 1}, 'cache': {'ttl': 5}})
+    assert pickle.loads(pickle.dumps(config)) == config
+    updated = config.set('db.host', 'b.local')
+    assert config.db.host == 'a.local' and updated.db.host == 'b.local'
+    assert updated.cache is config.cache
+    assert updated.set(('new', 'key'), 1).new.key == 1
+    removed = updated.delete('db.port')
+    assert 'port' not in removed.db and isinstance(removed.db, CompiledNode)
+    with pytest.raises(KeyError):
+        config.delete('db.missing')
+
+def test_secured_compiled_mode_reloads(tmp_path):
+    """Test that Secured builds compiled configs and publishes new ones on reload."""
+    path = tmp_path / 'service.yaml'
+    path.write_text("db:\n  host: a.local\ncache:\n  ttl: 5\n")
+    secured = Secured(str(path), secure=True, compiled=True)
+    before = secured.service
+    assert isinstance(before, CompiledNode)
+    assert secured.get('service.db.host') == 'a.local'
+
+    path.write_text("db:\n  host: b.local\ncache:\n  ttl: 5\nnew: 1\n")
+    assert sorted(secured.reload(force=True)) == ['service.db.host', 'service.new']
+    assert before.db.host == 'a.local'
+    assert secured.service.db.host == 'b.local'
+    assert secured.service.new.to_int() == 1
+    assert secured.service.cache is before.cache
@@ -0,0 +1,53 @@
+import pytest
+from secured.composition import Composition, compile_composition
+from secured.secure import Secure
+
+def test_render_matches_str_format():
+    """Test that rendering produces the same text as str.format on the original values."""
+    template = "{user!r}:{password:>8}@{hosts[0]}/{db.name} ({ratio:.{digits}f})"
+
+    class Database:
+        name = 'main'
+
+    values = dict(user='guest', password=Secure('secret'), hosts=['h1', 'h2'], db=Database(), ratio=0.5, digits=2)
+    rendered = Composition(template, "<Hidden>").render(**values)
+    expected = template.format(**{**values, 'password': 'secret'})
+    assert isinstance(rendered, Secure)
+    assert str(rendered) == "<Hidden>"
+    assert rendered._get_original() == expected
+
+def test_fields_are_collected_once():
+    """Test that the field names of the template are exposed in order without duplicates."""
+    assert Composition("{a}{b.c}{a}").fields == ('a', 'b')
+
+def test_positional_fields_rejected():
+    """Test that positional fields are rejected when compiling."""
+    with pytest.raises(ValueError):
+        Composition("{} and {0}")
+
+def test_render_many():
+    """Test rendering several secret sets in one call."""
+    composition = Composition("{user}@{host}")
+    results = composition.render_many([{'user': 'a', 'host': Secure('h1')}, {'user': 'b', 'host': Secure('h2')}])
+    assert [result._get_original() for result in results] == ['a@h1', 'b@h2']
+
+def test_memoize_reuses_instance_for_identical_secrets():
+    """Test that memoized rendering returns the same Secure only for the identical Secure inputs."""
+    composition = Composition("Bearer {token}", memoize=True)
+    token = Secure('abc')
+    first = composition.render(token=token)
+    assert composition.render(token=token) is first
+    assert composition.render(token=Secure('abc')) is not first
+    assert composition.render(token='abc') is not composition.render(token='abc')
+
+def test_memoize_is_bounded():
+    """Test that the memo never grows beyond its maximum size."""
+    composition = Composition("{token}", memoize=True, maxsize=2)
+    tokens = [Secure(str(index)) for index in range(5)]
+    for token in tokens:
+        composition.render(token=token)
+    assert len(composition._memo) == 2
+
+def test_compile_composition_is_cached():
+    """Test that the shared compiled composition is parsed only once per template and message."""
+    assert compile_composition("{a}", "m") is compile_composition("{a}", "m")
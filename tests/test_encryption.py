@@ -0,0 +1,80 @@
+import base64
+import threading
+import pytest
+from secured.encryption import (Cipher, Ciphertext, DecryptionError, EncryptedSecure, FernetCipher, decrypt_all,
+                                decrypt_tree)
+from secured.loader import safe_load
+from secured.secured import Secured
+
+class Base64Cipher(Cipher):
+    """A reversible stand-in cipher counting its decryptions."""
+
+    def __init__(self):
+        self.decrypted = 0
+        self.lock = threading.Lock()
+
+    def encrypt(self, plaintext):
+        return base64.b64encode(plaintext.encode()).decode()
+
+    def decrypt(self, token):
+        with self.lock:
+            self.decrypted += 1
+        try:
+            return base64.b64decode(token.encode(), validate=True).decode()
+        except ValueError as e:
+            raise DecryptionError(str(e)) from e
+
+def test_encrypted_tag_is_parsed_into_ciphertext():
+    """Test that `!encrypted` values load as Ciphertext tokens."""
+    data = safe_load("password: !encrypted cGFzc3dvcmQ=\n")
+    assert isinstance(data['password'], Ciphertext) and data['password'] == 'cGFzc3dvcmQ='
+
+def test_values_decrypt_once_on_first_access():
+    """Test that encrypted values decrypt lazily, cache the plaintext and never leak it."""
+    cipher = Base64Cipher()
+    data = decrypt_tree({'db': {'password': Ciphertext(cipher.encrypt('pw')), 'port': Ciphertext(cipher.encrypt('5432'))},
+                         'plain': {'a': 1}}, cipher, message='***')
+    password = data['db']['password']
+    assert isinstance(password, EncryptedSecure)
+    assert str(password) == repr(password) == '***'
+    assert cipher.decrypted == 0
+    assert password._get_original() == 'pw'
+    assert password._get_original() == 'pw'
+    assert data['db']['port'].to_int() == 5432
+    assert cipher.decrypted == 2
+
+def test_decryption_errors_are_not_swallowed():
+    """Test that a token that cannot be decrypted raises instead of returning the message."""
+    value = EncryptedSecure('not base64!', Base64Cipher())
+    with pytest.raises(DecryptionError):
+        value.to_int()
+
+def test_decrypt_all_uses_a_thread_pool():
+    """Test that bulk decryption decrypts every pending value once."""
+    cipher = Base64Cipher()
+    values = [EncryptedSecure(cipher.encrypt(str(number)), cipher) for number in range(50)]
+    values[0]._get_original()
+    assert decrypt_all(values, max_workers=4) == 49
+    assert cipher.decrypted == 50
+    assert [value._get_original() for value in values] == [str(number) for number in range(50)]
+
+def test_secured_wraps_encrypted_values(tmp_path):
+    """Test that Secured defers decryption until access or an explicit bulk decrypt."""
+    cipher = Base64Cipher()
+    (tmp_path / 'config.yaml').write_text(f"db:\n  password: !encrypted {cipher.encrypt('pw')}\n"
+                                          f"  user: !encrypted {cipher.encrypt('admin')}\n")
+    secured = Secured(str(tmp_path / 'config.yaml'), cipher=cipher)
+    assert cipher.decrypted == 0
+    url = secured.compose("{user}:{password}", user=secured.config.db.user, password=secured.config.db.password)
+    assert url._get_original() == 'admin:pw'
+    assert secured.decrypt() == 0
+    assert cipher.decrypted == 2
+
+def test_fernet_cipher_round_trip(tmp_path):
+    """Test that the Fernet cipher decrypts its own tokens and rejects foreign ones."""
+    pytest.importorskip('cryptography')
+    (tmp_path / 'config.key').write_bytes(FernetCipher.generate_key())
+    cipher = FernetCipher.from_key_file(tmp_path / 'config.key')
+    assert cipher.decrypt(cipher.encrypt('secret')) == 'secret'
+    with pytest.raises(DecryptionError):
+        FernetCipher(FernetCipher.generate_key()).decrypt(cipher.encrypt('secret'))
@@ -0,0 +1,72 @@
+import io
+import json
+import yaml
+from secured.attribute import AttrDict
+from secured.export import iter_json, iter_yaml, to_dict, write_json, write_yaml
+from secured.secure import Secure
+from secured.secured import Secured
+from secured.snapshot import freeze
+
+DATA = {'db': {'host': 'db.local', 'port': 5432, 'ratio': 1e-05, 'tags': ['a', {'b': None}], 'empty': {},
+               'none': [], 'yes': 'no', 'url': 'a: b # c', 1: True}}
+
+def deep_tree(depth):
+    """Build a tree nested `depth` levels deep without recursion."""
+    root = node = {}
+    for _ in range(depth):
+        node['child'] = {}
+        node = node['child']
+    node['leaf'] = Secure('deep-secret', '***')
+    return root
+
+def test_to_dict_reveals_or_masks_every_level():
+    """Test that nested secured values are revealed or masked at any depth."""
+    ad = AttrDict({'a': {'b': {'c': 'secret'}}, 'd': [1, 2]}, secure=True, message='***')
+    assert to_dict(ad) == {'a': {'b': {'c': '***'}}, 'd': '***'}
+    assert ad.to_dict(reveal=True) == {'a': {'b': {'c': 'secret'}}, 'd': [1, 2]}
+    assert ad._get_original('a') == {'b': {'c': 'secret'}}
+    assert to_dict(ad, message='hidden')['a']['b']['c'] == 'hidden'
+    assert type(to_dict(ad, reveal=True)['a']) is dict
+    assert to_dict(freeze(DATA, secure=True), reveal=True) == DATA
+
+def test_to_dict_does_not_materialize_lazy_nodes():
+    """Test that exporting a lazy AttrDict masks its pending leaves without converting them."""
+    ad = AttrDict({'a': {'b': 'secret'}}, secure=True, lazy=True, message='***')
+    assert to_dict(ad) == {'a': {'b': '***'}}
+    assert to_dict(ad, reveal=True) == {'a': {'b': 'secret'}}
+    assert ad._pending == {'a'}
+
+def test_writers_round_trip():
+    """Test that the JSON and YAML writers produce documents that parse back to the same data."""
+    expected = json.loads(json.dumps(DATA))
+    assert json.loads(''.join(iter_json(DATA))) == expected
+    assert json.loads(''.join(iter_json(DATA, indent=2))) == expected
+    assert ''.join(iter_json(DATA)) == json.dumps(DATA)
+    assert yaml.safe_load(''.join(iter_yaml(DATA))) == DATA
+    stream = io.StringIO()
+    write_yaml({'password': Secure('pw', '***')}, stream)
+    assert yaml.safe_load(stream.getvalue()) == {'password': '***'}
+    stream = io.StringIO()
+    write_json({'password': Secure('pw', '***')}, stream, reveal=True)
+    assert json.loads(stream.getvalue()) == {'password': 'pw'}
+
+def test_export_handles_configs_deeper_than_the_recursion_limit():
+    """Test that exporting and serializing never recurse."""
+    tree = deep_tree(5000)
+    exported = to_dict(tree, reveal=True)
+    for _ in range(5000):
+        exported = exported['child']
+    assert exported == {'leaf': 'deep-secret'}
+    document = ''.join(iter_json(tree))
+    assert document.endswith('{"leaf": "***"' + '}' * 5001)
+    assert sum(1 for _ in iter_yaml(tree)) == 5001
+
+def test_secured_dump_masks_with_instance_message(tmp_path):
+    """Test that Secured exports every config and masks secrets with its message."""
+    (tmp_path / 'config.yaml').write_text('db:\n  password: pw\n  port: 5432\n')
+    secured = Secured(str(tmp_path / 'config.yaml'), secure=True, message='<hidden>')
+    assert secured.to_dict() == {'config': {'db': {'password': '<hidden>', 'port': '<hidden>'}}}
+    assert secured.to_dict(reveal=True) == {'config': {'db': {'password': 'pw', 'port': 5432}}}
+    stream = io.StringIO()
+    secured.dump(stream, format='json')
+    assert json.loads(stream.getvalue()) == secured.to_dict()
@@ -0,0 +1,52 @@
+import pytest
+from secured.attribute import AttrDict
+from secured.encryption import Cipher, EncryptedSecure
+from secured.fingerprint import Fingerprints
+from secured.snapshot import freeze
+
+class FailingCipher(Cipher):
+    def decrypt(self, token):
+        raise AssertionError("fingerprints must not decrypt")
+
+def fingerprints(data, **kwargs):
+    result = Fingerprints(**kwargs)
+    result.set('config', data)
+    return result
+
+def test_digests_depend_on_content_only():
+    """Test that secured, frozen and plain configs with the same content get the same digests."""
+    data = {'db': {'host': 'a.local', 'port': 1}, 'hosts': [{'name': 'a'}]}
+    plain = fingerprints(data)
+    assert plain.get() == fingerprints(AttrDict(data, secure=True)).get()
+    assert plain.get('config.db') == fingerprints(freeze(data, secure=True)).get('config.db')
+    assert plain.get('config.db.port') != fingerprints({'db': {'host': 'a.local', 'port': '1'}}).get('config.db.port')
+    assert plain.get() != fingerprints(data, key=b'secret').get()
+    assert 'a.local' not in plain.get('config.db.host')
+    assert plain.get('config.hosts.0') is None
+
+def test_updates_are_incremental_and_match_a_full_rehash():
+    """Test that set and delete update the ancestors to the digests of a full rehash."""
+    updated = fingerprints({'db': {'host': 'a.local', 'port': 1}, 'cache': {'ttl': 5}})
+    updated.set('config.db.host', 'b.local')
+    updated.set(('config', 'db', 'user'), 'admin')
+    updated.delete('config.cache.ttl')
+    expected = fingerprints({'db': {'host': 'b.local', 'port': 1, 'user': 'admin'}, 'cache': {}})
+    assert updated.get() == expected.get()
+    assert updated.diff(expected) == []
+    with pytest.raises(KeyError):
+        updated.delete('config.missing')
+    with pytest.raises(KeyError):
+        updated.set('config.missing.key', 1)
+
+def test_diff_reports_the_smallest_changed_subtrees():
+    """Test that diff descends only into differing subtrees, like diff_trees."""
+    old = fingerprints({'a': {'b': 1, 'c': 2}, 'x': {'y': [1, 2]}, 'gone': 1})
+    new = fingerprints({'a': {'b': 1, 'c': 3}, 'x': {'y': [1, 3]}, 'd': 4})
+    assert old.diff(new) == [('config', 'a', 'c'), ('config', 'x', 'y'), ('config', 'gone'), ('config', 'd')]
+    assert old.diff(new, 'config.a') == [('config', 'a', 'c')]
+
+def test_encrypted_values_are_hashed_without_decrypting():
+    """Test that encrypted values are fingerprinted by their ciphertext."""
+    value = EncryptedSecure('token', FailingCipher())
+    assert fingerprints({'password': value}).get() != fingerprints({'password': 'token'}).get()
+    assert not value.decrypted
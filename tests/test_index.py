@@ -0,0 +1,44 @@
+from secured.attribute import AttrDict
+from secured.index import PathIndex
+
+def build_index(**kwargs):
+    index = PathIndex()
+    config = AttrDict({'db': {'host': 'localhost', 'port': 5432}, 'name': 'app'}, **kwargs)
+    index.add('config', config)
+    return index, config
+
+def test_lookup_by_dotted_path():
+    """Test that every mapping and leaf is reachable through its dotted path."""
+    index, config = build_index()
+    assert index.get('config.db.host') == 'localhost'
+    assert index.get('config.db') is config.db
+    assert index.get('config.missing', 'default') == 'default'
+    assert 'config.db.port' in index
+
+def test_index_follows_assignment():
+    """Test that assignments and deletions on indexed nodes are reflected in the index."""
+    index, config = build_index()
+    config.db.host = 'remote'
+    assert index.get('config.db.host') == 'remote'
+    config.db = {'user': 'admin'}
+    assert index.get('config.db.user') == 'admin'
+    assert index.get('config.db.host') is None
+    del config['name']
+    assert 'config.name' not in index
+
+def test_detached_nodes_stop_reporting():
+    """Test that nodes removed from the tree no longer update the index."""
+    index, config = build_index()
+    old_db = config.db
+    config.db = {'host': 'new'}
+    old_db.host = 'stale'
+    assert index.get('config.db.host') == 'new'
+
+def test_lazy_nodes_resolved_on_demand():
+    """Test that paths below lazy nodes are resolved on first lookup and cached."""
+    index, config = build_index(lazy=True)
+    assert 'config.db.host' not in index._entries
+    assert index.get('config.db.host') == 'localhost'
+    assert 'config.db.host' in index._entries
+    config.db.host = 'remote'
+    assert index.get('config.db.host') == 'remote'
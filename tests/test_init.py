@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import secured
+
+def imported_modules(statement):
+    probe = f"{statement}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    return subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True).stdout.split()
+
+def test_exports_are_imported_on_first_access():
+    """Test that the package exports resolve lazily to their submodule objects."""
+    from secured.attribute import AttrDict
+    from secured.secure import Secure
+    from secured.secured import Secured
+    assert secured.Secured is Secured
+    assert secured.Secure is Secure
+    assert secured.AttrDict is AttrDict
+    assert secured.shared.SharedConfig.__name__ == 'SharedConfig'
+    assert {'Secured', 'Secure', 'AttrDict'} <= set(dir(secured))
+
+def test_import_defers_heavy_modules():
+    """Test that importing the package or Secure does not import PyYAML, logging or the loader."""
+    for statement in ("import secured", "from secured import Secure"):
+        modules = imported_modules(statement)
+        assert not {'yaml', 'logging', 'secured.secured'} & set(modules)
+    modules = imported_modules("from secured import Secured; Secured()")
+    assert not {'yaml', 'asyncio', 'multiprocessing'} & set(modules)
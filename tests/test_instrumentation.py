@@ -0,0 +1,40 @@
+from secured.attribute import AttrDict
+from secured.instrumentation import LoadStats
+from secured.secured import Secured
+
+def test_attrdict_counts_nodes_leaves_and_secured():
+    """Test that AttrDict reports the nodes, leaves and Secure values it creates."""
+    stats = LoadStats()
+    AttrDict({'a': {'b': 1, 'c': {'d': 'x'}}, 'e': 2}, secure=True, stats=stats)
+    assert (stats.nodes, stats.leaves, stats.secured) == (3, 3, 3)
+    assert stats.accesses == 0
+
+def test_usage_counting():
+    """Test that accesses and compositions are only counted when enabled."""
+    stats = LoadStats(count_usage=True)
+    secured = Secured('examples/config.yaml', stats=stats)
+    _ = secured.config.databases.db3
+    secured.compose("{a}", a="b")
+    assert stats.accesses == 2
+    assert stats.compositions == 1
+
+def test_secured_per_file_stats():
+    """Test that each loaded file gets its own timings and counts, and the callback sees them."""
+    seen = []
+    stats = LoadStats(callback=seen.append)
+    secured = Secured(['examples/config.yaml', 'missing.yaml', 'examples/hyperparameters.yaml'],
+                      secure=True, stats=stats, max_workers=2)
+    assert secured.stats is stats
+    assert [file_stats.path for file_stats in seen] == ['examples/config.yaml', 'examples/hyperparameters.yaml']
+    config_stats = stats.files[0]
+    assert config_stats.bytes_read > 0
+    assert config_stats.read >= 0 and config_stats.parse > 0 and config_stats.convert > 0
+    assert config_stats.secured == config_stats.leaves > 0
+    assert sum(file_stats.nodes for file_stats in stats.files) == stats.nodes
+    assert stats.as_dict()['files'][1]['path'] == 'examples/hyperparameters.yaml'
+
+def test_stats_disabled_by_default():
+    """Test that no statistics are collected unless requested."""
+    secured = Secured('examples/config.yaml')
+    assert secured.stats is None
+    assert secured.config._stats is None
@@ -0,0 +1,50 @@
+import pytest
+from secured.layers import EnvLayer, FileLayer, LayeredConfig, merge_trees
+from secured.secured import Secured
+
+def test_merge_trees_shares_untouched_subtrees():
+    """Test that mappings merge key by key and scalars replace whole subtrees."""
+    base = {'db': {'host': 'a', 'port': 1}, 'cache': {'ttl': 5}}
+    merged = merge_trees(base, {'db': {'host': 'b'}, 'cache': 'off'})
+    assert merged == {'db': {'host': 'b', 'port': 1}, 'cache': 'off'}
+    assert base['db']['host'] == 'a'
+
+def test_layers_follow_declared_precedence(tmp_path):
+    """Test that later layers override earlier ones, environment variables included."""
+    (tmp_path / 'base.yaml').write_text('db:\n  host: a\n  port: 1\nname: base\n')
+    (tmp_path / 'prod.json').write_text('{"db": {"host": "b"}}')
+    environ = {'APP__DB__PORT': '5432', 'OTHER': 'x'}
+    layered = LayeredConfig([str(tmp_path / 'base.yaml'), str(tmp_path / 'prod.json'),
+                             FileLayer(tmp_path / '.env', optional=True), EnvLayer('APP', environ=environ)])
+    assert layered.load() == {'db': {'host': 'b', 'port': '5432'}, 'name': 'base'}
+    with pytest.raises(FileNotFoundError):
+        LayeredConfig([tmp_path / 'missing.yaml']).load()
+
+def test_refresh_merges_only_changed_layers(tmp_path):
+    """Test that a refresh re-reads changed layers and shares every unchanged subtree."""
+    (tmp_path / 'base.yaml').write_text('db:\n  host: a\n  port: 1\ncache:\n  ttl: 5\n')
+    environ = {'APP__DB__HOST': 'b'}
+    layered = LayeredConfig([tmp_path / 'base.yaml', EnvLayer('APP', environ=environ)])
+    before = layered.load()
+    assert layered.refresh() is before
+    environ['APP__DB__HOST'] = 'c'
+    environ['APP__CACHE'] = 'off'
+    assert layered.stale() == [1]
+    after = layered.refresh()
+    assert after == {'db': {'host': 'c', 'port': 1}, 'cache': 'off'}
+    assert before == {'db': {'host': 'b', 'port': 1}, 'cache': {'ttl': 5}}
+    del environ['APP__CACHE']
+    assert layered.refresh()['cache'] == {'ttl': 5}
+
+def test_secured_reloads_layered_config(tmp_path):
+    """Test that Secured exposes, indexes and reloads a layered config."""
+    (tmp_path / 'base.yaml').write_text('db:\n  host: a\n  port: 1\n')
+    environ = {'APP__DB__HOST': 'b'}
+    secured = Secured()
+    secured.load_layers([str(tmp_path / 'base.yaml'), EnvLayer('APP', environ=environ)], name='settings')
+    assert secured.settings.db.host == 'b'
+    db = secured.settings.db
+    environ['APP__DB__HOST'] = 'c'
+    assert secured.reload() == ['settings.db.host']
+    assert db.host == 'c'
+    assert secured.get('settings.db.port') == 1
@@ -0,0 +1,44 @@
+import pytest
+import yaml
+from secured.loader import SafeLoader, nest_keys, parse_dotenv, read_config, read_yaml, safe_load
+
+def test_safe_loader_prefers_libyaml():
+    """Test that the C loader is used whenever PyYAML provides it."""
+    assert SafeLoader is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def test_safe_load_parses_standard_types():
+    """Test that safe_load parses documents into standard Python objects."""
+    assert safe_load("a: 1\nb: [x, y]\n") == {'a': 1, 'b': ['x', 'y']}
+
+def test_safe_load_rejects_python_tags():
+    """Test that safe_load refuses to construct arbitrary Python objects."""
+    with pytest.raises(yaml.YAMLError):
+        safe_load("!!python/object/apply:os.getcwd []")
+
+def test_read_yaml_missing_file(tmp_path):
+    """Test that reading a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        read_yaml(str(tmp_path / 'missing.yaml'))
+
+def test_parse_dotenv_handles_quotes_and_comments():
+    """Test that .env values are unquoted, unescaped and stripped of trailing comments."""
+    content = '# comment\nexport A=1\nB="x\\ny" # note\nC=\'raw \\n\'\nD=a#b\n\nE=\n'
+    assert parse_dotenv(content) == {'A': '1', 'B': 'x\ny', 'C': 'raw \\n', 'D': 'a#b', 'E': ''}
+    with pytest.raises(ValueError):
+        parse_dotenv('not an assignment')
+
+def test_nest_keys_splits_prefixed_names():
+    """Test that prefixed variable names become lowercase nested keys."""
+    items = [('APP__DATABASES__DB3__HOST', 'db.local'), ('APP__DEBUG', '1'), ('OTHER__X', '2')]
+    assert nest_keys(items, prefix='APP') == {'databases': {'db3': {'host': 'db.local'}}, 'debug': '1'}
+
+def test_read_config_dispatches_on_file_name(tmp_path):
+    """Test that JSON, TOML, .env and YAML files are parsed according to their names."""
+    (tmp_path / 'a.json').write_text('{"db": {"port": 1}}')
+    (tmp_path / 'a.toml').write_text('[db]\nport = 2\n')
+    (tmp_path / '.env').write_text('DB__PORT=3\n')
+    (tmp_path / 'a.yml').write_text('db:\n  port: 4\n')
+    assert read_config(str(tmp_path / 'a.json')) == {'db': {'port': 1}}
+    assert read_config(str(tmp_path / 'a.toml')) == {'db': {'port': 2}}
+    assert read_config(str(tmp_path / '.env')) == {'db': {'port': '3'}}
+    assert read_config(str(tmp_path / 'a.yml')) == {'db': {'port': 4}}
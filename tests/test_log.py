@@ -1,7 +1,9 @@
 import logging
+import threading
+import time
 from io import StringIO
 import pytest
-from secured.log_manager import setup_default_logger
+from secured.log_manager import DEFAULT_FORMAT, BoundedQueueHandler, setup_default_logger, setup_queue_logger
 
 def test_setup_default_logger():
     """Test that the logger is set up correctly with a single handler and the right format."""
@@ -36,3 +38,82 @@ def clean_up_logger():
     logger = logging.getLogger(__name__)
     logger.handlers.clear()
     logger.setLevel(logging.NOTSET)
+
+class BlockingHandler(logging.Handler):
+    """A handler recording messages and their threads, optionally blocked until released."""
+
+    def __init__(self, release=None):
+        super().__init__()
+        self.release = release
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.release is not None:
+            self.release.wait(5)
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.current_thread().name)
+
+def test_queue_handler_writes_from_listener_and_flushes_on_close():
+    """Test that records are written by the listener thread and all of them are written on close."""
+    target = BlockingHandler()
+    handler = BoundedQueueHandler([target], capacity=100)
+    logger = logging.getLogger('test_queue_flush')
+    logger.addHandler(handler)
+    for index in range(50):
+        logger.warning("record %d", index)
+    handler.close()
+    logger.removeHandler(handler)
+    assert target.messages == [f"record {index}" for index in range(50)]
+    assert threading.current_thread().name not in target.threads
+    handler.close()
+
+def test_queue_handler_drops_instead_of_blocking():
+    """Test that a full queue drops records without blocking and reports the drops."""
+    release = threading.Event()
+    target = BlockingHandler(release)
+    handler = BoundedQueueHandler([target], capacity=2)
+    logger = logging.getLogger('test_queue_drop')
+    logger.addHandler(handler)
+    start = time.perf_counter()
+    for index in range(20):
+        logger.warning("record %d", index)
+    assert time.perf_counter() - start < 1
+    assert handler.dropped >= 17
+    release.set()
+    time.sleep(0.1)
+    logger.warning("after")
+    handler.close()
+    logger.removeHandler(handler)
+    assert target.messages[0] == "record 0"
+    assert "log record(s) dropped because the log queue was full" in target.messages[-2]
+    assert target.messages[-1] == "after"
+
+def test_queue_handler_drop_oldest_keeps_recent_records():
+    """Test that the drop_oldest policy evicts queued records in favor of new ones."""
+    release = threading.Event()
+    target = BlockingHandler(release)
+    handler = BoundedQueueHandler([target], capacity=3, overflow='drop_oldest')
+    logger = logging.getLogger('test_queue_oldest')
+    logger.addHandler(handler)
+    for index in range(20):
+        logger.warning("record %d", index)
+    release.set()
+    handler.close()
+    logger.removeHandler(handler)
+    assert target.messages[-3:] == ["record 17", "record 18", "record 19"]
+    with pytest.raises(ValueError):
+        BoundedQueueHandler([target], overflow='block')
+
+def test_setup_queue_logger():
+    """Test that the queue logger is set up once, with a single queue handler and no propagation."""
+    logger = setup_queue_logger()
+    try:
+        assert setup_queue_logger() is logger
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], BoundedQueueHandler)
+        assert not logger.propagate
+        assert logger.handlers[0].listener.handlers[0].formatter._fmt == DEFAULT_FORMAT
+    finally:
+        logger.handlers[0].close()
+        logger.handlers.clear()
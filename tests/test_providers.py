@@ -0,0 +1,87 @@
+import threading
+import time
+import pytest
+from secured.loader import safe_load
+from secured.providers import (FileProvider, MappingProvider, SecretError, SecretProvider, SecretReference,
+                               SecretResolver)
+from secured.secure import Secure
+from secured.secured import Secured
+
+class CountingProvider(SecretProvider):
+    """A provider recording the batches it is asked for."""
+
+    batch_size = 2
+
+    def __init__(self, secrets):
+        self.secrets = dict(secrets)
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def fetch_many(self, keys):
+        with self.lock:
+            self.batches.append(sorted(keys))
+        return {key: self.secrets[key] for key in keys if key in self.secrets}
+
+def test_secret_tag_is_parsed_into_references():
+    """Test that `!secret` values load as references to the named or default provider."""
+    data = safe_load("a: !secret vault:db/password\nb: !secret db/user\n")
+    assert data == {'a': SecretReference('vault', 'db/password'), 'b': SecretReference('default', 'db/user')}
+
+def test_resolve_tree_batches_and_secures():
+    """Test that references are fetched in batches and replaced by Secure values, sharing untouched subtrees."""
+    provider = CountingProvider({'a': 'A', 'b': 'B', 'c': 3})
+    resolver = SecretResolver({'default': provider})
+    data = {'x': {'a': SecretReference('default', 'a'), 'b': '${default:b}', 'c': '${default:c}'},
+            'url': 'user:${default:a}@host', 'plain': {'k': 1}}
+    resolved = resolver.resolve_tree(data)
+    assert isinstance(resolved['x']['a'], Secure) and resolved['x']['a'] == 'A'
+    assert resolved['x']['c']._get_original() == 3
+    assert resolved['url']._get_original() == 'user:A@host'
+    assert resolved['plain'] is data['plain']
+    assert data['x']['b'] == '${default:b}'
+    assert sorted(provider.batches) == [['a', 'b'], ['c']]
+    resolver.resolve_tree(data)
+    assert len(provider.batches) == 2
+    resolver.close()
+
+def test_resolve_reports_missing_secrets_and_providers():
+    """Test that unknown providers and missing keys raise SecretError."""
+    resolver = SecretResolver({'default': MappingProvider({'a': 1})})
+    with pytest.raises(SecretError, match='missing'):
+        resolver.resolve([SecretReference('default', 'missing')])
+    with pytest.raises(SecretError, match='vault'):
+        resolver.resolve([SecretReference('vault', 'a')])
+
+def test_expired_and_stale_entries_are_refreshed():
+    """Test that expired values are fetched again and ageing values are refreshed in the background."""
+    provider = CountingProvider({'a': 'old'})
+    resolver = SecretResolver({'default': provider}, ttl=0.2, refresh_after=0.25)
+    reference = SecretReference('default', 'a')
+    assert resolver.resolve([reference])[reference] == 'old'
+    provider.secrets['a'] = 'new'
+    time.sleep(0.1)
+    assert resolver.resolve([reference])[reference] == 'old'
+    resolver.close()
+    assert resolver.resolve([reference])[reference] == 'new'
+    provider.secrets['a'] = 'newer'
+    time.sleep(0.25)
+    assert resolver.resolve([reference])[reference] == 'newer'
+
+def test_file_provider_reads_secret_files(tmp_path):
+    """Test that the file provider reads one file per key and refuses keys outside its directory."""
+    (tmp_path / 'db').mkdir()
+    (tmp_path / 'db' / 'password').write_text('pw\n')
+    (tmp_path / 'outside').write_text('no')
+    provider = FileProvider(tmp_path / 'db')
+    assert provider.fetch_many(['password', '../outside', 'missing']) == {'password': 'pw'}
+
+def test_secured_resolves_references_when_loading(tmp_path):
+    """Test that Secured resolves references into Secure leaves and logs unresolvable files."""
+    (tmp_path / 'config.yaml').write_text('db:\n  password: !secret db/password\n  host: db.local\n')
+    (tmp_path / 'broken.yaml').write_text('token: ${vault:token}\n')
+    secured = Secured([str(tmp_path / 'config.yaml'), str(tmp_path / 'broken.yaml')],
+                      secret_providers={'default': MappingProvider({'db/password': 'pw'})})
+    assert str(secured.config.db.password) == '<Sensitive data secured>'
+    assert secured.config.db.password._get_original() == 'pw'
+    assert secured.config.db.host == 'db.local'
+    assert not hasattr(secured, 'broken')
@@ -0,0 +1,64 @@
+import logging
+from io import StringIO
+from secured.redaction import RedactingFilter, RedactingFormatter, SecretRedactor, iter_plaintexts
+
+def test_redact_many_secrets():
+    """Test that every occurrence of every secret is replaced."""
+    redactor = SecretRedactor([f"secret-{index:04d}" for index in range(2000)], message="<Hidden>")
+    text = "a secret-0042 b secret-1999 c secret-2000"
+    assert redactor.redact(text) == "a <Hidden> b <Hidden> c secret-2000"
+
+def test_overlapping_and_nested_secrets():
+    """Test that overlapping, adjacent and nested occurrences are masked as one span."""
+    redactor = SecretRedactor(["abcd", "cdef", "bc", "xyz1"], message="*")
+    assert redactor.redact("0abcdef1") == "0*1"
+    assert redactor.redact("abcdxyz1!") == "*!"
+    assert redactor.redact("-bc-") == "-*-"
+
+def test_text_without_secrets_is_returned_unchanged():
+    """Test that texts without secrets are returned as the same object."""
+    redactor = SecretRedactor(["password123"])
+    text = "nothing to hide"
+    assert redactor.redact(text) is text
+
+def test_incremental_updates_with_reference_counts():
+    """Test that secrets stay redacted until every occurrence has been removed."""
+    redactor = SecretRedactor(["token-1", "token-1"], message="*")
+    redactor.remove("token-1")
+    assert redactor.redact("token-1") == "*"
+    redactor.update(added=["token-2"], removed=["token-1"])
+    assert redactor.redact("token-1 token-2") == "token-1 *"
+    assert "token-2" in redactor and len(redactor) == 1
+
+def test_iter_plaintexts_skips_short_values():
+    """Test that short scalars, booleans and None are not collected."""
+    data = {'a': 'password123', 'b': [12345, {'c': 'ok'}], 'd': True, 'e': None}
+    assert sorted(iter_plaintexts(data)) == ['12345', 'password123']
+
+def make_logger(name, handler):
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.propagate = False
+    return logger
+
+def test_redacting_filter():
+    """Test that the filter redacts formatted messages and tracebacks."""
+    stream = StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.addFilter(RedactingFilter(SecretRedactor(["password123"], message="<Hidden>")))
+    logger = make_logger('tests.redaction.filter', handler)
+    logger.warning("connecting with %s", "password123")
+    try:
+        raise ValueError("bad password123")
+    except ValueError:
+        logger.exception("failed")
+    assert "password123" not in stream.getvalue()
+    assert "connecting with <Hidden>" in stream.getvalue()
+
+def test_redacting_formatter():
+    """Test that the formatter redacts the complete formatted output."""
+    stream = StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(RedactingFormatter(SecretRedactor(["password123"], message="<Hidden>"), '%(message)s'))
+    make_logger('tests.redaction.formatter', handler).error("url=mysql://guest:password123@db")
+    assert stream.getvalue() == "url=mysql://guest:<Hidden>@db\n"
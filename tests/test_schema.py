@@ -0,0 +1,39 @@
+from datetime import timedelta
+import pytest
+from secured.schema import Schema, SchemaError, coerce
+
+def test_coerce_supported_types():
+    """Test the built-in conversions."""
+    assert coerce('8080', int) == 8080
+    assert coerce('0.5', float) == 0.5
+    assert coerce('Yes', bool) is True
+    assert coerce('off', bool) is False
+    assert coerce('1h30m', timedelta) == timedelta(hours=1, minutes=30)
+    assert coerce('250ms', timedelta) == timedelta(milliseconds=250)
+    assert coerce(45, timedelta) == timedelta(seconds=45)
+    assert coerce('a, b,c', list) == ['a', 'b', 'c']
+    assert coerce('1,2', [int]) == [1, 2]
+    assert coerce('value', str.upper) == 'VALUE'
+
+@pytest.mark.parametrize('value, kind', [(True, int), (1.5, int), ('abc', float), ('maybe', bool),
+                                         ('5 parsecs', timedelta), (3, list)])
+def test_coerce_rejects_invalid_values(value, kind):
+    """Test that values which do not fit the declared type are rejected."""
+    with pytest.raises((TypeError, ValueError)):
+        coerce(value, kind)
+
+def test_apply_with_wildcards_copies_data():
+    """Test that wildcard paths are coerced and the input is left untouched."""
+    data = {'databases': {'db3': {'port': '5432'}, 'db4': {'port': '5433'}}, 'name': 'app'}
+    schema = Schema({'config.databases.*.port': int, 'config.missing.path': int, 'other.port': int})
+    result = schema.apply(data, 'config')
+    assert result == {'databases': {'db3': {'port': 5432}, 'db4': {'port': 5433}}, 'name': 'app'}
+    assert data['databases']['db3']['port'] == '5432'
+
+def test_apply_reports_every_error():
+    """Test that all coercion failures are reported together."""
+    schema = Schema({'config.port': int, 'config.debug': bool, 'config.timeout': timedelta})
+    with pytest.raises(SchemaError) as error:
+        schema.apply({'port': 'http', 'debug': 'maybe', 'timeout': '30s'}, 'config')
+    assert [path for path, _ in error.value.errors] == ['config.port', 'config.debug']
+    assert isinstance(error.value, ValueError)
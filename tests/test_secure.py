@@ -1,4 +1,6 @@
-from secured.secure import Secure
+import datetime
+import pickle
+from secured.secure import CompactSecure, Secure, compact_secure
 
 def test_secure_initialization():
     """Test the initialization and representation of Secure objects."""
@@ -39,3 +41,42 @@ def test_key_success():
     secure = Secure("12345")
     assert secure == "12345"
     assert secure._original == "12345"
+
+
+def test_compact_secure_has_no_instance_dict():
+    """Test that compact values carry no per-instance dict and share their class per message."""
+    first = compact_secure("sensitive_data", "<Hidden>")
+    second = compact_secure("other_data", "<Hidden>")
+    assert isinstance(first, CompactSecure)
+    assert isinstance(first, Secure)
+    assert not hasattr(first, '__dict__')
+    assert type(first) is type(second)
+    assert str(first) == repr(first) == "<Hidden>"
+
+
+def test_compact_secure_behaves_like_secure():
+    """Test that equality, conversions and originals match the regular representation."""
+    for original in ["12345", 5432, 0.25, True, None]:
+        regular, compact = Secure(original), compact_secure(original)
+        assert compact == regular
+        assert compact._get_original() == original
+        assert type(compact._get_original()) is type(original)
+        assert compact._message == regular._message
+    assert compact_secure("12").to_int() == 12
+    assert compact_secure("1.5").to_float() == 1.5
+    assert compact_secure("sensitive_data").to_int() == "<Sensitive data secured>"
+
+
+def test_compact_secure_falls_back_for_other_types():
+    """Test that values which cannot be rebuilt from their text use a regular Secure."""
+    original = datetime.date(2024, 1, 1)
+    value = compact_secure(original)
+    assert not isinstance(value, CompactSecure)
+    assert value._get_original() is original
+
+
+def test_compact_secure_pickles():
+    """Test that compact values survive pickling."""
+    value = pickle.loads(pickle.dumps(compact_secure(42, "<Hidden>")))
+    assert value._get_original() == 42
+    assert str(value) == "<Hidden>"
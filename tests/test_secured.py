@@ -1,7 +1,14 @@
+import asyncio
+import logging
 import pytest
 from secured.secured import Secured, Secure
-from secured.attribute import AttrDict
+from collections.abc import Mapping
+from secured.attribute import AttrDict, PlainView
 from io import StringIO
+from datetime import timedelta
+from secured.schema import SchemaError
+from secured.snapshot import FrozenAttrDict
+from secured.log_manager import BoundedQueueHandler
 
 class TestSecured:
     @pytest.fixture
@@ -83,7 +90,250 @@ class TestSecured:
         secured = Secured()
         data = {'key': 'value'}
         secured.test_data = AttrDict(data)
+        tree = secured.test_data
         secured.use_attrdict(False)
-        assert isinstance(secured.test_data, dict)
+        assert isinstance(secured.test_data, Mapping)
+        assert not isinstance(secured.test_data, AttrDict)
+        assert secured.test_data == data
         secured.use_attrdict(True)
         assert isinstance(secured.test_data, AttrDict)
+        assert secured.test_data is tree
+
+    def test_use_attrdict_views_share_tree(self, setup_secured):
+        secured, secured_host, _ = setup_secured
+        tree = secured.config
+        secured.use_attrdict(False)
+        view = secured.config
+        assert isinstance(view, PlainView) and view.tree is tree
+        assert isinstance(view['databases']['db3'], PlainView)
+        assert view['databases']['db3']['connection']['host'] == secured_host
+        assert str(view['databases']['db3']['connection']['host']) == secured.message
+        with pytest.raises(AttributeError):
+            view.databases
+        view['databases']['db3']['connection']['host'] = 'other.local'
+        secured.use_attrdict(True)
+        assert secured.config is tree
+        assert secured.config.databases.db3.connection.host == 'other.local'
+        assert str(secured.config.databases.db3.connection.host) == secured.message
+
+    def test_use_attrdict_converts_plain_dict_once(self):
+        secured = Secured(secure=True, message="<Hidden>")
+        secured.test_data = {'nested': {'key': 'value'}}
+        secured.use_attrdict(True)
+        assert str(secured.test_data.nested.key) == "<Hidden>"
+
+    def test_load_yaml_parallel_preserves_order(self, tmp_path, caplog):
+        paths = []
+        for index in range(6):
+            path = tmp_path / f"part-{index}.yaml"
+            path.write_text(f"index: {index}\n")
+            paths.append(str(path))
+        paths.insert(2, str(tmp_path / 'missing.yaml'))
+        (tmp_path / 'broken.yaml').write_text("invalid: yaml: - content")
+        paths.append(str(tmp_path / 'broken.yaml'))
+
+        secured = Secured(paths, max_workers=4)
+        assert list(vars(secured))[-6:] == [f"part_{index}" for index in range(6)]
+        assert secured.part_5.index == 5
+        errors = [record.getMessage() for record in caplog.records if record.levelname == 'ERROR']
+        assert 'missing.yaml not found' in errors[0]
+        assert 'Error parsing YAML file' in errors[1]
+
+    def test_load_yaml_process_pool(self):
+        secured = Secured(['examples/config.yaml', 'examples/hyperparameters.yaml'],
+                          max_workers=2, process_pool=True)
+        assert secured.config == Secured('examples/config.yaml').config
+        assert secured.hyperparameters.optimizer.type == 'adam'
+
+    def test_reload_updates_in_place(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("db:\n  host: a.local\n  port: 1\ncache:\n  ttl: 5\n")
+        secured = Secured(str(path), secure=True)
+        config, cache = secured.service, secured.service.cache
+        notified = []
+        secured.on_change(notified.append)
+
+        path.write_text("db:\n  host: b.local\n  port: 1\ncache:\n  ttl: 5\nextra: 1\n")
+        changed = secured.reload(force=True)
+
+        assert changed == ['service.db.host', 'service.extra']
+        assert notified == [changed]
+        assert secured.service is config
+        assert secured.service.cache is cache
+        assert isinstance(config.db.host, Secure)
+        assert config.db.host == 'b.local'
+        assert config.extra == '1'
+
+    def test_reload_skips_unchanged_and_broken_files(self, tmp_path, caplog):
+        path = tmp_path / 'service.yaml'
+        path.write_text("key: value\n")
+        secured = Secured(str(path))
+        assert secured.reload() == []
+        path.write_text("invalid: yaml: - content")
+        assert secured.reload(force=True) == []
+        assert secured.service.key == 'value'
+        assert 'Error parsing YAML file' in caplog.text
+
+    def test_reload_plain_dict_mode(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("token: old\n")
+        secured = Secured(str(path), secure=True, as_attrdict=False)
+        path.write_text("token: new\n")
+        assert secured.reload(force=True) == ['service.token']
+        assert isinstance(secured.service['token'], Secure)
+        assert secured.service['token'] == 'new'
+
+    def test_get_dotted_path(self, setup_secured):
+        secured, secured_host, _ = setup_secured
+        assert secured.get("config.databases.db3.connection.host") == secured_host
+        secured.config.databases.db3.connection.host = 'other.local'
+        assert secured.get("config.databases.db3.connection.host") == 'other.local'
+        assert secured.get("config.databases.db9", required=False) is None
+
+    def test_get_environment_precedence(self, setup_secured, monkeypatch):
+        secured, _, _ = setup_secured
+        monkeypatch.setenv("config.name", "from_env")
+        assert secured.get("config.name") == "from_env"
+
+    def test_compile_composition(self, setup_secured):
+        secured, secured_host, secured_password = setup_secured
+        composition = secured.compile("{host}:{password}", memoize=True)
+        first = composition.render(host=secured_host, password=secured_password)
+        assert first == "db-server.local:password123"
+        assert str(first) == secured.message
+        assert composition.render(host=secured_host, password=secured_password) is first
+
+    def test_schema_coerces_secured_leaves(self):
+        secured = Secured('examples/config.yaml', secure=True,
+                          schema={'config.databases.*.options.timeout': timedelta,
+                                  'config.configuration.version': str})
+        timeout = secured.config.databases.db3.options.timeout
+        assert isinstance(timeout, Secure)
+        assert timeout._get_original() == timedelta(seconds=25)
+        assert secured.config.databases.db4.connection.port.to_int() == 5433
+
+    def test_schema_errors_raised_at_load(self, tmp_path):
+        first, second = tmp_path / 'first.yaml', tmp_path / 'second.yaml'
+        first.write_text("port: http\n")
+        second.write_text("port: https\n")
+        with pytest.raises(SchemaError) as error:
+            Secured([str(first), str(second)], schema={'*.port': int})
+        assert [path for path, _ in error.value.errors] == ['first.port', 'second.port']
+
+    def test_aload_matches_sync_load(self, caplog):
+        paths = ['examples/config.yaml', 'missing.yaml', 'examples/hyperparameters.yaml']
+        secured = asyncio.run(Secured.aload(paths, secure=True, message="<Hidden>"))
+        expected = Secured(paths, secure=True, message="<Hidden>")
+        assert secured.config == expected.config
+        assert isinstance(secured.config, AttrDict)
+        assert isinstance(secured.config.databases.db3.connection.host, Secure)
+        assert str(secured.hyperparameters.optimizer.type) == "<Hidden>"
+        assert 'missing.yaml not found' in caplog.text
+
+    def test_areload(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("key: old\n")
+
+        async def scenario():
+            secured = await Secured.aload(str(path))
+            path.write_text("key: new\n")
+            return secured, await secured.areload(force=True)
+
+        secured, changed = asyncio.run(scenario())
+        assert changed == ['service.key']
+        assert secured.service.key == 'new'
+
+    def test_redact_logs_follows_reloads(self, tmp_path):
+        path = tmp_path / 'secrets.yaml'
+        path.write_text("db:\n  password: first-password\n  host: db.local\n")
+        secured = Secured(str(path), secure=True, message="<Hidden>")
+        stream = StringIO()
+        logger = logging.getLogger('tests.secured.redaction')
+        logger.handlers = [logging.StreamHandler(stream)]
+        logger.propagate = False
+        secured.redact_logs(logger)
+
+        logger.error(f"using {secured.compose('{p}', p=secured.secrets.db.password)._get_original()}")
+        path.write_text("db:\n  password: second-password\n  host: db.local\n")
+        secured.reload(force=True)
+        logger.error("old first-password, new second-password, host db.local")
+        assert stream.getvalue() == "using <Hidden>\nold first-password, new <Hidden>, host <Hidden>\n"
+
+    def test_frozen_mode_publishes_new_snapshots(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("db:\n  host: a.local\ncache:\n  ttl: 5\n")
+        secured = Secured(str(path), secure=True, frozen=True)
+        before = secured.snapshot()
+        assert isinstance(secured.service, FrozenAttrDict)
+        assert before.service is secured.service
+
+        path.write_text("db:\n  host: b.local\ncache:\n  ttl: 5\n")
+        assert secured.reload(force=True) == ['service.db.host']
+        after = secured.snapshot()
+        assert before.service.db.host == 'a.local'
+        assert after.service.db.host == 'b.local'
+        assert after.service.cache is before.service.cache
+        assert secured.get('service.db.host') == 'b.local'
+        assert isinstance(secured.get('service.db.host'), Secure)
+
+    def test_snapshot_copies_mutable_configs(self, setup_secured):
+        secured, secured_host, _ = setup_secured
+        snapshot = secured.snapshot()
+        secured.config.databases.db3.connection.host = 'other.local'
+        assert snapshot.config.databases.db3.connection.host == secured_host
+
+    def test_fingerprints_follow_assignments_and_reloads(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("db:\n  host: a.local\n  port: 1\ncache:\n  ttl: 5\n")
+        secured = Secured(str(path), secure=True, fingerprints=True)
+        other = Secured(str(path), fingerprints=True)
+        assert secured.fingerprint() == other.fingerprint()
+        before = secured.fingerprint('service.cache')
+
+        secured.service.db.host = 'b.local'
+        assert secured.diff_fingerprints(other) == ['service.db.host']
+        del secured.service.db['port']
+        assert secured.diff_fingerprints(other) == ['service.db.host', 'service.db.port']
+
+        path.write_text("db:\n  host: b.local\ncache:\n  ttl: 5\n")
+        other.reload(force=True)
+        assert secured.diff_fingerprints(other) == []
+        assert secured.fingerprint() == other.fingerprint()
+        assert other.fingerprint('service.cache') == before
+        assert other.fingerprint('service.missing') is None
+        with pytest.raises(ValueError):
+            Secured(str(path)).fingerprint()
+
+    def test_fingerprints_in_frozen_mode(self, tmp_path):
+        path = tmp_path / 'service.yaml'
+        path.write_text("db:\n  host: a.local\n")
+        secured = Secured(str(path), frozen=True, fingerprints=True)
+        path.write_text("db:\n  host: b.local\n")
+        secured.reload(force=True)
+        expected = Secured(str(path), fingerprints=True)
+        assert secured.fingerprint() == expected.fingerprint()
+
+    def test_default_logger_is_created_on_first_use(self, tmp_path):
+        secured = Secured()
+        assert secured._logger is None
+        assert secured.logger is logging.getLogger('secured.log_manager')
+        custom = logging.getLogger('custom')
+        secured.logger = custom
+        assert secured.logger is custom
+
+    def test_queue_logging_redacts_before_queueing(self, tmp_path):
+        path = tmp_path / 'secrets.yaml'
+        path.write_text("db:\n  password: first-password\n")
+        secured = Secured(str(path), secure=True, message="<Hidden>", queue_logging=True)
+        handler = secured.logger.handlers[0]
+        stream = StringIO()
+        handler.listener.handlers = (logging.StreamHandler(stream),)
+        try:
+            assert isinstance(handler, BoundedQueueHandler)
+            secured.redact_logs()
+            secured.logger.error("password first-password")
+            secured.load_yaml(str(tmp_path / 'missing.yaml'), secure=True)
+        finally:
+            handler.close()
+            secured.logger.handlers.clear()
+        assert stream.getvalue() == f"password <Hidden>\nFile {tmp_path / 'missing.yaml'} not found.\n"
@@ -0,0 +1,67 @@
+import datetime
+import os
+import pytest
+from secured.secure import Secure
+from secured.secured import Secured
+from secured.shared import SharedConfig, SharedNode, encode
+
+DATA = {'db': {'host': 'db.local', 'port': 5432, 'ratio': 0.5, 'debug': False, 'tags': ['a', 'b'],
+               'empty': None, 'since': datetime.date(2024, 1, 1), 1: 'one'}}
+
+def test_round_trip_decodes_lazily():
+    """Test that values survive encoding and nodes are decoded only when read."""
+    shared = SharedConfig(memoryview(encode({'config': DATA})))
+    config = shared.configs()['config']
+    assert isinstance(config, SharedNode)
+    assert config._offsets is None
+    assert config.db.host == 'db.local'
+    assert dict(config.db) == DATA['db']
+    assert config['db'] is config['db']
+    with pytest.raises(AttributeError):
+        config.db = 'other'
+    with pytest.raises(AttributeError):
+        config.missing
+
+def test_secured_configs_stay_secured():
+    """Test that leaves of secured configs are masked with the shared message."""
+    shared = SharedConfig(memoryview(encode({'config': DATA, 'public': {'a': 1}}, secure=['config'], message='***')))
+    configs = shared.configs()
+    assert isinstance(configs['config'].db.host, Secure)
+    assert str(configs['config'].db.host) == '***'
+    assert configs['config'].db.host == 'db.local'
+    assert configs['public'].a == 1
+
+def test_encode_rejects_corrupt_buffers():
+    """Test that buffers without the shared config header are refused."""
+    with pytest.raises(ValueError):
+        SharedConfig(memoryview(b'\0' * 16))
+
+def test_file_round_trip(tmp_path):
+    """Test that shared configs can be written to and memory-mapped from a file."""
+    SharedConfig(encode({'config': DATA})).write(tmp_path / 'config.bin')
+    shared = SharedConfig.open(tmp_path / 'config.bin')
+    assert shared.configs()['config'].db.port == 5432
+    assert shared.name is None
+    shared.close()
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires fork")
+def test_forked_worker_reads_shared_config(tmp_path):
+    """Test that a forked worker reads the parent's shared configs through Secured."""
+    (tmp_path / 'config.yaml').write_text('db:\n  host: db.local\n  port: 5432\n')
+    shared = Secured(str(tmp_path / 'config.yaml'), secure=True, message='***').share()
+    try:
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            worker = Secured.from_shared(shared)
+            host = worker.config.db.host
+            os.write(write, f"{host}|{host._get_original()}|{worker.get('config.db.port')}".encode())
+            os._exit(0)
+        os.close(write)
+        os.waitpid(pid, 0)
+        assert os.read(read, 1024).decode() == '***|db.local|***'
+        attached = Secured.from_shared(shared.name)
+        assert attached.config.db.port._get_original() == 5432
+        attached._shared.close()
+    finally:
+        shared.unlink()
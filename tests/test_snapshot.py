@@ -0,0 +1,36 @@
+import pytest
+from secured.secure import Secure
+from secured.snapshot import FrozenAttrDict, freeze, thaw
+
+def test_freeze_is_read_only_and_hashable():
+    """Test that frozen nodes cannot be modified and can be hashed."""
+    config = freeze({'db': {'host': 'a.local', 'ports': [1, 2]}})
+    assert config.db.host == 'a.local'
+    assert config['db']['ports'] == (1, 2)
+    with pytest.raises(AttributeError):
+        config.db = 'other'
+    with pytest.raises(TypeError):
+        config['db'] = 'other'
+    assert hash(config) == hash(freeze({'db': {'host': 'a.local', 'ports': [1, 2]}}))
+    assert {config: 1}[freeze(thaw(config))] == 1
+
+def test_set_copies_only_the_changed_path():
+    """Test that updates share unchanged subtrees and leave the old snapshot intact."""
+    config = freeze({'db': {'host': 'a.local', 'port': 1}, 'cache': {'ttl': 5}})
+    updated = config.set('db.host', 'b.local')
+    assert config.db.host == 'a.local'
+    assert updated.db.host == 'b.local'
+    assert updated.cache is config.cache
+    assert updated.set(('new', 'key'), 1).new.key == 1
+    removed = updated.delete('db.port')
+    assert 'port' not in removed.db and updated.db.port == 1
+    with pytest.raises(KeyError):
+        config.delete('db.missing')
+
+def test_freeze_secures_leaves():
+    """Test that frozen configs secure leaves like AttrDict does."""
+    config = freeze({'password': 'my_secret', 'items': ['a']}, secure=True, message="<Hidden>")
+    assert isinstance(config.password, Secure)
+    assert str(config.password) == "<Hidden>"
+    assert isinstance(config['items'], Secure)
+    assert isinstance(freeze({}), FrozenAttrDict)
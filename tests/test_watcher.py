@@ -0,0 +1,33 @@
+import os
+import threading
+import pytest
+from secured.watcher import ConfigWatcher, diff_trees
+
+def test_diff_trees_reports_smallest_changed_paths():
+    """Test that diff_trees reports changed leaves and added or removed keys."""
+    old = {'a': {'b': 1, 'c': 2}, 'gone': True, 'items': [1, 2]}
+    new = {'a': {'b': 1, 'c': 3}, 'items': [1, 2], 'added': {'x': 1}}
+    assert diff_trees(old, new) == [('a', 'c'), ('gone',), ('added',)]
+
+def test_diff_trees_identical():
+    """Test that identical trees have no differences."""
+    assert diff_trees({'a': [1, {'b': 2}]}, {'a': [1, {'b': 2}]}) == []
+
+def test_diff_trees_type_change():
+    """Test that values that compare equal but differ in type are reported."""
+    assert diff_trees({'a': 1}, {'a': True}) == [('a',)]
+
+@pytest.mark.parametrize('use_inotify', [True, False])
+def test_watcher_detects_change(tmp_path, use_inotify):
+    """Test that the watcher calls back after a watched file is rewritten."""
+    path = tmp_path / 'config.yaml'
+    path.write_text('key: value\n')
+    changed = threading.Event()
+    watcher = ConfigWatcher([str(path)], changed.set, interval=0.05, use_inotify=use_inotify).start()
+    try:
+        path.write_text('key: other_value\n')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert changed.wait(5)
+    finally:
+        watcher.stop()